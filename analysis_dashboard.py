@@ -1,8 +1,10 @@
 import dash
-from dash import dcc, html, dash_table, Input, Output, State, callback_context
+from dash import dcc, html, dash_table, Input, Output, State, callback_context, no_update
 import dash_bootstrap_components as dbc
-import plotly.express as px
+import flask
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.utils import PlotlyJSONEncoder
 from plotly.subplots import make_subplots
 import pandas as pd
 import mysql.connector
@@ -10,16 +12,213 @@ from mysql.connector import Error
 import os
 from dotenv import load_dotenv
 from datetime import datetime
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import cProfile
+import functools
+import hashlib
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
 import numpy as np
 
+from database.schema_catalog import get_catalog
+from database.summary_tables import SUMMARY_DIMENSIONS, SUMMARY_MEASURES, SUMMARY_TABLE
+
 load_dotenv()
 
+MASTER_TABLE = os.getenv("DB_TABLE", "tax_summit_master_data")
+ANALYSIS_TABLES = ['Tax_Persons_Analysis', 'CFO_Persons_Analysis', 'Other_Persons_Analysis']
+
+# Data source -> logical table name
+SOURCE_TABLES = {
+    'master': MASTER_TABLE,
+    'tax': 'Tax_Persons_Analysis',
+    'cfo': 'CFO_Persons_Analysis',
+    'other': 'Other_Persons_Analysis',
+}
+
+# Columns every load needs: filter panel + name standardization on master,
+# filter_analysis_table() on the analysis tables
+BASE_COLUMNS = {
+    'master': ['Client_Name', 'Practice_Head', 'Partner', 'Sector', 'Location', 'Response'],
+    'tax': ['Practice_Head', 'Partner'],
+    'cfo': ['Practice_Head', 'Partner'],
+    'other': ['Practice_Head', 'Partner'],
+}
+
+# Cube: master rows pre-aggregated once per data version at the finest
+# grain of these dimensions. Tabs that list the 'cube' source roll its cells
+# up instead of grouping the raw rows
+CUBE_DIMENSIONS = ['Practice_Head', 'Partner', 'Sector', 'Location', 'Region', 'Response']
+CUBE_MEASURES = ['rows', 'clients', 'invitees', 'registrations', 'responses',
+                 'weighted_responses', 'circle_backs']
+
+# Master columns the cube is built from (Region is derived at load time)
+CUBE_COLUMNS = ['Practice_Head', 'Partner', 'Sector', 'Location', 'Response', 'Client_Name',
+                'numInvitees', 'numRegistrations', 'Circle_Back_Dt']
+
+# Columns each create_*_tab reads, per data source. Keep in sync with the
+# tab builders - the loaders SELECT only the union of these + BASE_COLUMNS.
+# The sources are also the tab's inputs: render_content() materializes only
+# these frames and passes them to the builder in this order
+TAB_REQUIREMENTS = {
+    'overview': {
+        'cube': CUBE_COLUMNS,
+    },
+    'practice-head': {
+        'cube': CUBE_COLUMNS,
+        'tax': ['Practice_Head', 'Response'],
+        'cfo': ['Practice_Head', 'Response'],
+        'other': ['Practice_Head', 'Response'],
+    },
+    'partner': {
+        'cube': CUBE_COLUMNS,
+        'tax': ['Partner', 'Response'],
+        'cfo': ['Partner', 'Response'],
+        'other': ['Partner', 'Response'],
+    },
+    'tax': {
+        'tax': ['Response', 'Response_1', 'Location', 'Phone_Number'],
+    },
+    'cfo': {
+        'cfo': ['Response', 'Response_7', 'Location_6', 'Phone_Number_4'],
+    },
+    'other': {
+        'other': ['Response', 'Response_13', 'Location_12', 'Phone_Number_10'],
+    },
+    'metrics': {
+        'cube': CUBE_COLUMNS,
+        'master': ['Invite_Dt'],  # Daily invite trend - too fine-grained for the cube
+    },
+}
+
+# Contact tabs: the analysis table's response / location / phone columns
+# (the same table layout with different column suffixes)
+CONTACT_TABS = {
+    'tax': {'title': 'Tax', 'response': 'Response_1', 'location': 'Location', 'phone': 'Phone_Number'},
+    'cfo': {'title': 'CFO', 'response': 'Response_7', 'location': 'Location_6', 'phone': 'Phone_Number_4'},
+    'other': {'title': 'Other', 'response': 'Response_13', 'location': 'Location_12', 'phone': 'Phone_Number_10'},
+}
+
+# Change detection: clients check the data version every VERSION_CHECK_SECONDS
+# and only reload when it changed. The probe result is shared for
+# DATA_VERSION_TTL seconds, so any number of clients costs one query per TTL
+VERSION_CHECK_SECONDS = int(os.getenv("VERSION_CHECK_SECONDS", 10))
+DATA_VERSION_TTL = float(os.getenv("DATA_VERSION_TTL", 5))
+DATA_VERSION_MAX_WAIT = 25  # Longest /data-version long-poll, in seconds
+VERSION_COLUMNS = ['Last_Updated', 'Data_Insert_Time']
+
+_data_version = {'version': None, 'checked_at': 0.0}
+_data_version_lock = threading.Lock()
+
+# filter_data results memoized by (data version, filters)
+FILTER_CACHE_SIZE = 32
+_filter_cache = OrderedDict()
+_filter_cache_lock = threading.Lock()
+
+# FilterIndex + Cube per data version (a few, for clients still on an older version)
+VERSION_CACHE_SIZE = 4
+_version_cache = OrderedDict()
+
+# Figures: categories past the FIGURE_TOP_N largest are summed into one
+# "Other" trace/slice; line traces switch to WebGL from WEBGL_MIN_POINTS
+FIGURE_TOP_N = int(os.getenv("FIGURE_TOP_N", 10))
+WEBGL_MIN_POINTS = 1000
+
+# DASH_CALLBACK_TRACE=1 logs every callback run with its trigger and duration
+CALLBACK_TRACE = os.getenv("DASH_CALLBACK_TRACE", "").lower() in ('1', 'true', 'yes')
+
+# Instrumentation: wall times and payload sizes per series, served at /metrics.
+# Quantiles cover the last METRICS_WINDOW samples, _sum/_count the process life
+METRICS_WINDOW = int(os.getenv("METRICS_WINDOW", 500))
+METRIC_QUANTILES = (0.5, 0.9, 0.99)
+METRIC_HELP = {
+    'dashboard_callback_seconds': 'Wall time per Dash callback',
+    'dashboard_render_seconds': 'Wall time per tab render',
+    'dashboard_db_connect_seconds': 'Wall time per database connection',
+    'dashboard_db_query_seconds': 'Wall time per database query',
+    'dashboard_step_seconds': 'Wall time per data preparation step',
+    'dashboard_figure_seconds': 'Wall time per figure build',
+    'dashboard_request_bytes': 'Callback request payload size',
+    'dashboard_response_bytes': 'Callback response payload size',
+}
+
+# DASH_PROFILE=1 lets a request ask for a profile with ?profile=1 (cProfile)
+# or ?profile=pyinstrument - on the request itself or on the page it came from
+PROFILE_ENABLED = os.getenv("DASH_PROFILE", "").lower() in ('1', 'true', 'yes')
+PROFILE_DIR = os.getenv("DASH_PROFILE_DIR", "profiles")
+
+# Logical name -> actual name on this server (lowercase on Railway), resolved once
+_table_names = {}
+_table_names_lock = threading.Lock()
+
 # Initialize Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP, dbc.icons.FONT_AWESOME])
 server = app.server
 app.title = "Tax Summit Analytics Dashboard"
 app.config['suppress_callback_exceptions'] = True
 
+class Metrics:
+    """Rolling samples per (metric, labels) series, plus all-time count and sum"""
+
+    def __init__(self, window=METRICS_WINDOW):
+        self.window = window
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, metric, value, **labels):
+        key = (metric, tuple(sorted(labels.items())))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {'samples': deque(maxlen=self.window), 'count': 0, 'sum': 0.0}
+            series['samples'].append(value)
+            series['count'] += 1
+            series['sum'] += value
+
+    def prometheus(self):
+        """Prometheus text format: every metric as a summary"""
+        with self._lock:
+            snapshot = [(metric, labels, list(series['samples']), series['count'], series['sum'])
+                        for (metric, labels), series in sorted(self._series.items())]
+        lines, previous = [], None
+        for metric, labels, samples, count, total in snapshot:
+            if metric != previous:
+                previous = metric
+                lines.append(f"# HELP {metric} {METRIC_HELP.get(metric, metric)}")
+                lines.append(f"# TYPE {metric} summary")
+            for quantile, value in zip(METRIC_QUANTILES, np.quantile(samples, METRIC_QUANTILES)):
+                lines.append(f"{metric}{prometheus_labels(labels, quantile=quantile)} {value:.6g}")
+            lines.append(f"{metric}_sum{prometheus_labels(labels)} {total:.6g}")
+            lines.append(f"{metric}_count{prometheus_labels(labels)} {count}")
+        return '\n'.join(lines) + '\n'
+
+def prometheus_labels(labels, **extra):
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ''
+    escape = lambda v: str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{k}="{escape(v)}"' for k, v in pairs) + '}'
+
+metrics = Metrics()
+
+@contextlib.contextmanager
+def timed(metric, **labels):
+    """Record the wall time of a block (or, as a decorator, of each call)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.observe(metric, time.perf_counter() - start, **labels)
+
+def label_request(**labels):
+    """Labels for this request's payload metrics (set by the callback handling it)"""
+    if flask.has_request_context():
+        flask.g.setdefault('metric_labels', {}).update(labels)
+
 # Database connection
 def get_db_connection():
     try:
@@ -43,13 +242,14 @@ def get_db_connection():
             port = int(os.getenv("DB_PORT", 3306))
             print(f"💻 Connecting to Local MySQL: {host}:{port}/{database}")
         
-        connection = mysql.connector.connect(
-            host=host,
-            user=user,
-            password=password,
-            database=database,
-            port=port
-        )
+        with timed('dashboard_db_connect_seconds'):
+            connection = mysql.connector.connect(
+                host=host,
+                user=user,
+                password=password,
+                database=database,
+                port=port
+            )
         
         if connection.is_connected():
             print("✅ Database connection successful!")
@@ -59,45 +259,125 @@ def get_db_connection():
         print(f"❌ Database connection failed: {e}")
         return None
 
-def fetch_master_data():
+def resolve_table_name(conn, name):
+    """Actual name of a dashboard table, looked up in the schema catalog once and cached"""
+    with _table_names_lock:
+        if name not in _table_names:
+            catalog = get_catalog(conn)
+            for table in [MASTER_TABLE] + ANALYSIS_TABLES + [SUMMARY_TABLE]:
+                actual = catalog.resolve(table)
+                if actual:
+                    _table_names[table] = actual
+        return _table_names.get(name)
+
+def required_columns(source, tabs=None):
+    """Union of the columns `tabs` (default: all tabs) need from one data source"""
+    columns = list(BASE_COLUMNS[source])
+    # The cube is built from master, so its columns are master columns
+    sources = [source, 'cube'] if source == 'master' else [source]
+    for tab in tabs or TAB_REQUIREMENTS:
+        for col in (c for src in sources for c in TAB_REQUIREMENTS[tab].get(src, [])):
+            if col not in columns:
+                columns.append(col)
+    return columns
+
+def fetch_table(name, columns=None):
+    """
+    SELECT a table on its own connection (safe to call from worker threads).
+    With `columns`, only those that exist in the table are selected.
+    """
     conn = get_db_connection()
-    if conn:
-        table_name = os.getenv("DB_TABLE", "tax_summit_master_data")
-        df = pd.read_sql(f"SELECT * FROM {table_name}", conn)
+    if not conn:
+        return pd.DataFrame()
+    try:
+        table_name = resolve_table_name(conn, name)
+        if not table_name:
+            print(f"❌ Table {name} not found")
+            return pd.DataFrame()
+
+        if columns:
+            available = get_catalog(conn).column_set(table_name)
+            col_list = ', '.join(f"`{c}`" for c in columns if c in available)
+        else:
+            col_list = '*'
+        with timed('dashboard_db_query_seconds', query=name):
+            return pd.read_sql(f"SELECT {col_list} FROM `{table_name}`", conn)
+    except Exception as e:
+        print(f"❌ Error fetching {name}: {e}")
+        return pd.DataFrame()
+    finally:
         conn.close()
-        return df
-    return pd.DataFrame()
 
-def fetch_analysis_tables():
+def fetch_source(source, tabs=None):
+    """Fetch one data source with the projection its tabs need"""
+    return fetch_table(SOURCE_TABLES[source], required_columns(source, tabs))
+
+def fetch_master_data():
+    return fetch_source('master')
+
+def fetch_summary(source):
+    """One source's groups from the MySQL summary table (empty if it doesn't exist)"""
     conn = get_db_connection()
     if not conn:
-        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
-    
+        return pd.DataFrame()
     try:
-        # Try lowercase first (Railway), then uppercase (local)
-        try:
-            tax_df = pd.read_sql("SELECT * FROM tax_persons_analysis", conn)
-        except:
-            tax_df = pd.read_sql("SELECT * FROM Tax_Persons_Analysis", conn)
-        
-        try:
-            cfo_df = pd.read_sql("SELECT * FROM cfo_persons_analysis", conn)
-        except:
-            cfo_df = pd.read_sql("SELECT * FROM CFO_Persons_Analysis", conn)
-        
-        try:
-            other_df = pd.read_sql("SELECT * FROM other_persons_analysis", conn)
-        except:
-            other_df = pd.read_sql("SELECT * FROM Other_Persons_Analysis", conn)
-        
-        conn.close()
-        return tax_df, cfo_df, other_df
-        
+        table_name = resolve_table_name(conn, SUMMARY_TABLE)
+        if not table_name:
+            return pd.DataFrame()
+        col_list = ', '.join(f"`{c}`" for c in SUMMARY_DIMENSIONS + SUMMARY_MEASURES)
+        with timed('dashboard_db_query_seconds', query=SUMMARY_TABLE):
+            return pd.read_sql(f"SELECT {col_list} FROM `{table_name}` WHERE Source = '{source}'", conn)
     except Exception as e:
-        print(f"❌ Error fetching analysis tables: {e}")
-        if conn:
+        print(f"❌ Error fetching {SUMMARY_TABLE}: {e}")
+        return pd.DataFrame()
+    finally:
+        conn.close()
+
+def fetch_analysis_tables():
+    """Read the three analysis tables concurrently, one connection each"""
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        tax_df, cfo_df, other_df = executor.map(fetch_source, ['tax', 'cfo', 'other'])
+    return tax_df, cfo_df, other_df
+
+def probe_data_version(conn):
+    """Fingerprint of every dashboard table: row count + newest change timestamp"""
+    catalog = get_catalog(conn)
+    selects = []
+    for source, name in SOURCE_TABLES.items():
+        table_name = resolve_table_name(conn, name)
+        if not table_name:
+            continue
+        columns = catalog.column_set(table_name)
+        stamp = next((c for c in VERSION_COLUMNS if c in columns), None)
+        newest = f"MAX(`{stamp}`)" if stamp else "NULL"
+        selects.append(f"SELECT '{source}', COUNT(*), {newest} FROM `{table_name}`")
+
+    cursor = conn.cursor()
+    try:
+        with timed('dashboard_db_query_seconds', query='data_version'):
+            cursor.execute(" UNION ALL ".join(selects))
+            rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    return hashlib.md5(repr(rows).encode()).hexdigest()[:12]
+
+def get_data_version(max_age=DATA_VERSION_TTL):
+    """Current data version, probed at most once per `max_age` seconds per process"""
+    with _data_version_lock:
+        if _data_version['version'] and time.monotonic() - _data_version['checked_at'] < max_age:
+            return _data_version['version']
+
+        conn = get_db_connection()
+        if not conn:
+            return _data_version['version']
+        try:
+            _data_version['version'] = probe_data_version(conn)
+            _data_version['checked_at'] = time.monotonic()
+        except Exception as e:
+            print(f"❌ Error probing data version: {e}")
+        finally:
             conn.close()
-        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+        return _data_version['version']
 
 # Utility functions
 def safe_int(val):
@@ -183,6 +463,371 @@ def get_response_weight(response):
     
     return 1  # Default weight is 1
 
+# Compact data layer: low-cardinality dimensions travel as integer codes
+# into one dictionary per column shared by master/tax/cfo/other, and are
+# decoded into pandas categoricals inside the callbacks
+DIMENSION_COLUMNS = ['Practice_Head', 'Partner', 'Sector', 'Location', 'Response', 'Region']
+
+# Count columns held as TEXT in MySQL, narrowed to the smallest int dtype
+COUNT_COLUMNS = ['numInvitees', 'numRegistrations', 'Response_Weight']
+
+# Location column each source derives its Region from
+REGION_SOURCE_COLUMNS = {'master': 'Location', 'tax': 'Location', 'cfo': 'Location_6', 'other': 'Location_12'}
+
+def add_region_column(df, location_col):
+    """Region per row, mapped once per distinct location"""
+    if location_col in df.columns:
+        locations = df[location_col].dropna().unique()
+        regions = {loc: get_region(loc) for loc in locations}
+        df['Region'] = df[location_col].map(regions)
+    return df
+
+def build_dictionaries(frames):
+    """One sorted value list per dimension column, shared by every frame"""
+    dictionaries = {}
+    for col in DIMENSION_COLUMNS:
+        values = set()
+        for df in frames:
+            if col in df.columns:
+                values.update(df[col].dropna().unique())
+        dictionaries[col] = sorted(values, key=str)
+    return dictionaries
+
+def compact_frame(df, dictionaries):
+    """Dimension columns -> shared categoricals, count columns -> small ints"""
+    for col in DIMENSION_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.Categorical(df[col], categories=dictionaries[col])
+    for col in COUNT_COLUMNS:
+        if col in df.columns:
+            # Same result as safe_int(): blanks / junk -> 0, '3.0' -> 3
+            counts = pd.to_numeric(df[col], errors='coerce').fillna(0).astype('int64')
+            df[col] = pd.to_numeric(counts, downcast='integer')
+    return df
+
+def plain(df):
+    """Categoricals back to plain values - the figure helpers group by
+    color/path columns and only want the categories present in the data"""
+    categorical = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+    return df.astype({c: object for c in categorical}) if categorical else df
+
+# plotly's default template is ~7 KB of per-trace-type defaults and unused
+# subplot styling, copied into every figure; keep only the layout we use
+pio.templates['dashboard'] = go.layout.Template(layout={
+    key: pio.templates['plotly'].layout[key]
+    for key in ['autotypenumbers', 'colorway', 'font', 'hovermode', 'hoverlabel',
+                'paper_bgcolor', 'plot_bgcolor', 'xaxis', 'yaxis', 'title']
+})
+pio.templates.default = 'dashboard'
+FIGURE_COLORWAY = list(pio.templates['plotly'].layout.colorway)
+
+def top_categories(totals, top_n=FIGURE_TOP_N):
+    """
+    Labels to keep from a {category: total} Series, largest first, plus
+    the label the rest are summed into (None when nothing is dropped).
+    """
+    totals = totals.sort_values(ascending=False, kind='stable')
+    if len(totals) <= top_n + 1:
+        return list(totals.index), None
+    return list(totals.index[:top_n]), f"Other ({len(totals) - top_n})"
+
+def bucket_column(df, column, value, top_n=FIGURE_TOP_N):
+    """`df` with `column` capped to its top_n values by total `value`, and the kept order"""
+    keep, other = top_categories(df.groupby(column, sort=False)[value].sum(), top_n)
+    if other:
+        df = df.assign(**{column: df[column].where(df[column].isin(keep), other)})
+        keep.append(other)
+    return df, keep
+
+@timed('dashboard_figure_seconds', figure='category_bars')
+def category_bars(df, x, y, color, barmode='stack', top_n=FIGURE_TOP_N):
+    """
+    One go.Bar per `color` value of an aggregated frame, built from its
+    arrays. Only the top_n colors get their own trace; the rest are summed
+    into a single "Other" trace.
+    """
+    fig = go.Figure().update_layout(barmode=barmode, xaxis_title=x, yaxis_title=y, legend_title_text=color)
+    df = plain(df).dropna(subset=[x, color])
+    if df.empty:
+        return fig
+    df, order = bucket_column(df, color, y, top_n)
+    sums = df.groupby([color, x], sort=False)[y].sum()
+    for name in order:
+        values = sums[name]
+        fig.add_trace(go.Bar(name=str(name), x=values.index.to_numpy(), y=values.to_numpy()))
+    return fig
+
+@timed('dashboard_figure_seconds', figure='value_bars')
+def value_bars(labels, values, colors=FIGURE_COLORWAY, **layout):
+    """One go.Bar trace, one colour per bar (instead of one trace per category)"""
+    labels = np.asarray(labels, dtype=object)
+    return go.Figure(go.Bar(
+        x=labels, y=np.asarray(values),
+        marker_color=[colors[i % len(colors)] for i in range(len(labels))]
+    )).update_layout(**layout)
+
+@timed('dashboard_figure_seconds', figure='pie_figure')
+def pie_figure(totals, top_n=FIGURE_TOP_N):
+    """Donut of a {label: value} Series, capped like category_bars"""
+    totals = totals[totals.index.notna()]
+    keep, other = top_categories(totals, top_n)
+    labels, values = [str(label) for label in keep], [totals[label] for label in keep]
+    if other:
+        labels.append(other)
+        values.append(totals.drop(keep).sum())
+    return go.Figure(go.Pie(labels=labels, values=values, hole=0.4))
+
+@timed('dashboard_figure_seconds', figure='sunburst_figure')
+def sunburst_figure(df, parent, child, value, top_n=FIGURE_TOP_N):
+    """Two-level sunburst from an aggregated frame; children capped across parents"""
+    df = plain(df).dropna(subset=[parent, child])
+    df, _ = bucket_column(df, child, value, top_n)
+    leaves = df.groupby([parent, child], sort=False)[value].sum()
+    roots = leaves.groupby(level=0, sort=False).sum()
+    return go.Figure(go.Sunburst(
+        ids=[str(p) for p in roots.index] + [f"{p}/{c}" for p, c in leaves.index],
+        labels=[str(p) for p in roots.index] + [str(c) for _, c in leaves.index],
+        parents=[''] * len(roots) + [str(p) for p, _ in leaves.index],
+        values=np.concatenate([roots.to_numpy(), leaves.to_numpy()]),
+        branchvalues='total'
+    ))
+
+@timed('dashboard_figure_seconds', figure='line_figure')
+def line_figure(x, y, **layout):
+    """Line chart; WebGL once there are enough points for SVG to lag"""
+    trace = go.Scattergl if len(x) >= WEBGL_MIN_POINTS else go.Scatter
+    return go.Figure(trace(x=np.asarray(x), y=np.asarray(y), mode='lines')).update_layout(**layout)
+
+def log_payload(name, component):
+    """Print the serialized size of a layout and of the figures in it"""
+    graphs = [c for c in component._traverse() if isinstance(c, dcc.Graph)]
+    total = len(json.dumps(component, cls=PlotlyJSONEncoder))
+    figures = sum(len(json.dumps(g.figure, cls=PlotlyJSONEncoder)) for g in graphs)
+    print(f"📦 {name}: {total / 1024:.1f} KB ({len(graphs)} figures, {figures / 1024:.1f} KB)")
+
+def frame_memory(df):
+    return df.memory_usage(deep=True).sum() if not df.empty else 0
+
+def to_store(df):
+    """
+    Serialize a compacted frame for dcc.Store: categoricals as code lists
+    (-1 = missing), everything else as plain values.
+    """
+    payload = {'rows': len(df), 'order': list(df.columns), 'codes': {}, 'columns': {}, 'dtypes': {}}
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            payload['codes'][col] = series.cat.codes.tolist()
+        else:
+            if col in COUNT_COLUMNS:
+                payload['dtypes'][col] = str(series.dtype)
+            payload['columns'][col] = series.astype(object).where(series.notna(), None).tolist()
+    return payload
+
+def from_store(payload, dictionaries):
+    """Rebuild the compact DataFrame stored by to_store()"""
+    if not payload or not payload.get('order'):
+        return pd.DataFrame()
+    data = {}
+    for col in payload['order']:
+        if col in payload['codes']:
+            data[col] = pd.Categorical.from_codes(payload['codes'][col], categories=dictionaries[col])
+        else:
+            data[col] = pd.Series(payload['columns'][col], dtype=payload['dtypes'].get(col))
+    return pd.DataFrame(data, columns=payload['order'])
+
+# Filter key in current-filters -> master dimension column
+FILTER_DIMENSIONS = {
+    'ph': 'Practice_Head',
+    'partner': 'Partner',
+    'sector': 'Sector',
+    'loc': 'Location',
+    'resp': 'Response',
+}
+
+# Set bits per byte value, for counting rows in a packed bitmap
+POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+class FilterIndex:
+    """
+    Inverted index over one master dataset: for every filter value a packed
+    row bitmap (np.packbits of a bool mask). A filter selection is an OR of
+    bitmaps within a dimension and an AND across dimensions - no frame is
+    built or copied.
+    """
+
+    @timed('dashboard_step_seconds', step='filter_index')
+    def __init__(self, payload, dictionaries):
+        self.rows = payload.get('rows', 0)
+        self.codes = {
+            col: np.asarray(codes, dtype=np.int32) for col, codes in payload['codes'].items()
+        }
+        self.bitmaps = {}
+        for key, col in FILTER_DIMENSIONS.items():
+            codes = self.codes.get(col, np.zeros(0, dtype=np.int32))
+            values = dictionaries.get(col, [])
+            self.bitmaps[key] = {
+                values[code]: np.packbits(codes == code) for code in np.unique(codes) if code >= 0
+            }
+        self.all_rows = np.packbits(np.ones(self.rows, dtype=bool))
+
+    def dimension_bitmap(self, key, selected):
+        """Rows matching any of `selected` in one dimension"""
+        bitmap = np.zeros_like(self.all_rows)
+        for value in selected:
+            if value in self.bitmaps[key]:
+                bitmap |= self.bitmaps[key][value]
+        return bitmap
+
+    def bitmap(self, filters, skip=None):
+        """Rows matching every active filter (except dimension `skip`)"""
+        result = self.all_rows.copy()
+        for key in FILTER_DIMENSIONS:
+            if key != skip and filters.get(key):
+                result &= self.dimension_bitmap(key, filters[key])
+        return result
+
+    def positions(self, filters):
+        """Row positions matching the filters"""
+        mask = np.unpackbits(self.bitmap(filters), count=self.rows).astype(bool)
+        return np.flatnonzero(mask)
+
+    def option_counts(self, key, filters):
+        """{value: matching rows} for one dimension, under the other dimensions' filters"""
+        others = self.bitmap(filters, skip=key)
+        return {
+            value: int(POPCOUNT[bits & others].sum())
+            for value, bits in self.bitmaps[key].items()
+        }
+
+def take_rows(payload, positions, code_arrays=None):
+    """Subset a to_store() payload to the given row positions"""
+    code_arrays = code_arrays or {}
+    taken = {
+        'rows': len(positions), 'order': payload['order'], 'dtypes': payload['dtypes'],
+        'codes': {}, 'columns': {},
+    }
+    for col, codes in payload['codes'].items():
+        codes = code_arrays[col] if col in code_arrays else np.asarray(codes, dtype=np.int32)
+        taken['codes'][col] = codes[positions].tolist()
+    for col, values in payload['columns'].items():
+        taken['columns'][col] = [values[i] for i in positions]
+    return taken
+
+class Cube:
+    """
+    Pre-aggregated master measures.
+
+        cube.slice(filters)                      -> Cube of the matching cells
+        cube.rollup(['Practice_Head', 'Sector']) -> DataFrame of summed measures
+        cube.total('invitees')                   -> int
+    """
+
+    def __init__(self, cells):
+        self.cells = cells
+
+    @staticmethod
+    def facts(df):
+        """Per-row measures of a compacted master frame, next to its dimensions"""
+        dims = [c for c in CUBE_DIMENSIONS if c in df.columns]
+        facts = df[dims].copy()
+        facts['rows'] = 1
+        facts['clients'] = df['Client_Name'].notna() if 'Client_Name' in df.columns else 1
+        facts['invitees'] = df.get('numInvitees', 0)
+        facts['registrations'] = df.get('numRegistrations', 0)
+        facts['responses'] = df['Response'].notna() if 'Response' in df.columns else False
+        facts['weighted_responses'] = df.get('Response_Weight', 1)
+        facts['circle_backs'] = df['Circle_Back_Dt'].notna() if 'Circle_Back_Dt' in df.columns else False
+        facts[CUBE_MEASURES] = facts[CUBE_MEASURES].astype('int64')
+        return facts
+
+    @classmethod
+    def from_facts(cls, facts):
+        """One cell per dimension combination, measures summed"""
+        if facts.empty:
+            return cls(pd.DataFrame(columns=CUBE_DIMENSIONS + CUBE_MEASURES))
+        dims = [c for c in CUBE_DIMENSIONS if c in facts.columns]
+        # dropna=False keeps rows with a missing dimension in the totals
+        cells = facts.groupby(dims, observed=True, dropna=False)[CUBE_MEASURES].sum().reset_index()
+        return cls(cells)
+
+    @classmethod
+    def from_frame(cls, df):
+        """Aggregate a compacted master frame"""
+        if df.empty:
+            return cls.from_facts(pd.DataFrame())
+        return cls.from_facts(cls.facts(df))
+
+    @classmethod
+    def from_summary(cls, summary, dictionaries):
+        """
+        Aggregate the master groups of the MySQL summary table. The raw
+        values get the same standardization as the loaded rows; returns
+        None when one isn't in `dictionaries` (summary and rows disagree).
+        """
+        df = summary.copy()
+        for col in ['Practice_Head', 'Partner', 'Location', 'Sector']:
+            df[col] = df[col].apply(lambda x: str(x).strip().title() if pd.notna(x) else x)
+        df['Response_Weight'] = df['Response'].apply(get_response_weight)
+        df['Response'] = df['Response'].apply(normalize_response_label)
+        add_region_column(df, 'Location')
+
+        facts = pd.DataFrame({
+            col: pd.Categorical(df[col], categories=dictionaries.get(col, []))
+            for col in CUBE_DIMENSIONS
+        })
+        for col in CUBE_DIMENSIONS:
+            if (facts[col].isna() & df[col].notna()).any():
+                return None
+
+        rows = df['Row_Count'].astype('int64')
+        facts['rows'] = rows
+        facts['clients'] = df['Client_Count']
+        facts['invitees'] = df['Invitees']
+        facts['registrations'] = df['Registrations']
+        facts['responses'] = rows.where(df['Response'].notna(), 0)
+        facts['weighted_responses'] = rows * df['Response_Weight']
+        facts['circle_backs'] = df['Circle_Backs']
+        facts[CUBE_MEASURES] = facts[CUBE_MEASURES].astype('int64')
+        return cls.from_facts(facts)
+
+    @property
+    def empty(self):
+        return self.cells.empty
+
+    def slice(self, filters):
+        """Cells matching the filter panel selection (OR within, AND across dimensions)"""
+        mask = np.ones(len(self.cells), dtype=bool)
+        for key, col in FILTER_DIMENSIONS.items():
+            if (filters or {}).get(key) and col in self.cells.columns:
+                mask &= self.cells[col].isin(filters[key]).to_numpy()
+        return Cube(self.cells[mask])
+
+    def rollup(self, by, measures=CUBE_MEASURES):
+        """Sum `measures` grouped by `by` (rows with a missing key are dropped, like groupby)"""
+        return self.cells.groupby(by, observed=True)[list(measures)].sum().reset_index()
+
+    def total(self, measure):
+        return int(self.cells[measure].sum())
+
+@timed('dashboard_step_seconds', step='cube')
+def build_cube(master_df, dictionaries):
+    """
+    Cube for freshly loaded master rows, read from the MySQL summary table
+    (O(groups)). Every measure total is checked against the loaded rows - the
+    summary lags during a Railway sync or before create_summary_tables.py has
+    run, and an edit can change Response or the counts without changing the
+    row count - and only on a mismatch are the rows grouped here instead.
+    """
+    facts = Cube.facts(master_df) if not master_df.empty else pd.DataFrame(columns=CUBE_MEASURES)
+    summary = fetch_summary('master')
+    if not summary.empty:
+        cube = Cube.from_summary(summary, dictionaries)
+        if cube is not None and all(cube.total(m) == int(facts[m].sum()) for m in CUBE_MEASURES):
+            return cube
+        print(f"⚠️  {SUMMARY_TABLE} doesn't match master, aggregating the rows instead")
+    return Cube.from_facts(facts)
+
 # Function to filter analysis tables based on master data filters
 def filter_analysis_table(analysis_df, filtered_master_df, practice_head_col='Practice_Head', partner_col='Partner'):
     """Filter analysis table based on filtered master data"""
@@ -251,8 +896,8 @@ def create_filter_panel():
                 ], md=2),
                 dbc.Col([
                     html.Div([
-                        html.Span("Auto-refresh: 1 minute", className="badge bg-success mt-4"),
-                        dcc.Interval(id='interval-component', interval=60*1000, n_intervals=0)
+                        html.Span("Live: refreshes on change", className="badge bg-success mt-4"),
+                        dcc.Interval(id='version-check', interval=VERSION_CHECK_SECONDS*1000, n_intervals=0)
                     ])
                 ], md=2, className="text-end"),
             ])
@@ -308,120 +953,278 @@ app.layout = dbc.Container([
         dbc.Tab(label="📈 Metrics", tab_id="metrics"),
     ], id="tabs", active_tab="overview", className="mb-4"),
     
-    html.Div(id="tab-content"),
+    # One pane per tab: a rendered tab stays in the page, and switching back
+    # to it is a clientside show/hide until the data or filters change
+    html.Div([html.Div(id=f"tab-pane-{tab}") for tab in TAB_REQUIREMENTS], id="tab-content"),
     
     dcc.Store(id='master-data'),
     dcc.Store(id='tax-data'),
     dcc.Store(id='cfo-data'),
     dcc.Store(id='other-data'),
     dcc.Store(id='filtered-data'),
-    dcc.Store(id='current-filters') # Store Current filter values
+    dcc.Store(id='dictionaries'),  # Shared category lists for the compact stores
+    dcc.Store(id='data-version'),  # Bumped by check_data_version when the tables change
+    dcc.Store(id='current-filters'), # Store Current filter values
+    dcc.Store(id='render-request'),  # {tab, generation} the server should render
+    dcc.Store(id='rendered-tabs'),  # {tab: generation} already in the panes
 ], fluid=True, style={'backgroundColor': '#f8f9fa', 'minHeight': '100vh'})
 
-# Callbacks
-@app.callback(
-    [Output('practice-head-filter', 'options'),
-     Output('partner-filter', 'options'),
-     Output('sector-filter', 'options'),
-     Output('location-filter', 'options'),
-     Output('response-filter', 'options'),
-     Output('master-data', 'data'),
-     Output('tax-data', 'data'),
-     Output('cfo-data', 'data'),
-     Output('other-data', 'data')],
-    Input('interval-component', 'n_intervals')
-)
-def load_data(n):
+def prepare_datasets():
+    """
+    Fetch, standardize and compact master/tax/cfo/other.
+
+    Returns:
+        tuple: ({source: DataFrame}, dictionaries), or None when master is empty
+    """
     master_df = fetch_master_data()
     tax_df, cfo_df, other_df = fetch_analysis_tables()
     
     # Standardize names to Title format
-    if not master_df.empty:
-        name_columns = ['Practice_Head', 'Partner', 'Client_Name', 'Location', 'Sector']
-        for col in name_columns:
-            if col in master_df.columns:
-                master_df[col] = master_df[col].apply(lambda x: str(x).strip().title() if pd.notna(x) else x)
-    
-    if not tax_df.empty:
-        name_columns = ['Practice_Head', 'Partner', 'Client_Name', 'Location', 'Sector', 'Person_Name']
-        for col in name_columns:
-            if col in tax_df.columns:
-                tax_df[col] = tax_df[col].apply(lambda x: str(x).strip().title() if pd.notna(x) else x)
-    
-    if not cfo_df.empty:
-        name_columns = ['Practice_Head', 'Partner', 'Client_Name', 'Location', 'Sector', 'Person_Name']
-        for col in name_columns:
-            if col in cfo_df.columns:
-                cfo_df[col] = cfo_df[col].apply(lambda x: str(x).strip().title() if pd.notna(x) else x)
-    
-    if not other_df.empty:
-        name_columns = ['Practice_Head', 'Partner', 'Client_Name', 'Location', 'Sector', 'Person_Name']
-        for col in name_columns:
-            if col in other_df.columns:
-                other_df[col] = other_df[col].apply(lambda x: str(x).strip().title() if pd.notna(x) else x)
-    
+    with timed('dashboard_step_seconds', step='standardize_names'):
+        if not master_df.empty:
+            name_columns = ['Practice_Head', 'Partner', 'Client_Name', 'Location', 'Sector']
+            for col in name_columns:
+                if col in master_df.columns:
+                    master_df[col] = master_df[col].apply(lambda x: str(x).strip().title() if pd.notna(x) else x)
+    
+        if not tax_df.empty:
+            name_columns = ['Practice_Head', 'Partner', 'Client_Name', 'Location', 'Sector', 'Person_Name']
+            for col in name_columns:
+                if col in tax_df.columns:
+                    tax_df[col] = tax_df[col].apply(lambda x: str(x).strip().title() if pd.notna(x) else x)
+    
+        if not cfo_df.empty:
+            name_columns = ['Practice_Head', 'Partner', 'Client_Name', 'Location', 'Sector', 'Person_Name']
+            for col in name_columns:
+                if col in cfo_df.columns:
+                    cfo_df[col] = cfo_df[col].apply(lambda x: str(x).strip().title() if pd.notna(x) else x)
+    
+        if not other_df.empty:
+            name_columns = ['Practice_Head', 'Partner', 'Client_Name', 'Location', 'Sector', 'Person_Name']
+            for col in name_columns:
+                if col in other_df.columns:
+                    other_df[col] = other_df[col].apply(lambda x: str(x).strip().title() if pd.notna(x) else x)
+    
+    # Response weights + normalized labels
+    with timed('dashboard_step_seconds', step='normalize_responses'):
         # After standardizing master_df
-    if not master_df.empty and 'Response' in master_df.columns:
-        master_df['Response_Weight'] = master_df['Response'].apply(get_response_weight)
-        master_df['Response'] = master_df['Response'].apply(normalize_response_label)
-
-    # After standardizing tax_df
-    if not tax_df.empty and 'Response' in tax_df.columns:
-        tax_df['Response_Weight'] = tax_df['Response'].apply(get_response_weight)
-        tax_df['Response'] = tax_df['Response'].apply(normalize_response_label)
-
-    # After standardizing cfo_df
-    if not cfo_df.empty and 'Response' in cfo_df.columns:
-        cfo_df['Response_Weight'] = cfo_df['Response'].apply(get_response_weight)
-        cfo_df['Response'] = cfo_df['Response'].apply(normalize_response_label)
-
-    # After standardizing other_df
-    if not other_df.empty and 'Response' in other_df.columns:
-        other_df['Response_Weight'] = other_df['Response'].apply(get_response_weight)
-        other_df['Response'] = other_df['Response'].apply(normalize_response_label)
+        if not master_df.empty and 'Response' in master_df.columns:
+            master_df['Response_Weight'] = master_df['Response'].apply(get_response_weight)
+            master_df['Response'] = master_df['Response'].apply(normalize_response_label)
+
+        # After standardizing tax_df
+        if not tax_df.empty and 'Response' in tax_df.columns:
+            tax_df['Response_Weight'] = tax_df['Response'].apply(get_response_weight)
+            tax_df['Response'] = tax_df['Response'].apply(normalize_response_label)
+
+        # After standardizing cfo_df
+        if not cfo_df.empty and 'Response' in cfo_df.columns:
+            cfo_df['Response_Weight'] = cfo_df['Response'].apply(get_response_weight)
+            cfo_df['Response'] = cfo_df['Response'].apply(normalize_response_label)
+
+        # After standardizing other_df
+        if not other_df.empty and 'Response' in other_df.columns:
+            other_df['Response_Weight'] = other_df['Response'].apply(get_response_weight)
+            other_df['Response'] = other_df['Response'].apply(normalize_response_label)
     
     if master_df.empty:
-        return [], [], [], [], [], {}, {}, {}, {}
+        return None
+    
+    frames = {'master': master_df, 'tax': tax_df, 'cfo': cfo_df, 'other': other_df}
+    with timed('dashboard_step_seconds', step='regions'):
+        for source, df in frames.items():
+            add_region_column(df, REGION_SOURCE_COLUMNS[source])
+    
+    # Dimension columns -> shared categoricals, counts -> small ints
+    with timed('dashboard_step_seconds', step='dictionaries'):
+        dictionaries = build_dictionaries(frames.values())
+    for source, df in frames.items():
+        before = frame_memory(df)
+        with timed('dashboard_step_seconds', step='compact'):
+            compact_frame(df, dictionaries)
+        print(f"🗜️  {source}: {len(df)} rows, {before / 1024:.1f} KB → {frame_memory(df) / 1024:.1f} KB")
+    
+    return frames, dictionaries
+
+def traced(func):
+    """
+    Record each run of a callback in the metrics (and label the request's
+    payload sizes with it). DASH_CALLBACK_TRACE=1 also logs the run with
+    what triggered it.
+    """
+    @functools.wraps(func)
+    def wrapper(*args):
+        label_request(callback=func.__name__)
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        metrics.observe('dashboard_callback_seconds', elapsed, callback=func.__name__)
+        if CALLBACK_TRACE:
+            try:
+                triggers = ', '.join(t['prop_id'] for t in callback_context.triggered) or 'initial'
+            except dash.exceptions.MissingCallbackContextException:
+                triggers = 'direct call'
+            print(f"⏱️  {func.__name__} ← {triggers}: {elapsed * 1000:.1f} ms")
+        return result
+    return wrapper
+
+def filter_cache_key(version, filters):
+    return version, tuple(sorted((k, tuple(sorted(v))) for k, v in filters.items() if v))
+
+def cache_for_version(version, name, value):
+    if not version:
+        return
+    with _filter_cache_lock:
+        _version_cache.setdefault(version, {})[name] = value
+        _version_cache.move_to_end(version)
+        while len(_version_cache) > VERSION_CACHE_SIZE:
+            _version_cache.popitem(last=False)
+
+def cached_for_version(version, name):
+    with _filter_cache_lock:
+        if version not in _version_cache:
+            return None
+        _version_cache.move_to_end(version)
+        return _version_cache[version].get(name)
+
+def get_filter_index(version, payload, dictionaries):
+    """
+    FilterIndex for a data version. load_data() registers it; a worker that
+    didn't serve load_data, or an evicted version, builds it from the
+    client's master store instead of reloading the database.
+    """
+    index = cached_for_version(version, 'index') if version else None
+    # A row count mismatch means the payload came from a different load
+    if index and index.rows == payload.get('rows'):
+        return index
+    
+    index = FilterIndex(payload, dictionaries)
+    cache_for_version(version, 'index', index)
+    return index
+
+def get_cube(version):
+    """Cube for a data version, or None when this worker doesn't have it"""
+    return cached_for_version(version, 'cube') if version else None
+
+# Callbacks
+@app.callback(
+    Output('data-version', 'data'),
+    Input('version-check', 'n_intervals'),
+    State('data-version', 'data')
+)
+@traced
+def check_data_version(n, current):
+    """Bump the data-version store only when the tables changed - idle clients stop here"""
+    version = get_data_version()
+    if version is None or version == current:
+        return no_update
+    return version
+
+@app.callback(
+    [Output('master-data', 'data'),
+     Output('tax-data', 'data'),
+     Output('cfo-data', 'data'),
+     Output('other-data', 'data'),
+     Output('dictionaries', 'data')],
+    Input('data-version', 'data')
+)
+@traced
+def load_data(version):
+    prepared = prepare_datasets()
+    if prepared is None:
+        return {}, {}, {}, {}, {}
     
-    ph_opts = [{'label': x, 'value': x} for x in sorted(master_df['Practice_Head'].dropna().unique())]
-    partner_opts = [{'label': x, 'value': x} for x in sorted(master_df['Partner'].dropna().unique())]
-    sector_opts = [{'label': x, 'value': x} for x in sorted(master_df['Sector'].dropna().unique())]
-    loc_opts = [{'label': x, 'value': x} for x in sorted(master_df['Location'].dropna().unique())]
-    resp_opts = [{'label': x, 'value': x} for x in sorted(master_df['Response'].dropna().unique())]
+    frames, dictionaries = prepared
+    with timed('dashboard_step_seconds', step='stores'):
+        stores = {source: to_store(df) for source, df in frames.items()}
+    cache_for_version(version, 'index', FilterIndex(stores['master'], dictionaries))
+    cache_for_version(version, 'cube', build_cube(frames['master'], dictionaries))
     
-    return (ph_opts, partner_opts, sector_opts, loc_opts, resp_opts, 
-            master_df.to_dict('records'), tax_df.to_dict('records'), 
-            cfo_df.to_dict('records'), other_df.to_dict('records'))
+    return stores['master'], stores['tax'], stores['cfo'], stores['other'], dictionaries
 
-# MODIFIED: Filter data callback now also responds to tab changes
+@app.callback(
+    [Output('practice-head-filter', 'options'),
+     Output('partner-filter', 'options'),
+     Output('sector-filter', 'options'),
+     Output('location-filter', 'options'),
+     Output('response-filter', 'options')],
+    [Input('dictionaries', 'data'),
+     Input('practice-head-filter', 'value'),
+     Input('partner-filter', 'value'),
+     Input('sector-filter', 'value'),
+     Input('location-filter', 'value'),
+     Input('response-filter', 'value')],
+    [State('data-version', 'data'),
+     State('master-data', 'data')]
+)
+@traced
+def update_filter_options(dictionaries, ph, partner, sector, loc, resp, version, master):
+    """
+    Cascading dropdowns: each one lists only the values that still match the
+    other dropdowns' selections, with row counts. Read from the FilterIndex;
+    the master store is only decoded when this worker has no index for the
+    version yet.
+    """
+    if not dictionaries or not master:
+        return [], [], [], [], []
+    
+    selected = {'ph': ph or [], 'partner': partner or [], 'sector': sector or [],
+                'loc': loc or [], 'resp': resp or []}
+    index = get_filter_index(version, master, dictionaries)
+    
+    options = []
+    for key in FILTER_DIMENSIONS:
+        counts = index.option_counts(key, selected)
+        # Keep current selections listed even at 0 so the dropdown doesn't drop them
+        options.append([
+            {'label': f"{value} ({count})", 'value': value}
+            for value, count in counts.items() if count or value in selected[key]
+        ])
+    return options
+
+# Filtering runs only when the data or the filters change - tab switches go
+# straight to render_content
 @app.callback(
     Output('filtered-data', 'data'),
     [Input('master-data', 'data'),
-     Input('current-filters', 'data'),
-     Input('tabs', 'active_tab')],  # NEW: Added tab as input
+     Input('current-filters', 'data')],
+    [State('dictionaries', 'data'),
+     State('data-version', 'data')]
 )
-def filter_data(data, filters, active_tab):
-    if not data or not filters:
-        return data if data else []
-    
-    df = pd.DataFrame(data)
-    
-    # Apply filters if they exist
-    if filters.get('ph'):
-        df = df[df['Practice_Head'].isin(filters['ph'])]
-    if filters.get('partner'):
-        df = df[df['Partner'].isin(filters['partner'])]
-    if filters.get('sector'):
-        df = df[df['Sector'].isin(filters['sector'])]
-    if filters.get('loc'):
-        df = df[df['Location'].isin(filters['loc'])]
-    if filters.get('resp'):
-        df = df[df['Response'].isin(filters['resp'])]
-    
-    return df.to_dict('records')
+@traced
+def filter_data(data, filters, dictionaries, version):
+    # current-filters is None until Apply/Reset is first clicked
+    filters = filters or {}
+    if not data or not any(filters.get(k) for k in FILTER_DIMENSIONS):
+        return data if data else {}
+    
+    key = filter_cache_key(version, filters)
+    with _filter_cache_lock:
+        if version and key in _filter_cache:
+            _filter_cache.move_to_end(key)
+            return _filter_cache[key]
+    
+    # OR within a dimension, AND across dimensions, on precomputed bitmaps
+    index = get_filter_index(version, data, dictionaries)
+    filtered = take_rows(data, index.positions(filters), index.codes)
+    if version:
+        with _filter_cache_lock:
+            _filter_cache[key] = filtered
+            while len(_filter_cache) > FILTER_CACHE_SIZE:
+                _filter_cache.popitem(last=False)
+    return filtered
+
+# Pure UI: the filter buttons, the tab panes' visibility and the decision
+# whether a tab needs rendering run in the browser. Only filtering and
+# rendering go to the server
 
 # NEW: Reset filter values in UI
-@app.callback(
+app.clientside_callback(
+    """
+    function(n_clicks) {
+        return [null, null, null, null, null];
+    }
+    """,
     [Output('practice-head-filter', 'value'),
      Output('partner-filter', 'value'),
      Output('sector-filter', 'value'),
@@ -430,11 +1233,22 @@ def filter_data(data, filters, active_tab):
     Input('reset-filters', 'n_clicks'),
     prevent_initial_call=True
 )
-def reset_filter_values(n_clicks):
-    return None, None, None, None, None
 
-
-@app.callback(
+# Store current filter values when Apply or Reset is clicked
+app.clientside_callback(
+    """
+    function(apply_clicks, reset_clicks, ph, partner, sector, loc, resp) {
+        const triggered = dash_clientside.callback_context.triggered;
+        if (!triggered.length) {
+            return {};
+        }
+        if (triggered[0].prop_id.split('.')[0] === 'reset-filters') {
+            return {ph: [], partner: [], sector: [], loc: [], resp: []};
+        }
+        return {ph: ph || [], partner: partner || [], sector: sector || [],
+                loc: loc || [], resp: resp || []};
+    }
+    """,
     Output('current-filters', 'data'),
     [Input('apply-filters', 'n_clicks'),
      Input('reset-filters', 'n_clicks')],
@@ -445,100 +1259,133 @@ def reset_filter_values(n_clicks):
      State('response-filter', 'value')],
     prevent_initial_call=True
 )
-def update_filters(apply_clicks, reset_clicks, ph, partner, sector, loc, resp):
-    """Store current filter values when Apply or Reset is clicked"""
-    ctx = callback_context
-    
-    if not ctx.triggered:
-        return {}
-    
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
-    # If Reset was clicked, return empty filters
-    if button_id == 'reset-filters':
-        return {
-            'ph': [],
-            'partner': [],
-            'sector': [],
-            'loc': [],
-            'resp': []
-        }
-    
-    # If Apply was clicked, store current values
-    return {
-        'ph': ph or [],
-        'partner': partner or [],
-        'sector': sector or [],
-        'loc': loc or [],
-        'resp': resp or []
+
+# Show the active tab's pane, hide the others
+app.clientside_callback(
+    """
+    function(tab) {
+        return %s.map(t => t === tab ? {} : {display: 'none'});
     }
+    """ % json.dumps(list(TAB_REQUIREMENTS)),
+    [Output(f'tab-pane-{tab}', 'style') for tab in TAB_REQUIREMENTS],
+    Input('tabs', 'active_tab')
+)
 
-@app.callback(
-    Output('tab-content', 'children'),
-    [Input('tabs', 'active_tab'), 
+# Every data/filter change starts a new generation. A tab switch only asks
+# the server for a render when the tab's pane is from an older generation
+app.clientside_callback(
+    """
+    function(tab, filtered, tax, cfo, other, rendered, request) {
+        const triggered = dash_clientside.callback_context.triggered;
+        const tabOnly = triggered.length > 0 &&
+            triggered.every(t => t.prop_id === 'tabs.active_tab');
+        let generation = (request && request.generation) || 0;
+        if (!tabOnly) {
+            generation += 1;
+        } else if (rendered && rendered[tab] === generation) {
+            return dash_clientside.no_update;
+        }
+        return {tab: tab, generation: generation};
+    }
+    """,
+    Output('render-request', 'data'),
+    [Input('tabs', 'active_tab'),
      Input('filtered-data', 'data'),
-     Input('master-data', 'data'),
-     Input('tax-data', 'data'), 
-     Input('cfo-data', 'data'), 
-     Input('other-data', 'data')]
+     Input('tax-data', 'data'),
+     Input('cfo-data', 'data'),
+     Input('other-data', 'data')],
+    [State('rendered-tabs', 'data'),
+     State('render-request', 'data')]
 )
 
-def render_content(tab, filtered, master, tax, cfo, other):
-    if not filtered:
+@app.callback(
+    [Output(f'tab-pane-{tab}', 'children') for tab in TAB_REQUIREMENTS] +
+    [Output('rendered-tabs', 'data')],
+    Input('render-request', 'data'),
+    [State('filtered-data', 'data'),
+     State('tax-data', 'data'),
+     State('cfo-data', 'data'),
+     State('other-data', 'data'),
+     State('dictionaries', 'data'),
+     State('current-filters', 'data'),
+     State('data-version', 'data'),
+     State('rendered-tabs', 'data')]
+)
+@traced
+def render_tab(request, filtered, tax, cfo, other, dictionaries, filters, version, rendered):
+    """Render the requested tab into its pane and record its generation"""
+    if not request:
+        return [no_update] * (len(TAB_REQUIREMENTS) + 1)
+    
+    tab = request['tab']
+    label_request(tab=tab)
+    content = render_content(tab, filtered, tax, cfo, other, dictionaries, filters, version)
+    rendered = dict(rendered or {})
+    if filtered and filtered.get('rows'):
+        rendered[tab] = request['generation']
+    return [content if t == tab else no_update for t in TAB_REQUIREMENTS] + [rendered]
+
+def render_content(tab, filtered, tax, cfo, other, dictionaries, filters, version):
+    if not filtered or not filtered.get('rows'):
         return html.Div("Loading...", className="text-center p-5")
     
-    df = pd.DataFrame(filtered)
-    master_df = pd.DataFrame(master) if master else df  # Fallback to filtered if master not available
-    tax_df = pd.DataFrame(tax)
-    cfo_df = pd.DataFrame(cfo)
-    other_df = pd.DataFrame(other)
+    builder = TAB_BUILDERS.get(tab)
+    if builder is None:
+        return None
     
-    # NEW: Filter analysis tables based on filtered master data
-    filtered_tax_df = filter_analysis_table(tax_df, df)
-    filtered_cfo_df = filter_analysis_table(cfo_df, df)
-    filtered_other_df = filter_analysis_table(other_df, df)
+    # Materialize only the frames the active tab declares in TAB_REQUIREMENTS.
+    # The cube is sliced by the same filters as filtered-data, so master rows
+    # are only decoded when a tab reads them (or when this worker has no
+    # cube for the version - then the filtered rows are aggregated instead)
+    with timed('dashboard_render_seconds', tab=tab):
+        sources = TAB_REQUIREMENTS[tab]
+        cube = get_cube(version)
+        df = from_store(filtered, dictionaries) if 'master' in sources or cube is None else None
+        cube = cube.slice(filters) if cube is not None else Cube.from_frame(df)
+        
+        # Analysis frames are filtered down to the Practice Heads/Partners left in
+        # master - the cube cells carry exactly those values
+        scope = cube.cells
+        stores = {'tax': tax, 'cfo': cfo, 'other': other}
+        frames = []
+        for source in sources:
+            if source == 'cube':
+                frames.append(cube)
+            elif source == 'master':
+                frames.append(df)
+            else:
+                frames.append(filter_analysis_table(from_store(stores[source], dictionaries), scope))
+        
+        content = builder(*frames)
+    if CALLBACK_TRACE:
+        log_payload(tab, content)
+    return content
+
+def create_overview_tab(cube):
+    if cube.empty:
+        return html.Div('No Data Available for current filters', className = 'text-muted text-center p-5')
     
-    if tab == "overview":
-        return create_overview_tab(df)
-    elif tab == "practice-head":
-        return create_practice_head_tab(df, filtered_tax_df, filtered_cfo_df, filtered_other_df)
-    elif tab == "partner":
-        return create_partner_tab(df, filtered_tax_df, filtered_cfo_df, filtered_other_df)
-    elif tab == "tax":
-        return create_tax_tab(filtered_tax_df)
-    elif tab == "cfo":
-        return create_cfo_tab(filtered_cfo_df)
-    elif tab == "other":
-        return create_other_tab(filtered_other_df)
-    elif tab == "metrics":
-        return create_metrics_tab(df)
-
-def create_overview_tab(df):
-    if df.empty:
-        return html.div('No Data Available for current filters', className = 'text-muted text-center p-5')
+    total_invites = cube.total('rows')
+    total_invitees = cube.total('invitees')
+    total_reg = cube.total('registrations')
     
-    total_invites = len(df)
-    total_invitees = df['numInvitees'].apply(safe_int).sum()
-    total_reg = df['numRegistrations'].apply(safe_int).sum()
-    resp_rate = round((df[df['Response'].str.lower() != 'awaited']['Response'].notna().sum() / len(df) * 100), 2) if len(df) > 0 else 0
+    # Responses other than "Awaited"
+    by_response = cube.rollup(['Response'])
+    answered = by_response[by_response['Response'].astype(str).str.lower() != 'awaited']['rows'].sum()
+    resp_rate = round((answered / total_invites * 100), 2) if total_invites > 0 else 0
 
     
     # Weighted response distribution
-    resp_dist = df.groupby('Response')['Response_Weight'].sum()
+    resp_dist = by_response.set_index('Response')['weighted_responses']
     
-    sector_perf = df.groupby('Sector').agg({
-        'numInvitees': lambda x: x.apply(safe_int).sum(),
-        'numRegistrations': lambda x: x.apply(safe_int).sum()
-    }).reset_index()
+    sector_perf = cube.rollup(['Sector'], ['invitees', 'registrations'])
+    sector_perf.columns = ['Sector', 'numInvitees', 'numRegistrations']
     sector_perf['Conversion'] = sector_perf.apply(
         lambda r: calculate_conversion_rate(r['numRegistrations'], r['numInvitees']), axis=1
     )
 
-    # Add region analysis - filter out None/NaN locations first
-    df_with_location = df[df['Location'].notna()].copy()
-    df_with_location['Region'] = df_with_location['Location'].apply(get_region)
-    
-    region_counts = df_with_location['Region'].value_counts().reset_index()
+    # Add region analysis - Region is missing exactly where Location is
+    region_counts = cube.rollup(['Region'], ['rows']).set_index('Region')['rows'].sort_values(ascending=False).reset_index()
     region_counts.columns = ['Region', 'Count']
     
     return html.Div([
@@ -553,21 +1400,24 @@ def create_overview_tab(df):
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("Response Distribution"),
-                    dbc.CardBody(dcc.Graph(figure=px.pie(values=resp_dist.values, names=resp_dist.index, hole=0.4)))
+                    dbc.CardBody(dcc.Graph(figure=pie_figure(resp_dist)))
                 ], className="shadow-sm")
             ], md=4),
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("Sector Performance"),
-                    dbc.CardBody(dcc.Graph(figure=px.bar(sector_perf, x='Sector', y='Conversion', 
-                                                        color='Conversion', color_continuous_scale='Viridis')))
+                    dbc.CardBody(dcc.Graph(figure=go.Figure(go.Bar(
+                        x=sector_perf['Sector'].to_numpy(), y=sector_perf['Conversion'].to_numpy(),
+                        marker=dict(color=sector_perf['Conversion'].to_numpy(), colorscale='Viridis',
+                                    showscale=True, colorbar_title_text='Conversion')
+                    )).update_layout(xaxis_title='Sector', yaxis_title='Conversion')))
                 ], className="shadow-sm")
             ], md=4),
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("Region-wise Distribution"),
-                    dbc.CardBody(dcc.Graph(figure=px.bar(region_counts, x='Region', y='Count',
-                                                          color='Region', color_discrete_sequence=COLORS)))
+                    dbc.CardBody(dcc.Graph(figure=value_bars(region_counts['Region'], region_counts['Count'], COLORS,
+                                                             xaxis_title='Region', yaxis_title='Count')))
                 ], className="shadow-sm")
             ], md=4),
         ])
@@ -576,36 +1426,34 @@ def create_overview_tab(df):
 
 
 # Group by Practice Head
-def create_practice_head_tab(df, tax_df, cfo_df, other_df):
+def create_practice_head_tab(cube, tax_df, cfo_df, other_df):
     # To show when there is no output in Practice Head Tab
-    if df.empty:
+    if cube.empty:
         return html.Div("No data available for current filters", className="text-muted text-center p-5")
     
-    ph_stats = df.groupby('Practice_Head').agg({
-        'Client_Name': 'count',
-        'numInvitees': lambda x: x.apply(safe_int).sum(),
-        'numRegistrations': lambda x: x.apply(safe_int).sum(),
-        'Response': lambda x: x.notna().sum()
-    }).reset_index()
+    ph_stats = cube.rollup(['Practice_Head'], ['clients', 'invitees', 'registrations', 'responses'])
     ph_stats.columns = ['Practice_Head', 'Invites_Sent', 'Invitees', 'Registrations', 'Responses']
     
-    response_by_ph = df.groupby(['Practice_Head', 'Response'])['Response_Weight'].sum().reset_index(name='Count')
-    sector_by_ph = df.groupby(['Practice_Head', 'Sector']).size().reset_index(name='Count')
-    location_by_ph = df.groupby(['Practice_Head', 'Location']).size().reset_index(name='Count')
+    response_by_ph = cube.rollup(['Practice_Head', 'Response'], ['weighted_responses'])
+    response_by_ph.columns = ['Practice_Head', 'Response', 'Count']
+    sector_by_ph = cube.rollup(['Practice_Head', 'Sector'], ['rows'])
+    sector_by_ph.columns = ['Practice_Head', 'Sector', 'Count']
+    location_by_ph = cube.rollup(['Practice_Head', 'Location'], ['rows'])
+    location_by_ph.columns = ['Practice_Head', 'Location', 'Count']
     
     # Handle empty dataframes for designation analysis
     if not cfo_df.empty:
-        cfo_by_ph = cfo_df.groupby(['Practice_Head', 'Response'])['Response_Weight'].sum().reset_index(name='Count')
+        cfo_by_ph = cfo_df.groupby(['Practice_Head', 'Response'], observed=True)['Response_Weight'].sum().reset_index(name='Count')
     else:
         cfo_by_ph = pd.DataFrame(columns=['Practice_Head', 'Response', 'Count'])
     
     if not tax_df.empty:
-        tax_by_ph = tax_df.groupby(['Practice_Head', 'Response'])['Response_Weight'].sum().reset_index(name='Count')
+        tax_by_ph = tax_df.groupby(['Practice_Head', 'Response'], observed=True)['Response_Weight'].sum().reset_index(name='Count')
     else:
         tax_by_ph = pd.DataFrame(columns=['Practice_Head', 'Response', 'Count'])
     
     if not other_df.empty:
-        other_by_ph = other_df.groupby(['Practice_Head', 'Response'])['Response_Weight'].sum().reset_index(name='Count')
+        other_by_ph = other_df.groupby(['Practice_Head', 'Response'], observed=True)['Response_Weight'].sum().reset_index(name='Count')
     else:
         other_by_ph = pd.DataFrame(columns=['Practice_Head', 'Response', 'Count'])
 
@@ -635,15 +1483,13 @@ def create_practice_head_tab(df, tax_df, cfo_df, other_df):
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("Response Split by Practice Head"),
-                    dbc.CardBody(dcc.Graph(figure=px.bar(response_by_ph, x='Practice_Head', y='Count', 
-                                                        color='Response', barmode='stack')))
+                    dbc.CardBody(dcc.Graph(figure=category_bars(response_by_ph, 'Practice_Head', 'Count', 'Response')))
                 ], className="shadow-sm")
             ], md=6),
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("Sector Distribution"),
-                    dbc.CardBody(dcc.Graph(figure=px.sunburst(sector_by_ph, path=['Practice_Head', 'Sector'], 
-                                                             values='Count')))
+                    dbc.CardBody(dcc.Graph(figure=sunburst_figure(sector_by_ph, 'Practice_Head', 'Sector', 'Count')))
                 ], className="shadow-sm")
             ], md=6),
         ], className="mb-4"),
@@ -652,8 +1498,7 @@ def create_practice_head_tab(df, tax_df, cfo_df, other_df):
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("Location Split"),
-                    dbc.CardBody(dcc.Graph(figure=px.bar(location_by_ph, x='Practice_Head', y='Count', 
-                                                        color='Location', barmode='stack')))
+                    dbc.CardBody(dcc.Graph(figure=category_bars(location_by_ph, 'Practice_Head', 'Count', 'Location')))
                 ], className="shadow-sm")
             ], md=12),
         ], className="mb-4"),
@@ -663,58 +1508,52 @@ def create_practice_head_tab(df, tax_df, cfo_df, other_df):
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("Tax Profiles - Response Split"),
-                    dbc.CardBody(dcc.Graph(figure=px.bar(tax_by_ph, x='Practice_Head', y='Count', 
-                                                        color='Response', barmode='group')))
+                    dbc.CardBody(dcc.Graph(figure=category_bars(tax_by_ph, 'Practice_Head', 'Count', 'Response', barmode='group')))
                 ], className="shadow-sm")
             ], md=4),
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("CFO Profiles - Response Split"),
-                    dbc.CardBody(dcc.Graph(figure=px.bar(cfo_by_ph, x='Practice_Head', y='Count', 
-                                                        color='Response', barmode='group')))
+                    dbc.CardBody(dcc.Graph(figure=category_bars(cfo_by_ph, 'Practice_Head', 'Count', 'Response', barmode='group')))
                 ], className="shadow-sm")
             ], md=4),
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("Other Profiles - Response Split"),
-                    dbc.CardBody(dcc.Graph(figure=px.bar(other_by_ph, x='Practice_Head', y='Count', 
-                                                        color='Response', barmode='group')))
+                    dbc.CardBody(dcc.Graph(figure=category_bars(other_by_ph, 'Practice_Head', 'Count', 'Response', barmode='group')))
                 ], className="shadow-sm")
             ], md=4),
         ], className="mb-4"),
     ])
 
 # Group by Partner Name
-def create_partner_tab(df, tax_df, cfo_df, other_df):
+def create_partner_tab(cube, tax_df, cfo_df, other_df):
 
     # To show where there is not output in Partners Tab
-    if df.empty:
+    if cube.empty:
         return html.Div("No data available for current filters", className="text-muted text-center p-5")
 
-    partner_stats = df.groupby('Partner').agg({
-        'Client_Name': 'count',
-        'numInvitees': lambda x: x.apply(safe_int).sum(),
-        'numRegistrations': lambda x: x.apply(safe_int).sum(),
-        'Response': lambda x: x.notna().sum()
-    }).reset_index()
+    partner_stats = cube.rollup(['Partner'], ['clients', 'invitees', 'registrations', 'responses'])
     partner_stats.columns = ['Partner', 'Invites_Sent', 'Invitees', 'Registrations', 'Responses']
     
-    response_by_partner = df.groupby(['Partner', 'Response'])['Response_Weight'].sum().reset_index(name='Count')
-    location_by_partner = df.groupby(['Partner', 'Location']).size().reset_index(name='Count')
+    response_by_partner = cube.rollup(['Partner', 'Response'], ['weighted_responses'])
+    response_by_partner.columns = ['Partner', 'Response', 'Count']
+    location_by_partner = cube.rollup(['Partner', 'Location'], ['rows'])
+    location_by_partner.columns = ['Partner', 'Location', 'Count']
     
     #Handle empty dataframes for designation analysis
     if not tax_df.empty:
-        tax_by_partner = tax_df.groupby(['Partner', 'Response'])['Response_Weight'].sum().reset_index(name='Count')
+        tax_by_partner = tax_df.groupby(['Partner', 'Response'], observed=True)['Response_Weight'].sum().reset_index(name='Count')
     else:
         tax_by_partner = pd.DataFrame(columns=['Partner', 'Response', 'Count'])
     
     if not cfo_df.empty:
-        cfo_by_partner = cfo_df.groupby(['Partner', 'Response'])['Response_Weight'].sum().reset_index(name='Count')
+        cfo_by_partner = cfo_df.groupby(['Partner', 'Response'], observed=True)['Response_Weight'].sum().reset_index(name='Count')
     else:
         cfo_by_partner = pd.DataFrame(columns=['Partner', 'Response', 'Count'])
     
     if not other_df.empty:
-        other_by_partner = other_df.groupby(['Partner', 'Response'])['Response_Weight'].sum().reset_index(name='Count')
+        other_by_partner = other_df.groupby(['Partner', 'Response'], observed=True)['Response_Weight'].sum().reset_index(name='Count')
     else:
         other_by_partner = pd.DataFrame(columns=['Partner', 'Response', 'Count'])
 
@@ -744,15 +1583,13 @@ def create_partner_tab(df, tax_df, cfo_df, other_df):
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("Response Split by Partner"),
-                    dbc.CardBody(dcc.Graph(figure=px.bar(response_by_partner, x='Partner', y='Count', 
-                                                        color='Response', barmode='stack')))
+                    dbc.CardBody(dcc.Graph(figure=category_bars(response_by_partner, 'Partner', 'Count', 'Response')))
                 ], className="shadow-sm")
             ], md=6),
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("Location Distribution"),
-                    dbc.CardBody(dcc.Graph(figure=px.bar(location_by_partner, x='Partner', y='Count', 
-                                                        color='Location', barmode='stack')))
+                    dbc.CardBody(dcc.Graph(figure=category_bars(location_by_partner, 'Partner', 'Count', 'Location')))
                 ], className="shadow-sm")
             ], md=6),
         ], className="mb-4"),
@@ -762,220 +1599,80 @@ def create_partner_tab(df, tax_df, cfo_df, other_df):
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("Tax Profiles"),
-                    dbc.CardBody(dcc.Graph(figure=px.bar(tax_by_partner, x='Partner', y='Count', 
-                                                        color='Response', barmode='group')))
+                    dbc.CardBody(dcc.Graph(figure=category_bars(tax_by_partner, 'Partner', 'Count', 'Response', barmode='group')))
                 ], className="shadow-sm")
             ], md=4),
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("CFO Profiles"),
-                    dbc.CardBody(dcc.Graph(figure=px.bar(cfo_by_partner, x='Partner', y='Count', 
-                                                        color='Response', barmode='group')))
+                    dbc.CardBody(dcc.Graph(figure=category_bars(cfo_by_partner, 'Partner', 'Count', 'Response', barmode='group')))
                 ], className="shadow-sm")
             ], md=4),
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("Other Profiles"),
-                    dbc.CardBody(dcc.Graph(figure=px.bar(other_by_partner, x='Partner', y='Count', 
-                                                        color='Response', barmode='group')))
+                    dbc.CardBody(dcc.Graph(figure=category_bars(other_by_partner, 'Partner', 'Count', 'Response', barmode='group')))
                 ], className="shadow-sm")
             ], md=4),
         ], className="mb-4"),
         
     ])
 
-def create_tax_tab(tax_df):
-    # To show when where there is no output in Tax Tab
-    if tax_df.empty:
-        return html.Div("No data available for current filters", className="text-muted text-center p-5")
-
-    total = len(tax_df)
-    registered = len(tax_df[tax_df['Response_1'].str.lower() == 'registered'])
-    responses = tax_df.groupby('Response')['Response_Weight'].sum()
-    
-    # Region analysis for Tax contacts
-    tax_df_with_location = tax_df[tax_df['Location'].notna()].copy()
-    tax_df_with_location['Response_Clean'] = tax_df_with_location['Response_1'].astype(str).str.strip().str.lower()
-    tax_df_with_location['Region'] = tax_df_with_location['Location'].apply(get_region)
-    
-    region_stats = tax_df_with_location.groupby('Region').agg({
-        'Phone_Number': 'count',
-        'Response_Clean': lambda x: (x == 'registered').sum()
-    }).reset_index()
-    region_stats.columns = ['Region', 'Total_Invited', 'Registered']
-
-    # Calculate positive responses by region
-    positive_responses = tax_df_with_location[tax_df_with_location['Response_Clean'] == 'positive']
-    if len(positive_responses) > 0:
-        positive_by_region = positive_responses.groupby('Region').size().reset_index(name='Positive_Responses')
-        region_stats = region_stats.merge(positive_by_region, on='Region', how='left')
-    else:
-        region_stats['Positive_Responses'] = 0
-
-    region_stats['Positive_Responses'] = region_stats['Positive_Responses'].fillna(0).astype(int)
+def contact_region_stats(contact_df, spec):
+    """
+    Invited / registered / positive contacts per region, in one groupby.
+
+    Only contacts with a location count. The response is normalized once
+    per distinct value and every count is a boolean sum, so there is no
+    per-row lambda, copy or merge.
+    """
+    codes, uniques = pd.factorize(contact_df[spec['response']])
+    clean = pd.Index(uniques).astype(str).str.strip().str.lower()
+    # Code -1 (missing response) picks the trailing False
+    registered = np.append(clean == 'registered', False)[codes]
+    positive = np.append(clean == 'positive', False)[codes]
+
+    located = contact_df[spec['location']].notna()
+    counts = pd.DataFrame({
+        'Total_Invited': contact_df[spec['phone']].notna(),
+        'Registered': registered,
+        'Positive_Responses': positive,
+    }, index=contact_df.index)[located]
+    region_stats = (counts.groupby(contact_df['Region'][located], observed=True)
+                    .sum().astype(int).reset_index())
 
     # Calculate Total Confirmed = Registered + Positive
     region_stats['Total_Confirmed'] = region_stats['Registered'] + region_stats['Positive_Responses']
     region_stats['Unregistered'] = region_stats['Total_Invited'] - region_stats['Total_Confirmed']
     region_stats['Registration_Rate'] = (region_stats['Total_Confirmed'] / region_stats['Total_Invited'] * 100).round(2)
-    
+
     # Filter out regions with 0 invited (empty regions)
     region_stats = region_stats[region_stats['Total_Confirmed'] > 0]
-    
-    # Sort by total for better visualization
-    region_stats = region_stats.sort_values('Total_Confirmed', ascending=False)
-    
-    return html.Div([
-        html.H4("Tax Contacts Analysis", className="mb-4"),
-        
-        dbc.Row([
-            dbc.Col(create_summary_card("Total Invited", total, "envelope", "primary"), md=4),
-            dbc.Col(create_summary_card("Total Registered", registered, "check-circle", "success"), md=4),
-            dbc.Col(create_summary_card("Response Rate", 
-                                       f"{round(tax_df[tax_df['Response'].str.lower() != 'awaited']['Response'].notna().sum()/total*100,2) if total>0 else 0}%", 
-                                       "percentage", "info"), md=4),
-        ], className="mb-4"),   
-        
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Response Status Distribution"),
-                    dbc.CardBody(dcc.Graph(figure=px.pie(values=responses.values, names=responses.index, hole=0.4)))
-                ], className="shadow-sm")
-            ], md=6),
-
-            # NEW: Region-wise Analysis - Grouped Bar Chart    
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Region-wise Tax Contact Total Confirmations (Bar Chart)"),
-                    dbc.CardBody(dcc.Graph(
-                        figure=go.Figure(data=[
-                            go.Bar(name='Total Confirmed', x=region_stats['Region'], y=region_stats['Total_Confirmed'], 
-                                    marker_color='#9467bd', text=region_stats['Total_Confirmed'], textposition='auto',
-                                    hovertemplate='<b>%{x}</b><br>Total Confirmed: %{y}<extra></extra>')
-                        ]).update_layout(
-                            barmode='group',
-                            xaxis_title="Region",
-                            yaxis_title="Count",
-                            hovermode='x unified',
-                            showlegend=True,
-                            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-                        )
-                    ))
-                ], className="shadow-sm")
-            ], md=6),
-        ], className="mb-4"),
-
-
 
-        #    This section is commented out as per the new requirement it shows Registrations by Response separately it seems redundant as of now but if needed in future can be uncommented    
-        #     dbc.Col([
-        #         dbc.Card([
-        #             dbc.CardHeader("Registrations by Response"),
-        #             dbc.CardBody(dcc.Graph(figure=px.bar(responses.reset_index(), x='Response', y='Response_Weight')))
-        #         ], className="shadow-sm")
-        #     ], md=6),
-        # ], className="mb-4"),       
-        
-        # Alternative: Line Chart for comparison
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Region-wise Tax Contact Total Confirmations (Line Chart)"),
-                    dbc.CardBody(dcc.Graph(
-                        figure=go.Figure(data=[
-                            go.Scatter(name='Total Confirmed', x=region_stats['Region'], y=region_stats['Total_Confirmed'], 
-                                    mode='lines+markers+text', marker=dict(size=10, color='#9467bd'),
-                                    line=dict(width=3, color='#9467bd'),
-                                    text=region_stats['Total_Confirmed'], textposition='top center',
-                                    hovertemplate='<b>%{x}</b><br>Total Confirmed: %{y}<extra></extra>')
-                        ]).update_layout(
-                            xaxis_title="Region",
-                            yaxis_title="Count",
-                            hovermode='x unified',
-                            showlegend=True,
-                            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-                        )
-                    ))
-                ], className="shadow-sm")
-            ], md=12),
-        ], className="mb-4"),
-    
-        # Optional: Add a stacked percentage view
-        # Optional : Add a stacked percentage view which shows registration rate by region including unregistered and registered only for Tax contacts
-        # dbc.Row([
-        #     dbc.Col([
-        #         dbc.Card([
-        #             dbc.CardHeader("Registration Rate by Region"),
-        #             dbc.CardBody(dcc.Graph(
-        #                 figure=px.bar(region_stats, x='Region', y=['Registered', 'Unregistered'],
-        #                             barmode='stack',
-        #                             color_discrete_map={'Registered': '#2ca02c', 'Unregistered': '#d62728'},
-        #                             labels={'value': 'Count', 'variable': 'Status'})
-        #                 .update_traces(
-        #                     text=region_stats[['Registered', 'Unregistered']].values.tolist(),
-        #                     textposition='inside'
-        #                 )
-        #                 .update_layout(
-        #                     xaxis_title="Region",
-        #                     yaxis_title="Count",
-        #                     showlegend=True
-        #                 )
-        #             ))
-        #         ], className="shadow-sm")
-        #     ], md=12),
-        # ])
-    ])
-    
+    # Sort by total for better visualization
+    return region_stats.sort_values('Total_Confirmed', ascending=False)
 
-def create_cfo_tab(cfo_df):
-    # To show where there is not output in CFO_tab
-    if cfo_df.empty:
+def create_contact_tab(contact_df, spec):
+    """Tax / CFO / Other tab, laid out from the columns in CONTACT_TABS"""
+    # To show when there is no output in the tab
+    if contact_df.empty:
         return html.Div("No data available for current filters", className="text-muted text-center p-5")
 
-    total = len(cfo_df)
-    registered = len(cfo_df[cfo_df['Response_7'].str.lower() == 'registered'])
-    responses = cfo_df.groupby('Response')['Response_Weight'].sum()
-    
-    # Region analysis for CFO contacts
-    cfo_df_with_location = cfo_df[cfo_df['Location_6'].notna()].copy()
-    cfo_df_with_location['Response_Clean'] = cfo_df_with_location['Response_7'].astype(str).str.strip().str.lower()
-    cfo_df_with_location['Region'] = cfo_df_with_location['Location_6'].apply(get_region)
-    
-    region_stats = cfo_df_with_location.groupby('Region').agg({
-        'Phone_Number_4': 'count',  # Total count
-        'Response_Clean': lambda x: (x == 'registered').sum()  # Total registered (case-insensitive)
-    }).reset_index()
-    region_stats.columns = ['Region', 'Total_Invited', 'Registered']
-
-    # Calculate positive responses by region
-    positive_responses = cfo_df_with_location[cfo_df_with_location['Response_Clean'] == 'positive']
-    if len(positive_responses) > 0:
-        positive_by_region = positive_responses.groupby('Region').size().reset_index(name='Positive_Responses')
-        region_stats = region_stats.merge(positive_by_region, on='Region', how='left')
-    else:
-        region_stats['Positive_Responses'] = 0
-
-    region_stats['Positive_Responses'] = region_stats['Positive_Responses'].fillna(0).astype(int)
-
-    # Calculate Total Confirmed = Registered + Positive
-    region_stats['Total_Confirmed'] = region_stats['Registered'] + region_stats['Positive_Responses']
-    region_stats['Unregistered'] = region_stats['Total_Invited'] - region_stats['Total_Confirmed']
-    region_stats['Registration_Rate'] = (region_stats['Total_Confirmed'] / region_stats['Total_Invited'] * 100).round(2)
-
-    # Filter out regions with 0 invited (empty regions)
-    region_stats = region_stats[region_stats['Total_Confirmed'] > 0]
-
-    region_stats = region_stats.sort_values('Total_Confirmed', ascending=False)
+    title = spec['title']
+    total = len(contact_df)
+    registered = int((contact_df[spec['response']].str.lower() == 'registered').sum())
+    responses = contact_df.groupby('Response', observed=True)['Response_Weight'].sum()
+    answered = contact_df['Response'].notna() & (contact_df['Response'].str.lower() != 'awaited')
+    region_stats = contact_region_stats(contact_df, spec)
     
     return html.Div([
-        html.H4("CFO Contacts Analysis", className="mb-4"),
+        html.H4(f"{title} Contacts Analysis", className="mb-4"),
         
         dbc.Row([
             dbc.Col(create_summary_card("Total Invited", total, "envelope", "primary"), md=4),
             dbc.Col(create_summary_card("Total Registered", registered, "check-circle", "success"), md=4),
             dbc.Col(create_summary_card("Response Rate", 
-                                       f"{round(cfo_df[cfo_df['Response'].str.lower() != 'awaited']['Response'].notna().sum()/total*100,2) if total>0 else 0}%", 
+                                       f"{round(answered.sum()/total*100,2) if total>0 else 0}%", 
                                        "percentage", "info"), md=4),
         ], className="mb-4"),
         
@@ -983,14 +1680,14 @@ def create_cfo_tab(cfo_df):
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("Response Status Distribution"),
-                    dbc.CardBody(dcc.Graph(figure=px.pie(values=responses.values, names=responses.index, hole=0.4)))
+                    dbc.CardBody(dcc.Graph(figure=pie_figure(responses)))
                 ], className="shadow-sm")
             ], md=6),
 
-            # NEW: Region-wise Analysis for CFO - Grouped Bar Chart
+            # Region-wise Analysis - Grouped Bar Chart
             dbc.Col([
                 dbc.Card([
-                    dbc.CardHeader("Region-wise CFO Contact Total Confirmations (Bar Chart)"),
+                    dbc.CardHeader(f"Region-wise {title} Contact Total Confirmations (Bar Chart)"),
                     dbc.CardBody(dcc.Graph(
                         figure=go.Figure(data=[
                             go.Bar(name='Total Confirmed', x=region_stats['Region'], y=region_stats['Total_Confirmed'], 
@@ -1008,24 +1705,12 @@ def create_cfo_tab(cfo_df):
                 ], className="shadow-sm")
             ], md=6),
         ], className="mb-4"),
-
-            # This section is commented out as per the new requirement it shows Count of CFO by sector  separately it seems redundant as of now but if needed in future can be uncommented
-            # dbc.Col([
-            #     dbc.Card([
-            #         dbc.CardHeader("CFO by Sector"),
-            #         dbc.CardBody(dcc.Graph(figure=px.bar(cfo_df.groupby('Sector').size().reset_index(name='Count'), 
-            #                                             x='Sector', y='Count')))
-            #     ], className="shadow-sm")
-            # ], md=6),
-        # ], className="mb-4"),
-        
-                     
         
         # Alternative: Line Chart for comparison
         dbc.Row([
             dbc.Col([
                 dbc.Card([
-                    dbc.CardHeader("Region-wise CFO Contact Total Confirmations (Line Chart)"),
+                    dbc.CardHeader(f"Region-wise {title} Contact Total Confirmations (Line Chart)"),
                     dbc.CardBody(dcc.Graph(
                         figure=go.Figure(data=[
                             go.Scatter(name='Total Confirmed', x=region_stats['Region'], y=region_stats['Total_Confirmed'], 
@@ -1045,11 +1730,8 @@ def create_cfo_tab(cfo_df):
             ], md=12),
         ], className="mb-4"),
     
-
-
-        # Optionsl: Add a stacked percentage view
-        #  Optional: Add a stacked percentage view which shows registration rate by region including unregistered and registered only for CFO contacts
-        #  dbc.Row([
+        # Optional: Add a stacked percentage view which shows registration rate by region including unregistered and registered
+        # dbc.Row([
         #     dbc.Col([
         #         dbc.Card([
         #             dbc.CardHeader("Registration Rate by Region"),
@@ -1073,153 +1755,33 @@ def create_cfo_tab(cfo_df):
         # ])
     ])
 
-def create_other_tab(other_df):
-    # To show when there is no output in Others tab
-    if other_df.empty:
-        return html.Div("No data available for current filters", className="text-muted text-center p-5")
-
-    total = len(other_df)
-    registered = len(other_df[other_df['Response_13'].str.lower() == 'registered'])
-    responses = other_df.groupby('Response')['Response_Weight'].sum()
-    
-    # Region analysis for Other contacts
-    other_df_with_location = other_df[other_df['Location_12'].notna()].copy()
-    other_df_with_location['Response_Clean'] = other_df_with_location['Response_13'].astype(str).str.strip().str.lower()
-    other_df_with_location['Region'] = other_df_with_location['Location_12'].apply(get_region)
-    
-    region_stats = other_df_with_location.groupby('Region').agg({
-    'Phone_Number_10': 'count',  # Total count
-    'Response_Clean': lambda x: (x == 'registered').sum()  # Total registered (case-insensitive)
-    }).reset_index()
-    region_stats.columns = ['Region', 'Total_Invited', 'Registered']
-
-    # Calculate positive responses by region
-    positive_responses = other_df_with_location[other_df_with_location['Response_Clean'] == 'positive']
-    if len(positive_responses) > 0:
-        positive_by_region = positive_responses.groupby('Region').size().reset_index(name='Positive_Responses')
-        region_stats = region_stats.merge(positive_by_region, on='Region', how='left')
-    else:
-        region_stats['Positive_Responses'] = 0
-
-    region_stats['Positive_Responses'] = region_stats['Positive_Responses'].fillna(0).astype(int)
-
-    # Calculate Total Confirmed = Registered + Positive
-    region_stats['Total_Confirmed'] = region_stats['Registered'] + region_stats['Positive_Responses']
-    region_stats['Unregistered'] = region_stats['Total_Invited'] - region_stats['Total_Confirmed']
-    region_stats['Registration_Rate'] = (region_stats['Total_Confirmed'] / region_stats['Total_Invited'] * 100).round(2)
-
-    # Filter out regions with 0 invited (empty regions)
-    region_stats = region_stats[region_stats['Total_Confirmed'] > 0]
-
-    region_stats = region_stats.sort_values('Total_Confirmed', ascending=False)
-    
-    return html.Div([
-        html.H4("Other Contacts Analysis", className="mb-4"),
-        
-        dbc.Row([
-            dbc.Col(create_summary_card("Total Invited", total, "envelope", "primary"), md=4),
-            dbc.Col(create_summary_card("Total Registered", registered, "check-circle", "success"), md=4),
-            dbc.Col(create_summary_card("Response Rate", 
-                                       f"{round(other_df[other_df['Response'].str.lower() != 'awaited']['Response'].notna().sum()/total*100,2) if total>0 else 0}%", 
-                                       "percentage", "info"), md=4),
-        ], className="mb-4"),
-        
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Response Status Distribution"),
-                    dbc.CardBody(dcc.Graph(figure=px.pie(values=responses.values, names=responses.index, hole=0.4)))
-                ], className="shadow-sm")
-            ], md=6),
-        
-        # NEW: Region-wise Analysis for Other contacts - Grouped Bar Chart
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Region-wise Other Contact Total Confirmations (Bar Chart)"),
-                    dbc.CardBody(dcc.Graph(
-                        figure=go.Figure(data=[
-                            go.Bar(name='Total Confirmed', x=region_stats['Region'], y=region_stats['Total_Confirmed'], 
-                                marker_color='#9467bd', text=region_stats['Total_Confirmed'], textposition='auto',
-                                hovertemplate='<b>%{x}</b><br>Total Confirmed: %{y}<extra></extra>')
-                        ]).update_layout(
-                            barmode='group',
-                            xaxis_title="Region",
-                            yaxis_title="Count",
-                            hovermode='x unified',
-                            showlegend=True,
-                            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-                        )
-                    ))
-                ], className="shadow-sm")
-            ], md=6),
-        ], className="mb-4"),
-        
-        # Alternative: Line Chart for comparison
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Region-wise Other Contact Total Confirmations (Line Chart)"),
-                    dbc.CardBody(dcc.Graph(
-                        figure=go.Figure(data=[
-                            go.Scatter(name='Total Confirmed', x=region_stats['Region'], y=region_stats['Total_Confirmed'], 
-                                    mode='lines+markers+text', marker=dict(size=10, color='#9467bd'),
-                                    line=dict(width=3, color='#9467bd'),
-                                    text=region_stats['Total_Confirmed'], textposition='top center',
-                                    hovertemplate='<b>%{x}</b><br>Total Confirmed: %{y}<extra></extra>')
-                        ]).update_layout(
-                            xaxis_title="Region",
-                            yaxis_title="Count",
-                            hovermode='x unified',
-                            showlegend=True,
-                            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-                        )
-                    ))
-                ], className="shadow-sm")
-            ], md=12),
-        ], className="mb-4"),
+def create_tax_tab(tax_df):
+    return create_contact_tab(tax_df, CONTACT_TABS['tax'])
 
+def create_cfo_tab(cfo_df):
+    return create_contact_tab(cfo_df, CONTACT_TABS['cfo'])
 
-        # # Optionsl: Add a stacked percentage view
-        # Optional: Add a stacked percentage view which shows registration rate by region including unregistered and registered only for Other contacts
-        # dbc.Row([
-        #     dbc.Col([
-        #         dbc.Card([
-        #             dbc.CardHeader("Registration Rate by Region"),
-        #             dbc.CardBody(dcc.Graph(
-        #                 figure=px.bar(region_stats, x='Region', y=['Registered', 'Unregistered'],
-        #                             barmode='stack',
-        #                             color_discrete_map={'Registered': '#2ca02c', 'Unregistered': '#d62728'},
-        #                             labels={'value': 'Count', 'variable': 'Status'})
-        #                 .update_traces(
-        #                     text=region_stats[['Registered', 'Unregistered']].values.tolist(),
-        #                     textposition='inside'
-        #                 )
-        #                 .update_layout(
-        #                     xaxis_title="Region",
-        #                     yaxis_title="Count",
-        #                     showlegend=True
-        #                 )
-        #             ))
-        #         ], className="shadow-sm")
-        #     ], md=12),
-        # ])
-    ])
+def create_other_tab(other_df):
+    return create_contact_tab(other_df, CONTACT_TABS['other'])
 
-def create_metrics_tab(df):
+def create_metrics_tab(cube, df):
     # To show when there is no output in the metrics tab
-    if df.empty:
+    if cube.empty:
         return html.Div("No data available for current filters", className="text-muted text-center p-5")
     
-    total_invitees = df['numInvitees'].apply(safe_int).sum()
-    total_reg = df['numRegistrations'].apply(safe_int).sum()
+    total_clients = cube.total('rows')
+    total_invitees = cube.total('invitees')
+    total_reg = cube.total('registrations')
+    total_responses = cube.total('responses')
     conversion_rate = calculate_conversion_rate(total_reg, total_invitees)
-    response_rate = round((df['Response'].notna().sum() / len(df) * 100), 2) if len(df) > 0 else 0
-    pending_followups = len(df[df['Response'].isna()])
+    response_rate = round((total_responses / total_clients * 100), 2) if total_clients > 0 else 0
+    pending_followups = total_clients - total_responses
     
     # Circle back analysis
-    circle_back_df = df[df['Circle_Back_Dt'].notna()]
+    circle_backs = cube.total('circle_backs')
+    response_weights = cube.rollup(['Response'], ['weighted_responses'])
     
-    # Trend analysis by date
+    # Trend analysis by date - per day, so it stays on the raw rows
     if 'Invite_Dt' in df.columns:
         df['Invite_Dt_parsed'] = pd.to_datetime(df['Invite_Dt'], errors='coerce')
         invite_trend = df.groupby(df['Invite_Dt_parsed'].dt.date).size().reset_index(name='Count')
@@ -1234,7 +1796,7 @@ def create_metrics_tab(df):
             dbc.Col(create_summary_card("Conversion Rate", f"{conversion_rate}%", "chart-line", "success"), md=3),
             dbc.Col(create_summary_card("Response Rate", f"{response_rate}%", "percentage", "info"), md=3),
             dbc.Col(create_summary_card("Pending Follow-ups", pending_followups, "clock", "warning"), md=3),
-            dbc.Col(create_summary_card("Circle Backs", len(circle_back_df), "redo", "danger"), md=3),
+            dbc.Col(create_summary_card("Circle Backs", circle_backs, "redo", "danger"), md=3),
         ], className="mb-4"),
         
         dbc.Row([
@@ -1242,8 +1804,8 @@ def create_metrics_tab(df):
                 dbc.Card([
                     dbc.CardHeader("Invite Trend Over Time"),
                     dbc.CardBody(dcc.Graph(
-                        figure=px.line(invite_trend, x='Date', y='Invites', 
-                                      title="Daily Invite Distribution") if not invite_trend.empty 
+                        figure=line_figure(invite_trend['Date'], invite_trend['Invites'], title="Daily Invite Distribution",
+                                           xaxis_title='Date', yaxis_title='Invites') if not invite_trend.empty 
                         else go.Figure().add_annotation(text="No date data available", showarrow=False)
                     ))
                 ], className="shadow-sm")
@@ -1257,7 +1819,7 @@ def create_metrics_tab(df):
                     dbc.CardBody(dcc.Graph(
                         figure=go.Figure(go.Funnel(
                             y=['Total Clients', 'Total Invitees', 'Responses', 'Registrations'],
-                            x=[len(df), total_invitees, df['Response'].notna().sum(), total_reg],
+                            x=[total_clients, total_invitees, total_responses, total_reg],
                             textinfo="value+percent initial"
                         ))
                     ))
@@ -1267,11 +1829,9 @@ def create_metrics_tab(df):
                 dbc.Card([
                     dbc.CardHeader("Response Status Breakdown"),
                     dbc.CardBody(dcc.Graph(
-                        figure=px.bar(
-                            df.groupby('Response')['Response_Weight'].sum().reset_index(),
-                            x='Response', y='Response_Weight',
-                            color='Response',
-                            title="Response Distribution"
+                        figure=value_bars(
+                            response_weights['Response'], response_weights['weighted_responses'],
+                            title="Response Distribution", xaxis_title='Response', yaxis_title='Response_Weight'
                         )
                     ))
                 ], className="shadow-sm")
@@ -1281,6 +1841,18 @@ def create_metrics_tab(df):
 
 
 
+# Tab -> builder; its arguments are the TAB_REQUIREMENTS sources, in order
+TAB_BUILDERS = {
+    'overview': create_overview_tab,
+    'practice-head': create_practice_head_tab,
+    'partner': create_partner_tab,
+    'tax': create_tax_tab,
+    'cfo': create_cfo_tab,
+    'other': create_other_tab,
+    'metrics': create_metrics_tab,
+}
+
+
 # This section is commented out as data table exports are not needed as of now uncomment to use it
 '''  .
 # Export callbacks
@@ -1340,18 +1912,108 @@ def export_other_table(n_clicks, data):
         return dcc.send_data_frame(df.to_excel, "other_contacts_data.xlsx", index=False)
 '''
         
+@app.server.route('/data-version')
+def data_version():
+    """
+    Current data version as JSON. Long-poll with ?since=<version>&wait=<seconds>:
+    the request returns as soon as the version differs from `since`, or
+    after `wait` seconds (at most DATA_VERSION_MAX_WAIT). Long-polling holds
+    a worker, so run gunicorn with --threads when clients use it.
+    """
+    since = flask.request.args.get('since')
+    wait = min(float(flask.request.args.get('wait', 0) or 0), DATA_VERSION_MAX_WAIT)
+    deadline = time.monotonic() + wait
+
+    version = get_data_version()
+    while since and version == since and time.monotonic() < deadline:
+        time.sleep(min(DATA_VERSION_TTL, max(deadline - time.monotonic(), 0)))
+        version = get_data_version()
+
+    return flask.jsonify(version=version, changed=version != since)
+
 @app.server.route('/health')
 def health_check():
     conn = get_db_connection()
     if conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM tax_summit_master_data")
-        count = cursor.fetchone()[0]
+        count = None
+        with timed('dashboard_db_query_seconds', query='health'):
+            summary = resolve_table_name(conn, SUMMARY_TABLE)
+            if summary:
+                # O(groups) - NULL until the summary has master groups
+                cursor.execute(f"SELECT SUM(Row_Count) FROM `{summary}` WHERE Source = 'master'")
+                count = cursor.fetchone()[0]
+            if count is None:
+                cursor.execute(f"SELECT COUNT(*) FROM `{resolve_table_name(conn, MASTER_TABLE)}`")
+                count = cursor.fetchone()[0]
         cursor.close()
         conn.close()
         return f"OK - {count} records in master table"
     return "ERROR - Cannot connect to database", 500
 
+@app.server.route('/metrics')
+def metrics_endpoint():
+    """Rolling callback / query / step / figure timings and payload sizes for Prometheus"""
+    return flask.Response(metrics.prometheus(), mimetype='text/plain; version=0.0.4')
+
+@app.server.after_request
+def record_payload(response):
+    """Request/response sizes of callback requests, labelled by their callback"""
+    labels = flask.g.get('metric_labels')
+    if labels and not response.direct_passthrough:
+        metrics.observe('dashboard_request_bytes', flask.request.content_length or 0, **labels)
+        metrics.observe('dashboard_response_bytes', response.calculate_content_length() or 0, **labels)
+    return response
+
+def profile_mode():
+    """'cprofile', 'pyinstrument' or None, from ?profile= on the request or its page"""
+    flag = flask.request.args.get('profile')
+    if flag is None and flask.request.referrer:
+        flag = parse_qs(urlparse(flask.request.referrer).query).get('profile', [None])[0]
+    if not flag or flag.lower() in ('0', 'false', 'no'):
+        return None
+    return 'pyinstrument' if flag.lower() == 'pyinstrument' else 'cprofile'
+
+@app.server.before_request
+def start_profile():
+    if not PROFILE_ENABLED or flask.request.path == '/metrics':
+        return
+    mode = profile_mode()
+    if mode == 'pyinstrument':
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            print("⚠️  pyinstrument is not installed, profiling with cProfile")
+            mode = 'cprofile'
+        else:
+            flask.g.profiler = (mode, Profiler())
+            flask.g.profiler[1].start()
+            return
+    if mode == 'cprofile':
+        flask.g.profiler = (mode, cProfile.Profile())
+        flask.g.profiler[1].enable()
+
+@app.server.teardown_request
+def dump_profile(exc):
+    """Write the request's profile to PROFILE_DIR (runs even when the request failed)"""
+    mode, profiler = flask.g.pop('profiler', (None, None))
+    if not profiler:
+        return
+    labels = flask.g.get('metric_labels') or {}
+    parts = [str(v) for v in labels.values()] or [flask.request.path.strip('/').replace('/', '_') or 'index']
+    name = '-'.join([datetime.now().strftime('%Y%m%d-%H%M%S-%f')] + parts)
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    if mode == 'pyinstrument':
+        profiler.stop()
+        path = os.path.join(PROFILE_DIR, f"{name}.html")
+        with open(path, 'w') as f:
+            f.write(profiler.output_html())
+    else:
+        profiler.disable()
+        path = os.path.join(PROFILE_DIR, f"{name}.prof")
+        profiler.dump_stats(path)
+    print(f"🔬 Profile written: {path}")
+
 if __name__ == '__main__':
     port = int(os.getenv("PORT", 8050))
     app.run(debug=False, host='0.0.0.0', port=port)  
\ No newline at end of file
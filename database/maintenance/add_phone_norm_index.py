@@ -0,0 +1,178 @@
+import mysql.connector
+from mysql.connector import Error
+import os
+import sys
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from database.phone_utils import NORMALIZED_PHONE_COLUMNS, NORMALIZED_PHONE_LENGTH, normalized_phone_sql
+from database.schema_catalog import get_catalog, invalidate_catalog
+
+load_dotenv()
+
+# (table, raw phone column, name column paired with the phone in lookups)
+PHONE_TABLES = [
+    ('tax_summit_master_data', 'Phone_Number', 'Client_Name'),
+    ('tax_summit_master_data', 'Phone_Number_4', 'Client_Name'),
+    ('tax_summit_master_data', 'Phone_Number_10', 'Client_Name'),
+    ('Tax_Persons_Analysis', 'Phone_Number', 'Client_Name'),
+    ('CFO_Persons_Analysis', 'Phone_Number_4', 'Company_Name'),
+    ('Other_Persons_Analysis', 'Phone_Number_10', 'Company_Name'),
+    ('Tax_Persons_details', 'Phone_Number', 'Client_Name'),
+    ('CFO_Persons_details', 'Phone_Number_4', 'Company_Name'),
+    ('Other_Persons_Details', 'Phone_Number_10', 'Company_Name'),
+]
+
+def connect_to_mysql():
+    """Establish connection to MySQL database"""
+    try:
+        connection = mysql.connector.connect(
+            host=os.getenv("DB_HOST"),
+            user=os.getenv("DB_USER"),
+            password=os.getenv("DB_PASS"),
+            database=os.getenv("DB_NAME"),
+            port=int(os.getenv("DB_PORT", 3306))
+        )
+        if connection.is_connected():
+            print(f"✓ Connected to MySQL database")
+            return connection
+    except Error as e:
+        print(f"✗ Error connecting to MySQL: {e}")
+        return None
+
+def get_table_columns(connection, table):
+    """Return the column names of a table (empty set if it doesn't exist)"""
+    try:
+        return get_catalog(connection).column_set(table)
+    except Error:
+        return set()
+
+def add_normalized_phone_columns(connection):
+    """Add STORED generated normalized-phone columns plus (phone, name) indexes"""
+    cursor = connection.cursor()
+
+    print("\n" + "="*70)
+    print("  🔧 ADDING NORMALIZED PHONE COLUMNS")
+    print("="*70 + "\n")
+
+    for table, phone_col, name_col in PHONE_TABLES:
+        norm_col = NORMALIZED_PHONE_COLUMNS[phone_col]
+        columns = get_table_columns(connection, table)
+
+        if not columns:
+            print(f"[{table}] ⚠️  Table not found, skipping")
+            continue
+        if phone_col not in columns:
+            print(f"[{table}] ⚠️  No {phone_col} column, skipping")
+            continue
+
+        print(f"[{table}] {phone_col} → {norm_col}")
+
+        if norm_col in columns:
+            print(f"    ℹ️  {norm_col} already exists")
+        else:
+            try:
+                cursor.execute(f"""
+                    ALTER TABLE `{table}`
+                    ADD COLUMN `{norm_col}` VARCHAR({NORMALIZED_PHONE_LENGTH})
+                        GENERATED ALWAYS AS {normalized_phone_sql(phone_col)} STORED
+                """)
+                print(f"    ✓ Added generated column {norm_col}")
+            except Error as e:
+                print(f"    ⚠️  Could not add {norm_col}: {e}")
+                continue
+
+        index_name = f"idx_{norm_col.lower()}_{name_col.lower()}"
+        index_cols = f"`{norm_col}`, `{name_col}`" if name_col in columns else f"`{norm_col}`"
+        try:
+            cursor.execute(f"ALTER TABLE `{table}` ADD INDEX `{index_name}` ({index_cols})")
+            print(f"    ✓ Added index {index_name} ({index_cols.replace('`', '')})")
+        except Error as e:
+            if e.errno == 1061:  # Duplicate key name
+                print(f"    ℹ️  Index {index_name} already exists")
+            else:
+                print(f"    ⚠️  Could not add index: {e}")
+
+    connection.commit()
+    cursor.close()
+    invalidate_catalog(connection)
+
+def report_normalized_duplicates(connection):
+    """Count duplicate normalized phones on master (index-only scans)"""
+    cursor = connection.cursor()
+
+    print("\n" + "="*70)
+    print("  🔍 DUPLICATES BY NORMALIZED PHONE (master)")
+    print("="*70 + "\n")
+
+    master_columns = get_table_columns(connection, 'tax_summit_master_data')
+
+    for phone_col, norm_col in NORMALIZED_PHONE_COLUMNS.items():
+        if norm_col not in master_columns:
+            continue
+
+        cursor.execute(f"""
+            SELECT COUNT(*), COALESCE(SUM(n), 0) FROM (
+                SELECT COUNT(*) AS n
+                FROM tax_summit_master_data
+                WHERE `{norm_col}` IS NOT NULL
+                GROUP BY `{norm_col}`
+                HAVING COUNT(*) > 1
+            ) d
+        """)
+        phones, rows = cursor.fetchone()
+
+        cursor.execute(f"""
+            SELECT COUNT(*) FROM (
+                SELECT 1
+                FROM tax_summit_master_data
+                WHERE `{phone_col}` IS NOT NULL AND `{phone_col}` != ''
+                GROUP BY `{phone_col}`
+                HAVING COUNT(*) > 1
+            ) d
+        """)
+        raw_phones = cursor.fetchone()[0]
+
+        print(f"  {norm_col:15} {phones} duplicate numbers across {rows} rows "
+              f"(raw {phone_col}: {raw_phones})")
+
+    cursor.close()
+
+def main():
+    print("\n" + "="*70)
+    print("  📞 PHONE NORMALIZATION INDEX")
+    print("="*70)
+    print("\n  Adds Phone_Norm / Phone_Norm_4 / Phone_Norm_10 generated columns")
+    print("  (E.164, default country code from PHONE_COUNTRY_CODE) and indexes")
+    print("  them together with the client / company name.")
+    print("="*70)
+
+    connection = connect_to_mysql()
+    if not connection:
+        return
+
+    try:
+        if '--yes' not in sys.argv:
+            print("\nThis rebuilds master, analysis and detail tables. Continue? (yes/no): ", end='')
+            response = input().strip().lower()
+            if response not in ['yes', 'y']:
+                print("\n❌ Cancelled. No changes made.")
+                return
+
+        add_normalized_phone_columns(connection)
+        report_normalized_duplicates(connection)
+
+        print("\n" + "="*70)
+        print("  ✅ NORMALIZED PHONE INDEXES READY")
+        print("="*70)
+        print("\n💡 fix_duplicates_phone.py now groups and builds idx_phone_client")
+        print("   on the normalized columns automatically.")
+        print("="*70 + "\n")
+
+    finally:
+        if connection.is_connected():
+            connection.close()
+            print("✓ Connection closed\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+import mysql.connector
+from mysql.connector import Error
+import os
+import re
+import sys
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from database.schema_catalog import get_catalog
+
+load_dotenv()
+
+# Lookups issued from Python rather than triggers: (source, table, equality columns)
+SCRIPT_PREDICATES = [
+    ('fix_duplicates_phone.py', 'tax_summit_master_data', ['Phone_Number']),
+    ('fix_duplicates_phone.py', 'tax_summit_master_data', ['Phone_Number_4']),
+    ('fix_duplicates_phone.py', 'tax_summit_master_data', ['Phone_Number_10']),
+    ('drift_repair.py', 'Tax_Persons_Analysis', ['Client_Name', 'Phone_Number']),
+    ('drift_repair.py', 'CFO_Persons_Analysis', ['Company_Name', 'Phone_Number_4']),
+    ('drift_repair.py', 'Other_Persons_Analysis', ['Company_Name', 'Phone_Number_10']),
+    ('drift_repair.py', 'Tax_Persons_details', ['Client_Name', 'Phone_Number']),
+    ('drift_repair.py', 'CFO_Persons_details', ['Company_Name', 'Phone_Number_4']),
+    ('drift_repair.py', 'Other_Persons_Details', ['Company_Name', 'Phone_Number_10']),
+    ('tax_vcard_generator.py', 'Tax_Persons_details', ['Contact_Created_Status']),
+    ('cfo_vcard_generator.py', 'CFO_Persons_details', ['Contact_Created_Status']),
+    ('Other_Persons_vCard_Generator.py', 'Other_Persons_Details', ['Contact_Created_Status']),
+]
+
+# UPDATE <table> SET ... WHERE / DELETE FROM <table> WHERE (not ON DUPLICATE KEY UPDATE)
+DML_PATTERN = re.compile(
+    r'(?:\bUPDATE\s+`?(\w+)`?\s+SET\b|\bDELETE\s+FROM\s+`?(\w+)`?).*?\bWHERE\b(.*)$',
+    re.IGNORECASE | re.DOTALL
+)
+EQUALITY_PATTERN = re.compile(r'`?(\w+)`?\s*=\s*(?:OLD|NEW)\.`?\w+`?', re.IGNORECASE)
+
+def connect_to_mysql():
+    """Establish connection to MySQL database"""
+    try:
+        connection = mysql.connector.connect(
+            host=os.getenv("DB_HOST"),
+            user=os.getenv("DB_USER"),
+            password=os.getenv("DB_PASS"),
+            database=os.getenv("DB_NAME"),
+            port=int(os.getenv("DB_PORT", 3306))
+        )
+        if connection.is_connected():
+            print(f"✓ Connected to MySQL database")
+            return connection
+    except Error as e:
+        print(f"✗ Error connecting to MySQL: {e}")
+        return None
+
+def get_trigger_predicates(connection):
+    """Parse `col = OLD/NEW.col` WHERE predicates out of every trigger body"""
+    cursor = connection.cursor()
+    cursor.execute("""
+        SELECT TRIGGER_NAME, ACTION_STATEMENT
+        FROM information_schema.TRIGGERS
+        WHERE TRIGGER_SCHEMA = DATABASE()
+        ORDER BY TRIGGER_NAME
+    """)
+    triggers = cursor.fetchall()
+    cursor.close()
+
+    predicates = []
+    for trigger_name, body in triggers:
+        for statement in body.split(';'):
+            match = DML_PATTERN.search(statement)
+            if not match:
+                continue
+            update_table, delete_table, where_clause = match.groups()
+            table = update_table or delete_table
+            columns = []
+            for column in EQUALITY_PATTERN.findall(where_clause):
+                if column not in columns:
+                    columns.append(column)
+            if columns:
+                predicates.append((trigger_name, table, columns))
+
+    return predicates
+
+def get_indexes(connection, table):
+    """Return {index name: [columns in order]} for a table, or None if missing"""
+    catalog = get_catalog(connection)
+    if not catalog.has_table(table):
+        return None
+    return {name: index['columns'] for name, index in catalog.indexes(table).items()}
+
+def best_index(indexes, columns):
+    """Find the index whose leftmost prefix covers the most predicate columns"""
+    wanted = {c.lower() for c in columns}
+    best_name, best_len = None, 0
+    for name, index_cols in indexes.items():
+        prefix = 0
+        for col in index_cols:
+            if col.lower() not in wanted:
+                break
+            prefix += 1
+        if prefix > best_len:
+            best_name, best_len = name, prefix
+    return best_name, best_len
+
+def explain_lookup(connection, table, columns):
+    """EXPLAIN the equality lookup with a sample row's values"""
+    cursor = connection.cursor(dictionary=True)
+    col_list = ', '.join(f"`{c}`" for c in columns)
+    try:
+        cursor.execute(f"SELECT {col_list} FROM `{table}` LIMIT 1")
+        sample = cursor.fetchone()
+        params = tuple(sample[c] if sample else '' for c in columns)
+        where = ' AND '.join(f"`{c}` = %s" for c in columns)
+        cursor.execute(f"EXPLAIN SELECT 1 FROM `{table}` WHERE {where}", params)
+        plan = cursor.fetchone()
+        return plan
+    except Error:
+        return None
+    finally:
+        cursor.close()
+
+def audit(connection):
+    """Compare every predicate with the existing indexes, return proposed indexes"""
+    predicates = get_trigger_predicates(connection) + SCRIPT_PREDICATES
+
+    print("\n" + "="*70)
+    print(f"  🔍 AUDITING {len(predicates)} LOOKUP PREDICATES")
+    print("="*70 + "\n")
+
+    index_cache = {}
+    proposals = {}
+    seen = set()
+
+    for source, table, columns in predicates:
+        key = (table.lower(), tuple(c.lower() for c in columns))
+        if key in seen:
+            continue
+        seen.add(key)
+
+        if table not in index_cache:
+            index_cache[table] = get_indexes(connection, table)
+        indexes = index_cache[table]
+        if indexes is None:
+            print(f"  ⚠️  {table}: table not found (used by {source})")
+            continue
+
+        predicate = ' AND '.join(f"{c} = ?" for c in columns)
+        name, covered = best_index(indexes, columns)
+        plan = explain_lookup(connection, table, columns)
+        plan_text = f"type={plan['type']}, key={plan['key']}, rows={plan['rows']}" if plan else "EXPLAIN unavailable"
+
+        if covered == len(columns):
+            status = "✅"
+        elif covered:
+            status = "🟡"
+        else:
+            status = "❌"
+
+        print(f"  {status} {table}: {predicate}")
+        print(f"       source: {source}")
+        print(f"       index:  {name or '-'} ({covered}/{len(columns)} columns)  |  {plan_text}")
+
+        if covered < len(columns):
+            proposals.setdefault(table, []).append(columns)
+
+    return proposals
+
+def build_statements(proposals):
+    """Turn missing predicates into ALTER TABLE statements, dropping redundant prefixes"""
+    statements = []
+    for table, column_sets in proposals.items():
+        # An index on (a, b) already serves equality lookups on (a) and (b, a);
+        # keep only the longest column set per leftmost prefix
+        column_sets = sorted(column_sets, key=len, reverse=True)
+        kept = []
+        for columns in column_sets:
+            wanted = {c.lower() for c in columns}
+            if any({k.lower() for k in existing[:len(columns)]} == wanted for existing in kept):
+                continue
+            kept.append(columns)
+
+        for columns in kept:
+            index_name = 'idx_audit_' + '_'.join(c.lower() for c in columns)
+            col_list = ', '.join(f"`{c}`" for c in columns)
+            statements.append(f"ALTER TABLE `{table}` ADD INDEX `{index_name[:64]}` ({col_list})")
+    return statements
+
+def main():
+    print("\n" + "="*70)
+    print("  🔧 INDEX AUDIT FOR TRIGGER & MAINTENANCE LOOKUPS")
+    print("="*70)
+    print("\n  Usage: python audit_indexes.py [--apply]")
+    print("  Without --apply the missing indexes are only proposed.")
+    print("="*70)
+
+    apply = '--apply' in sys.argv
+
+    connection = connect_to_mysql()
+    if not connection:
+        return
+
+    try:
+        proposals = audit(connection)
+        statements = build_statements(proposals)
+
+        print("\n" + "="*70)
+        if not statements:
+            print("  ✅ Every lookup predicate is fully indexed")
+            print("="*70 + "\n")
+            return
+
+        print(f"  💡 {len(statements)} PROPOSED INDEXES")
+        print("="*70 + "\n")
+        for statement in statements:
+            print(f"  {statement};")
+
+        if not apply:
+            print("\n  Re-run with --apply to create them.\n")
+            return
+
+        cursor = connection.cursor()
+        print()
+        for statement in statements:
+            try:
+                cursor.execute(statement)
+                print(f"  ✓ {statement}")
+            except Error as e:
+                print(f"  ⚠️  {statement}\n     {e}")
+        connection.commit()
+        cursor.close()
+        print("\n✅ Index audit applied\n")
+
+    finally:
+        if connection.is_connected():
+            connection.close()
+            print("✓ Connection closed\n")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
 import mysql.connector
 from mysql.connector import Error
 import os
+import sys
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from database.schema_catalog import get_catalog
+
 load_dotenv()
 
 def connect_to_mysql():
@@ -22,21 +26,25 @@ def connect_to_mysql():
         print(f"✗ Error connecting to MySQL: {e}")
         return None
 
-def check_table_exists(cursor, table_name):
-    """Check if table exists"""
+def check_table_exists(connection, table_name):
+    """Check if table exists with exactly this name (case-sensitive)"""
     try:
-        cursor.execute(f"SHOW TABLES LIKE '{table_name}'")
-        result = cursor.fetchone()
-        return result is not None
-    except:
+        return table_name in get_catalog(connection).tables
+    except Error:
         return False
 
-def get_table_structure(cursor, table_name):
-    """Get table column structure"""
+def resolve_table(connection, table_name):
+    """Actual table name, whatever its case, or None"""
+    try:
+        return get_catalog(connection).resolve(table_name)
+    except Error:
+        return None
+
+def get_table_structure(connection, table_name):
+    """Get table column structure as (name, type) pairs"""
     try:
-        cursor.execute(f"DESCRIBE {table_name}")
-        columns = cursor.fetchall()
-        return columns
+        columns = get_catalog(connection).column_info(table_name)
+        return [(col['name'], col['column_type']) for col in columns] or None
     except Error as e:
         return None
 
@@ -64,7 +72,7 @@ def diagnose_insert_problem(connection):
     
     existing_tables = {}
     for table in tables_to_check:
-        exists = check_table_exists(cursor, table)
+        exists = check_table_exists(connection, table)
         if exists:
             print(f"    ✓ {table} exists")
             existing_tables[table] = True
@@ -75,11 +83,8 @@ def diagnose_insert_problem(connection):
     # Determine correct table names
     master_table = 'tax_summit_master_data'
     
-    if existing_tables.get('Tax_Persons_Analysis'):
-        tax_analysis = 'Tax_Persons_Analysis'
-    elif existing_tables.get('tax_persons_analysis'):
-        tax_analysis = 'tax_persons_analysis'
-    else:
+    tax_analysis = resolve_table(connection, 'Tax_Persons_Analysis')
+    if not tax_analysis:
         print("\n❌ ERROR: No Tax analysis table found!")
         return
     
@@ -88,7 +93,7 @@ def diagnose_insert_problem(connection):
     # Step 2: Check master table structure
     print(f"\n[2] Checking {master_table} structure...\n")
     
-    master_cols = get_table_structure(cursor, master_table)
+    master_cols = get_table_structure(connection, master_table)
     if master_cols:
         master_col_names = [col[0] for col in master_cols]
         print(f"    Found {len(master_col_names)} columns:")
@@ -118,7 +123,7 @@ def diagnose_insert_problem(connection):
     # Step 3: Check analysis table structure
     print(f"\n[3] Checking {tax_analysis} structure...\n")
     
-    analysis_cols = get_table_structure(cursor, tax_analysis)
+    analysis_cols = get_table_structure(connection, tax_analysis)
     if analysis_cols:
         analysis_col_names = [col[0] for col in analysis_cols]
         print(f"    Found {len(analysis_col_names)} columns:")
@@ -265,22 +270,19 @@ def attempt_flexible_insert(connection):
     cursor = connection.cursor()
     
     # Detect correct table names
-    if check_table_exists(cursor, 'Tax_Persons_Analysis'):
-        tax_analysis = 'Tax_Persons_Analysis'
-    elif check_table_exists(cursor, 'tax_persons_analysis'):
-        tax_analysis = 'tax_persons_analysis'
-    else:
+    catalog = get_catalog(connection)
+    tax_analysis = catalog.resolve('Tax_Persons_Analysis')
+    if not tax_analysis:
         print("❌ No analysis table found!")
         return
     
     master_table = 'tax_summit_master_data'
     
-    # Get columns from both tables
-    cursor.execute(f"DESCRIBE {master_table}")
-    master_cols = {col[0] for col in cursor.fetchall()}
-    
-    cursor.execute(f"DESCRIBE {tax_analysis}")
-    analysis_cols = {col[0] for col in cursor.fetchall() if col[0] not in ['id', 'S_No', 'Data_Insert_Time', 'Last_Updated']}
+    # Get columns from both tables (generated columns can't be inserted)
+    master_cols = catalog.column_set(master_table, writable_only=True)
+    analysis_cols = catalog.column_set(tax_analysis, writable_only=True) - {
+        'id', 'S_No', 'Data_Insert_Time', 'Last_Updated'
+    }
     
     # Find matching columns
     matching_cols = master_cols & analysis_cols
@@ -0,0 +1,320 @@
+import mysql.connector
+from mysql.connector import Error
+import os
+import sys
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from database.phone_utils import has_phone_sql, phone_key_column
+
+load_dotenv()
+
+MASTER_TABLE = 'tax_summit_master_data'
+
+# Every derived table mirrors a slice of the master row. Each entry lists the
+# (derived column, master column) pairs that must match, the derived table's
+# key column (Client_Name / Company_Name) and its phone column.
+DERIVED_TABLES = [
+    {
+        'table': 'Tax_Persons_Analysis',
+        'key': 'Client_Name',
+        'phone': 'Phone_Number',
+        'columns': [
+            ('Client_Name', 'Client_Name'), ('Practice_Head', 'Practice_Head'), ('Partner', 'Partner'),
+            ('Invite_Status', 'Invite_Status'), ('numInvitees', 'numInvitees'), ('Response', 'Response'),
+            ('Sector', 'Sector'), ('numRegistrations', 'numRegistrations'), ('Tax_Contact', 'Tax_Contact'),
+            ('Designation', 'Designation'), ('Email_ID', 'Email_ID'), ('Phone_Number', 'Phone_Number'),
+            ('Location', 'Location'), ('Response_1', 'Response_1'),
+        ],
+    },
+    {
+        'table': 'CFO_Persons_Analysis',
+        'key': 'Company_Name',
+        'phone': 'Phone_Number_4',
+        'columns': [
+            ('Company_Name', 'Client_Name'), ('Practice_Head', 'Practice_Head'), ('Partner', 'Partner'),
+            ('Invite_Status', 'Invite_Status'), ('numInvitees', 'numInvitees'), ('Response', 'Response'),
+            ('Sector', 'Sector'), ('numRegistrations', 'numRegistrations'), ('CFO_Name', 'CFO_Name'),
+            ('Designation_2', 'Designation_2'), ('Email_ID_3', 'Email_ID_3'), ('Phone_Number_4', 'Phone_Number_4'),
+            ('Location_6', 'Location_6'), ('Response_7', 'Response_7'),
+        ],
+    },
+    {
+        'table': 'Other_Persons_Analysis',
+        'key': 'Company_Name',
+        'phone': 'Phone_Number_10',
+        'columns': [
+            ('Company_Name', 'Client_Name'), ('Practice_Head', 'Practice_Head'), ('Partner', 'Partner'),
+            ('Invite_Status', 'Invite_Status'), ('numInvitees', 'numInvitees'), ('Response', 'Response'),
+            ('Sector', 'Sector'), ('numRegistrations', 'numRegistrations'), ('Others', 'Others'),
+            ('Designation_8', 'Designation_8'), ('Email_ID_9', 'Email_ID_9'), ('Phone_Number_10', 'Phone_Number_10'),
+            ('Location_12', 'Location_12'), ('Response_13', 'Response_13'),
+        ],
+    },
+    {
+        'table': 'Tax_Persons_details',
+        'key': 'Client_Name',
+        'phone': 'Phone_Number',
+        'columns': [
+            ('Client_Name', 'Client_Name'), ('numRegistrations', 'numRegistrations'), ('Tax_Contact', 'Tax_Contact'),
+            ('Designation', 'Designation'), ('Email_ID', 'Email_ID'), ('Phone_Number', 'Phone_Number'),
+            ('Response_1', 'Response_1'),
+        ],
+    },
+    {
+        'table': 'CFO_Persons_details',
+        'key': 'Company_Name',
+        'phone': 'Phone_Number_4',
+        'columns': [
+            ('Company_Name', 'Client_Name'), ('numRegistrations', 'numRegistrations'), ('CFO_Name', 'CFO_Name'),
+            ('Designation_2', 'Designation_2'), ('Email_ID_3', 'Email_ID_3'), ('Phone_Number_4', 'Phone_Number_4'),
+            ('Response_7', 'Response_7'),
+        ],
+    },
+    {
+        'table': 'Other_Persons_Details',
+        'key': 'Company_Name',
+        'phone': 'Phone_Number_10',
+        'columns': [
+            ('Company_Name', 'Client_Name'), ('numRegistrations', 'numRegistrations'), ('Others', 'Others'),
+            ('Designation_8', 'Designation_8'), ('Email_ID_9', 'Email_ID_9'), ('Phone_Number_10', 'Phone_Number_10'),
+            ('Response_13', 'Response_13'),
+        ],
+    },
+]
+
+# Number of child ranges a mismatching range is split into, and the range size
+# (in master keys) at which we stop splitting and repair the rows directly.
+FANOUT = 16
+LEAF_SIZE = 32
+
+def connect_to_mysql():
+    """Establish connection to MySQL database"""
+    try:
+        connection = mysql.connector.connect(
+            host=os.getenv("DB_HOST"),
+            user=os.getenv("DB_USER"),
+            password=os.getenv("DB_PASS"),
+            database=os.getenv("DB_NAME"),
+            port=int(os.getenv("DB_PORT", 3306))
+        )
+        if connection.is_connected():
+            print(f"✓ Connected to MySQL database")
+            return connection
+    except Error as e:
+        print(f"✗ Error connecting to MySQL: {e}")
+        return None
+
+def row_hash_sql(columns, alias):
+    """
+    SQL expression for a 64-bit hash of one row.
+
+    NULL and '' are hashed differently (ISNULL flag per column) so a value
+    being blanked out is still detected as drift.
+    """
+    parts = ', '.join(f"ISNULL({alias}.`{col}`), IFNULL({alias}.`{col}`, '')" for col in columns)
+    return f"CAST(CONV(SUBSTRING(MD5(CONCAT_WS('|', {parts})), 1, 16), 16, 10) AS UNSIGNED)"
+
+def range_sql(column, lower, upper):
+    """Half-open key range [lower, upper); None means unbounded"""
+    clauses, params = [], []
+    if lower is not None:
+        clauses.append(f"{column} >= %s")
+        params.append(lower)
+    if upper is not None:
+        clauses.append(f"{column} < %s")
+        params.append(upper)
+    return (' AND '.join(clauses) or '1=1'), params
+
+def master_checksum(cursor, spec, lower, upper):
+    """Row count and XOR of row hashes for the master rows that feed spec['table']"""
+    master_cols = [m for _, m in spec['columns']]
+    where, params = range_sql('m.Client_Name', lower, upper)
+    cursor.execute(f"""
+        SELECT COUNT(*), COALESCE(BIT_XOR({row_hash_sql(master_cols, 'm')}), 0)
+        FROM {MASTER_TABLE} m
+        WHERE {has_phone_sql(spec['phone_key'], 'm.')}
+          AND {where}
+    """, params)
+    return tuple(cursor.fetchone())
+
+def derived_checksum(cursor, spec, lower, upper):
+    """Row count and XOR of row hashes for spec['table'] in the same key range"""
+    derived_cols = [d for d, _ in spec['columns']]
+    where, params = range_sql(f"t.`{spec['key']}`", lower, upper)
+    cursor.execute(f"""
+        SELECT COUNT(*), COALESCE(BIT_XOR({row_hash_sql(derived_cols, 't')}), 0)
+        FROM {spec['table']} t
+        WHERE {where}
+    """, params)
+    return tuple(cursor.fetchone())
+
+def repair_range(connection, spec, lower, upper):
+    """
+    Bring spec['table'] back in line with master for one key range.
+
+    Only the rows in the range are touched: orphans are deleted, drifted
+    rows are updated in place and missing rows are inserted. Rows are matched
+    on (key, phone) so S_No and the vCard status columns of detail tables are
+    preserved. The phone is compared on spec['phone_key'], the normalized
+    column where both tables have it, so the same rows count as "has a
+    phone" here as in the insert triggers.
+    """
+    cursor = connection.cursor()
+    key, phone = spec['key'], spec['phone_key']
+    join = f"m.Client_Name = t.`{key}` AND m.`{phone}` = t.`{phone}`"
+    valid_phone = has_phone_sql(phone, 'm.')
+    derived_cols = ', '.join(f"`{d}`" for d, _ in spec['columns'])
+    master_cols = ', '.join(f"m.`{m}`" for _, m in spec['columns'])
+    set_clause = ', '.join(f"t.`{d}` = m.`{m}`" for d, m in spec['columns'] if d not in (key, phone))
+
+    t_where, t_params = range_sql(f"t.`{key}`", lower, upper)
+    m_where, m_params = range_sql('m.Client_Name', lower, upper)
+
+    try:
+        cursor.execute(f"""
+            DELETE t FROM {spec['table']} t
+            LEFT JOIN {MASTER_TABLE} m ON {join} AND {valid_phone}
+            WHERE m.Client_Name IS NULL AND {t_where}
+        """, t_params)
+        deleted = cursor.rowcount
+
+        cursor.execute(f"""
+            UPDATE {spec['table']} t
+            JOIN {MASTER_TABLE} m ON {join}
+            SET {set_clause}
+            WHERE {valid_phone} AND {t_where}
+        """, t_params)
+        updated = cursor.rowcount
+
+        cursor.execute(f"""
+            INSERT INTO {spec['table']} ({derived_cols})
+            SELECT {master_cols}
+            FROM {MASTER_TABLE} m
+            LEFT JOIN {spec['table']} t ON {join}
+            WHERE t.`{key}` IS NULL AND {valid_phone} AND {m_where}
+        """, m_params)
+        inserted = cursor.rowcount
+
+        connection.commit()
+        return deleted, updated, inserted
+    except Error as e:
+        print(f"      ❌ Repair failed: {e}")
+        connection.rollback()
+        return 0, 0, 0
+    finally:
+        cursor.close()
+
+def find_drifted_ranges(cursor, spec, keys, start, end, stats):
+    """
+    Recursively compare checksums over keys[start:end] and yield the leaf
+    ranges (lower, upper) that still differ.
+
+    The outermost range is unbounded on both sides, so rows whose key sorts
+    before the first or after the last master key are still covered.
+    """
+    lower = keys[start] if start > 0 else None
+    upper = keys[end] if end < len(keys) else None
+
+    stats['ranges_checked'] += 1
+    if master_checksum(cursor, spec, lower, upper) == derived_checksum(cursor, spec, lower, upper):
+        return
+
+    if end - start <= LEAF_SIZE:
+        yield lower, upper
+        return
+
+    step = max(LEAF_SIZE, -(-(end - start) // FANOUT))
+    for child_start in range(start, end, step):
+        yield from find_drifted_ranges(cursor, spec, keys, child_start, min(child_start + step, end), stats)
+
+def load_master_keys(connection):
+    """Sorted master keys in the server's collation order (index-only scan)"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"SELECT Client_Name FROM {MASTER_TABLE} WHERE Client_Name IS NOT NULL ORDER BY Client_Name")
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+def detect_and_repair(connection, dry_run=False):
+    """Detect drift on every derived table and repair only the drifted ranges"""
+    print("\n" + "="*70)
+    print("  🌳 RANGE CHECKSUM DRIFT DETECTION")
+    print("="*70 + "\n")
+
+    keys = load_master_keys(connection)
+    print(f"Master keys: {len(keys)} (fan-out {FANOUT}, leaf size {LEAF_SIZE})\n")
+
+    cursor = connection.cursor()
+    totals = {'ranges': 0, 'deleted': 0, 'updated': 0, 'inserted': 0}
+
+    try:
+        for spec in DERIVED_TABLES:
+            print(f"[{spec['table']}]")
+            stats = {'ranges_checked': 0}
+
+            try:
+                phone_key = phone_key_column(connection, spec['phone'], MASTER_TABLE, spec['table'])
+                spec = dict(spec, phone_key=phone_key)
+                drifted = list(find_drifted_ranges(cursor, spec, keys, 0, len(keys), stats))
+            except Error as e:
+                print(f"    ⚠️  Skipped: {e}\n")
+                continue
+
+            print(f"    Ranges checked: {stats['ranges_checked']}, drifted leaf ranges: {len(drifted)}")
+            totals['ranges'] += len(drifted)
+
+            for lower, upper in drifted:
+                label = f"[{lower or '-∞'} … {upper or '+∞'})"
+                if dry_run:
+                    print(f"      • {label}")
+                    continue
+                deleted, updated, inserted = repair_range(connection, spec, lower, upper)
+                totals['deleted'] += deleted
+                totals['updated'] += updated
+                totals['inserted'] += inserted
+                print(f"      ✓ {label}: -{deleted} ~{updated} +{inserted}")
+
+            if not drifted:
+                print("    ✅ In sync")
+            print()
+    finally:
+        cursor.close()
+
+    return totals
+
+def main():
+    print("\n" + "="*70)
+    print("  🔧 TARGETED MASTER ↔ ANALYSIS/DETAIL REPAIR")
+    print("="*70)
+    print("\n  Usage: python drift_repair.py [--dry-run]")
+    print("  Only key ranges whose checksums differ are repaired.")
+    print("="*70)
+
+    dry_run = '--dry-run' in sys.argv
+
+    connection = connect_to_mysql()
+    if not connection:
+        return
+
+    try:
+        totals = detect_and_repair(connection, dry_run=dry_run)
+
+        print("="*70)
+        if dry_run:
+            print(f"  ℹ️  Dry run: {totals['ranges']} drifted ranges found, nothing changed")
+        elif totals['ranges'] == 0:
+            print("  ✅ All derived tables match master")
+        else:
+            print(f"  ✅ Repaired {totals['ranges']} ranges")
+            print(f"     Deleted: {totals['deleted']}  Updated: {totals['updated']}  Inserted: {totals['inserted']}")
+        print("="*70 + "\n")
+
+    finally:
+        if connection.is_connected():
+            connection.close()
+            print("✓ Connection closed\n")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
 import mysql.connector
 from mysql.connector import Error
 import os
+import sys
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from database.phone_utils import has_phone_sql, phone_key_column
+
 load_dotenv()
 
 def connect_to_mysql():
@@ -22,6 +26,13 @@ def connect_to_mysql():
         print(f"✗ Error connecting to MySQL: {e}")
         return None
 
+def phone_group_column(connection, table, phone_col):
+    """Prefer the normalized phone column (add_phone_norm_index.py) when present"""
+    try:
+        return phone_key_column(connection, phone_col, table)
+    except Error:
+        return phone_col
+
 def find_duplicate_phones(connection):
     """Find all duplicate phone numbers"""
     cursor = connection.cursor(dictionary=True)
@@ -31,14 +42,15 @@ def find_duplicate_phones(connection):
     print("="*70 + "\n")
     
     # Find duplicates in Tax contacts
-    cursor.execute("""
+    group_col = phone_group_column(connection, 'tax_summit_master_data', 'Phone_Number')
+    cursor.execute(f"""
         SELECT 
-            Phone_Number,
+            {group_col} as Phone,
             COUNT(*) as count,
             GROUP_CONCAT(CONCAT(Client_Name, ' (', Tax_Contact, ')') SEPARATOR ' | ') as people
         FROM tax_summit_master_data
-        WHERE Phone_Number IS NOT NULL AND Phone_Number != ''
-        GROUP BY Phone_Number
+        WHERE {group_col} IS NOT NULL AND {group_col} != ''
+        GROUP BY {group_col}
         HAVING COUNT(*) > 1
         ORDER BY count DESC
     """)
@@ -49,7 +61,7 @@ def find_duplicate_phones(connection):
     
     if tax_dupes:
         for i, dupe in enumerate(tax_dupes[:20], 1):
-            print(f"  {i}. Phone: {dupe['Phone_Number']} (used {dupe['count']} times)")
+            print(f"  {i}. Phone: {dupe['Phone']} (used {dupe['count']} times)")
             people_list = dupe['people'].split(' | ')
             for person in people_list[:3]:
                 print(f"     • {person}")
@@ -60,14 +72,15 @@ def find_duplicate_phones(connection):
             print(f"\n  ... and {len(tax_dupes) - 20} more duplicate phones")
     
     # CFO contacts
-    cursor.execute("""
+    group_col = phone_group_column(connection, 'tax_summit_master_data', 'Phone_Number_4')
+    cursor.execute(f"""
         SELECT 
-            Phone_Number_4,
+            {group_col} as Phone,
             COUNT(*) as count,
             GROUP_CONCAT(CONCAT(Client_Name, ' (', CFO_Name, ')') SEPARATOR ' | ') as people
         FROM tax_summit_master_data
-        WHERE Phone_Number_4 IS NOT NULL AND Phone_Number_4 != ''
-        GROUP BY Phone_Number_4
+        WHERE {group_col} IS NOT NULL AND {group_col} != ''
+        GROUP BY {group_col}
         HAVING COUNT(*) > 1
         ORDER BY count DESC
     """)
@@ -77,14 +90,15 @@ def find_duplicate_phones(connection):
     print(f"\n[2] CFO Contacts - Found {len(cfo_dupes)} duplicate phone numbers")
     
     # Other contacts
-    cursor.execute("""
+    group_col = phone_group_column(connection, 'tax_summit_master_data', 'Phone_Number_10')
+    cursor.execute(f"""
         SELECT 
-            Phone_Number_10,
+            {group_col} as Phone,
             COUNT(*) as count,
             GROUP_CONCAT(CONCAT(Client_Name, ' (', Others, ')') SEPARATOR ' | ') as people
         FROM tax_summit_master_data
-        WHERE Phone_Number_10 IS NOT NULL AND Phone_Number_10 != ''
-        GROUP BY Phone_Number_10
+        WHERE {group_col} IS NOT NULL AND {group_col} != ''
+        GROUP BY {group_col}
         HAVING COUNT(*) > 1
         ORDER BY count DESC
     """)
@@ -158,6 +172,8 @@ def add_composite_unique_constraint(connection):
     ]
     
     for table, phone_col, name_col in constraints:
+        # Normalized phone catches "+91 98..." vs "098..." as the same number
+        phone_col = phone_group_column(connection, table, phone_col)
         print(f"[{table}] Adding composite UNIQUE ({phone_col}, {name_col})...")
         
         try:
@@ -177,8 +193,16 @@ def add_composite_unique_constraint(connection):
     cursor.close()
 
 def insert_all_data_with_duplicates(connection):
-    """Insert all data, allowing duplicate phones"""
+    """
+    Insert all data, allowing duplicate phones across clients. Rows of one
+    client whose phones differ only in format collide on idx_phone_client
+    (normalized phone + client) and are kept once instead of failing the
+    insert.
+    """
     cursor = connection.cursor()
+    tax_phone = phone_group_column(connection, 'tax_summit_master_data', 'Phone_Number')
+    cfo_phone = phone_group_column(connection, 'tax_summit_master_data', 'Phone_Number_4')
+    other_phone = phone_group_column(connection, 'tax_summit_master_data', 'Phone_Number_10')
     
     print("\n" + "="*70)
     print("  📊 INSERTING ALL DATA")
@@ -190,7 +214,7 @@ def insert_all_data_with_duplicates(connection):
         cursor.execute("DELETE FROM Tax_Persons_Analysis")
         print(f"    Cleared existing data")
         
-        cursor.execute("""
+        cursor.execute(f"""
             INSERT INTO Tax_Persons_Analysis 
                 (Client_Name, Practice_Head, Partner, Invite_Status, numInvitees, Response, 
                  Sector, numRegistrations, Tax_Contact, Designation, Email_ID, Phone_Number, 
@@ -200,7 +224,8 @@ def insert_all_data_with_duplicates(connection):
                 Sector, numRegistrations, Tax_Contact, Designation, Email_ID, Phone_Number, 
                 Location, Response_1
             FROM tax_summit_master_data
-            WHERE Phone_Number IS NOT NULL AND Phone_Number != ''
+            WHERE {has_phone_sql(tax_phone)}
+            ON DUPLICATE KEY UPDATE Tax_Persons_Analysis.Phone_Number = Tax_Persons_Analysis.Phone_Number
         """)
         
         inserted = cursor.rowcount
@@ -217,7 +242,7 @@ def insert_all_data_with_duplicates(connection):
         cursor.execute("DELETE FROM CFO_Persons_Analysis")
         print(f"    Cleared existing data")
         
-        cursor.execute("""
+        cursor.execute(f"""
             INSERT INTO CFO_Persons_Analysis 
                 (Company_Name, Practice_Head, Partner, Invite_Status, numInvitees, Response, 
                  Sector, numRegistrations, CFO_Name, Designation_2, Email_ID_3, Phone_Number_4, 
@@ -227,7 +252,8 @@ def insert_all_data_with_duplicates(connection):
                 Sector, numRegistrations, CFO_Name, Designation_2, Email_ID_3, Phone_Number_4, 
                 Location_6, Response_7
             FROM tax_summit_master_data
-            WHERE Phone_Number_4 IS NOT NULL AND Phone_Number_4 != ''
+            WHERE {has_phone_sql(cfo_phone)}
+            ON DUPLICATE KEY UPDATE CFO_Persons_Analysis.Phone_Number_4 = CFO_Persons_Analysis.Phone_Number_4
         """)
         
         inserted = cursor.rowcount
@@ -244,7 +270,7 @@ def insert_all_data_with_duplicates(connection):
         cursor.execute("DELETE FROM Other_Persons_Analysis")
         print(f"    Cleared existing data")
         
-        cursor.execute("""
+        cursor.execute(f"""
             INSERT INTO Other_Persons_Analysis 
                 (Company_Name, Practice_Head, Partner, Invite_Status, numInvitees, Response, 
                  Sector, numRegistrations, Others, Designation_8, Email_ID_9, Phone_Number_10, 
@@ -254,7 +280,8 @@ def insert_all_data_with_duplicates(connection):
                 Sector, numRegistrations, Others, Designation_8, Email_ID_9, Phone_Number_10, 
                 Location_12, Response_13
             FROM tax_summit_master_data
-            WHERE Phone_Number_10 IS NOT NULL AND Phone_Number_10 != ''
+            WHERE {has_phone_sql(other_phone)}
+            ON DUPLICATE KEY UPDATE Other_Persons_Analysis.Phone_Number_10 = Other_Persons_Analysis.Phone_Number_10
         """)
         
         inserted = cursor.rowcount
@@ -330,6 +357,9 @@ def verify_sync(connection):
 def update_triggers_to_handle_duplicates(connection):
     """Update triggers to use INSERT IGNORE or ON DUPLICATE KEY"""
     cursor = connection.cursor()
+    tax_phone = phone_group_column(connection, 'tax_summit_master_data', 'Phone_Number')
+    cfo_phone = phone_group_column(connection, 'tax_summit_master_data', 'Phone_Number_4')
+    other_phone = phone_group_column(connection, 'tax_summit_master_data', 'Phone_Number_10')
     
     print("\n" + "="*70)
     print("  🔧 UPDATING TRIGGERS")
@@ -346,13 +376,13 @@ def update_triggers_to_handle_duplicates(connection):
     print("Creating new triggers that handle duplicates...\n")
     
     # New INSERT trigger with INSERT IGNORE
-    insert_trigger = """
+    insert_trigger = f"""
     CREATE TRIGGER after_master_insert_analysis
     AFTER INSERT ON tax_summit_master_data
     FOR EACH ROW
     BEGIN
         -- Tax_Persons_Analysis - INSERT IGNORE to skip duplicates
-        IF NEW.Phone_Number IS NOT NULL AND NEW.Phone_Number != '' THEN
+        IF {has_phone_sql(tax_phone, 'NEW.')} THEN
             INSERT INTO Tax_Persons_Analysis 
                 (Client_Name, Practice_Head, Partner, Invite_Status, numInvitees, Response, 
                  Sector, numRegistrations, Tax_Contact, Designation, Email_ID, Phone_Number, 
@@ -378,7 +408,7 @@ def update_triggers_to_handle_duplicates(connection):
         END IF;
         
         -- CFO_Persons_Analysis
-        IF NEW.Phone_Number_4 IS NOT NULL AND NEW.Phone_Number_4 != '' THEN
+        IF {has_phone_sql(cfo_phone, 'NEW.')} THEN
             INSERT INTO CFO_Persons_Analysis 
                 (Company_Name, Practice_Head, Partner, Invite_Status, numInvitees, Response, 
                  Sector, numRegistrations, CFO_Name, Designation_2, Email_ID_3, Phone_Number_4, 
@@ -404,7 +434,7 @@ def update_triggers_to_handle_duplicates(connection):
         END IF;
         
         -- Other_Persons_Analysis
-        IF NEW.Phone_Number_10 IS NOT NULL AND NEW.Phone_Number_10 != '' THEN
+        IF {has_phone_sql(other_phone, 'NEW.')} THEN
             INSERT INTO Other_Persons_Analysis 
                 (Company_Name, Practice_Head, Partner, Invite_Status, numInvitees, Response, 
                  Sector, numRegistrations, Others, Designation_8, Email_ID_9, Phone_Number_10, 
@@ -465,7 +495,7 @@ def main():
         print("but multiple people share the same phone number in your master data.")
         print("\nThe fix:")
         print("  1. Remove UNIQUE constraint from Phone_Number columns")
-        print("  2. Add composite UNIQUE on (Phone_Number + Client_Name)")
+        print("  2. Add composite UNIQUE on (normalized phone + Client_Name)")
         print("  3. Insert all data (including duplicates)")
         print("  4. Update triggers to handle duplicates")
         print("\nThis allows:")
@@ -0,0 +1,110 @@
+"""
+Shared phone-number normalization.
+
+Phone numbers arrive from Excel in many shapes ("+91 98xxx xxxxx",
+"098xxxxxxxx", "98xxx-xxxxx"). Both the MySQL generated columns and the
+Python ingest path reduce them to the same E.164-style form so duplicates
+are detected exactly:
+
+    +91 98765 43210  →  +919876543210
+    09876543210      →  +919876543210
+    9876543210       →  +919876543210
+    0044 20 7946 0000 → +442079460000
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from database.schema_catalog import get_catalog
+
+DEFAULT_COUNTRY_CODE = os.getenv("PHONE_COUNTRY_CODE", "91")
+
+# Raw phone column → generated normalized column
+NORMALIZED_PHONE_COLUMNS = {
+    'Phone_Number': 'Phone_Norm',
+    'Phone_Number_4': 'Phone_Norm_4',
+    'Phone_Number_10': 'Phone_Norm_10',
+}
+
+# Longest normalized value we store ('+' and up to 15 digits per E.164)
+NORMALIZED_PHONE_LENGTH = 16
+
+def phone_key_column(connection, phone_col, *tables):
+    """
+    Column to match / test phones on: the normalized column when every one
+    of `tables` has it (add_phone_norm_index.py indexes it with the client
+    column), else the raw phone column.
+    """
+    norm_col = NORMALIZED_PHONE_COLUMNS[phone_col]
+    catalog = get_catalog(connection)
+    if all(catalog.has_column(table, norm_col) for table in tables):
+        return norm_col
+    return phone_col
+
+def has_phone_sql(column, row=''):
+    """Row has a phone: normalized columns are NULL for blanks/junk, raw ones may be ''"""
+    ref = f"{row}{column}"
+    if column in NORMALIZED_PHONE_COLUMNS.values():
+        return f"{ref} IS NOT NULL"
+    return f"{ref} IS NOT NULL AND {ref} != ''"
+
+def normalized_phone_sql(column, country_code=DEFAULT_COUNTRY_CODE):
+    """
+    SQL expression (usable in a STORED generated column) that normalizes
+    `column` the same way normalize_phone_numbers() does.
+    """
+    digits = f"REGEXP_REPLACE(`{column}`, '[^0-9]', '')"
+    cc = country_code
+    return f"""(CASE
+        WHEN {digits} IS NULL OR {digits} = '' THEN NULL
+        WHEN TRIM(`{column}`) LIKE '+%' THEN LEFT(CONCAT('+', {digits}), {NORMALIZED_PHONE_LENGTH})
+        WHEN {digits} LIKE '00%' THEN LEFT(CONCAT('+', SUBSTRING({digits}, 3)), {NORMALIZED_PHONE_LENGTH})
+        WHEN CHAR_LENGTH({digits}) = 10 THEN CONCAT('+{cc}', {digits})
+        WHEN CHAR_LENGTH({digits}) = 11 AND {digits} LIKE '0%' THEN CONCAT('+{cc}', SUBSTRING({digits}, 2))
+        ELSE LEFT(CONCAT('+', {digits}), {NORMALIZED_PHONE_LENGTH})
+    END)"""
+
+def normalize_phone_numbers(phones, country_code=DEFAULT_COUNTRY_CODE):
+    """
+    Vectorized normalizer for ingest.
+
+    Args:
+        phones: iterable / Series of raw phone values (NaN/None allowed)
+        country_code: country code assumed for national numbers
+
+    Returns:
+        pd.Series: normalized numbers ('+<digits>') with <NA> for blanks
+    """
+    raw = pd.Series(phones, copy=False)
+    if raw.dtype.kind in 'fO':
+        # read_excel gives float phone columns when a cell is blank -
+        # 9876543210.0 must not become '98765432100'
+        raw = pd.Series(
+            [int(v) if isinstance(v, float) and v.is_integer() else v for v in raw],
+            index=raw.index, dtype=object
+        )
+    raw = raw.astype('string')
+    stripped = raw.str.strip()
+    digits = stripped.str.replace(r'\D', '', regex=True)
+    length = digits.str.len()
+
+    blank = (digits.isna() | (length == 0)).to_numpy(dtype=bool, na_value=True)
+    international = stripped.str.startswith('+').to_numpy(dtype=bool, na_value=False)
+    double_zero = digits.str.startswith('00').to_numpy(dtype=bool, na_value=False)
+    national = (length == 10).to_numpy(dtype=bool, na_value=False)
+    trunk_prefixed = ((length == 11) & digits.str.startswith('0')).to_numpy(dtype=bool, na_value=False)
+
+    normalized = np.select(
+        [blank, international, double_zero, national, trunk_prefixed],
+        [
+            None,
+            ('+' + digits).to_numpy(dtype=object),
+            ('+' + digits.str[2:]).to_numpy(dtype=object),
+            ('+' + country_code + digits).to_numpy(dtype=object),
+            ('+' + country_code + digits.str[1:]).to_numpy(dtype=object),
+        ],
+        default=('+' + digits).to_numpy(dtype=object),
+    )
+    result = pd.Series(normalized, index=raw.index, dtype='string')
+    return result.str.slice(0, NORMALIZED_PHONE_LENGTH)
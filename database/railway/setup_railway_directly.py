@@ -1,8 +1,13 @@
 import mysql.connector
 from mysql.connector import Error
 import os
+import sys
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from database.schema_catalog import get_catalog
+from database.summary_tables import SUMMARY_TABLE, create_summary_table_sql
+
 load_dotenv()
 
 def connect_to_railway():
@@ -22,8 +27,8 @@ def connect_to_railway():
         print(f"✗ Error: {e}")
         return None
 
-def get_local_master_columns():
-    """Get actual column list from local master table"""
+def connect_to_local():
+    """Connect to the local database the schema is copied from"""
     try:
         connection = mysql.connector.connect(
             host=os.getenv("DB_HOST"),
@@ -32,23 +37,34 @@ def get_local_master_columns():
             database=os.getenv("DB_NAME"),
             port=int(os.getenv("DB_PORT", 3306))
         )
-        cursor = connection.cursor()
-        cursor.execute("SHOW COLUMNS FROM tax_summit_master_data")
-        columns = [row[0] for row in cursor.fetchall() if row[0] != 'id']
-        cursor.close()
-        connection.close()
+        if connection.is_connected():
+            print(f"✓ Connected to local database")
+            return connection
+    except Error as e:
+        print(f"⚠️  Could not connect to local database: {e}")
+        return None
+
+def get_local_master_columns(local_connection):
+    """Get actual column list from local master table"""
+    if not local_connection:
+        return []
+    try:
+        # Generated columns (e.g. Phone_Norm) are computed locally, not copied
+        catalog = get_catalog(local_connection)
+        columns = [col for col in catalog.columns('tax_summit_master_data', writable_only=True)
+                   if col != 'id']
         print(f"   Found {len(columns)} columns in local master table")
         return columns
     except Exception as e:
         print(f"   ⚠️  Could not read local columns: {e}")
         return []
 
-def create_master_table(connection):
+def create_master_table(connection, local_connection):
     """Create master table with optimized column types"""
     cursor = connection.cursor()
     
     # Get columns from local
-    local_columns = get_local_master_columns()
+    local_columns = get_local_master_columns(local_connection)
     
     if not local_columns:
         print("⚠️  Could not read local columns, using default structure")
@@ -326,6 +342,20 @@ def create_analysis_tables(connection):
     finally:
         cursor.close()
 
+def create_summary_table(connection):
+    """Summary table the dashboard reads; filled by the sync, no triggers here"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(create_summary_table_sql())
+        connection.commit()
+        print(f"✓ {SUMMARY_TABLE} created")
+        return True
+    except Error as e:
+        print(f"✗ Error creating {SUMMARY_TABLE}: {e}")
+        return False
+    finally:
+        cursor.close()
+
 def setup_railway_schema():
     """Main setup function"""
     print("\n" + "="*70)
@@ -335,10 +365,11 @@ def setup_railway_schema():
     connection = connect_to_railway()
     if not connection:
         return
+    local_connection = connect_to_local()
     
     try:
         print("\n[Step 1] Creating master table (optimized for row size)...")
-        if not create_master_table(connection):
+        if not create_master_table(connection, local_connection):
             print("\n⚠️  Master table creation failed. Cannot proceed.")
             return
         
@@ -350,6 +381,10 @@ def setup_railway_schema():
         if not create_analysis_tables(connection):
             print("\n⚠️  Warning: Analysis tables creation had issues")
         
+        print("\n[Step 4] Creating summary table...")
+        if not create_summary_table(connection):
+            print("\n⚠️  Warning: Summary table creation had issues")
+        
         print("\n" + "="*70)
         print("✅ RAILWAY DATABASE SETUP COMPLETE!")
         print("="*70)
@@ -363,6 +398,8 @@ def setup_railway_schema():
         print()
         
     finally:
+        if local_connection and local_connection.is_connected():
+            local_connection.close()
         if connection.is_connected():
             connection.close()
             print("✓ Connection closed\n")
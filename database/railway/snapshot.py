@@ -0,0 +1,421 @@
+import mysql.connector
+from mysql.connector import Error
+import os
+import sys
+import re
+import json
+import time
+import tempfile
+from dotenv import load_dotenv
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from database.schema_catalog import get_catalog, invalidate_catalog
+
+# Optional dependency (pip install pyarrow), only imported by the snapshot
+# commands - see require_pyarrow()
+pa = None
+
+load_dotenv()
+
+# Tables in FK-safe order (master first)
+SNAPSHOT_TABLES = [
+    'tax_summit_master_data',
+    'Tax_Persons_details',
+    'CFO_Persons_details',
+    'Other_Persons_Details',
+    'Tax_Persons_Analysis',
+    'CFO_Persons_Analysis',
+    'Other_Persons_Analysis',
+]
+
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", "snapshots")
+
+# Rows per Arrow record batch on export / per INSERT batch on import
+BATCH_ROWS = 5000
+
+# LOAD DATA LOCAL INFILE refused by the server or client (local_infile=OFF)
+LOCAL_INFILE_ERRORS = {1148, 2068, 3948, 3950}
+
+COMPRESSION = 'zstd'
+
+def require_pyarrow():
+    """Import pyarrow, or exit with install instructions when it is missing"""
+    global pa
+    if pa is not None:
+        return
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError:
+        print("✗ pyarrow is required for snapshots")
+        print("  Install it with: pip install pyarrow")
+        sys.exit(1)
+    pa = pyarrow
+
+def connect_to_db(target, local_infile=False):
+    """
+    Connect to a named environment:
+      local   → DB_HOST / DB_USER / DB_PASS / DB_NAME / DB_PORT
+      railway → RAILWAY_DB_*
+      <name>  → <NAME>_DB_*   (e.g. 'bench' → BENCH_DB_HOST, ...)
+    """
+    prefix = '' if target == 'local' else f"{target.upper()}_"
+    try:
+        connection = mysql.connector.connect(
+            host=os.getenv(f"{prefix}DB_HOST"),
+            user=os.getenv(f"{prefix}DB_USER"),
+            password=os.getenv(f"{prefix}DB_PASS"),
+            database=os.getenv(f"{prefix}DB_NAME"),
+            port=int(os.getenv(f"{prefix}DB_PORT", 3306)),
+            compress=target != 'local',
+            allow_local_infile=local_infile
+        )
+        if connection.is_connected():
+            print(f"   ✓ Connected to {target.upper()} database")
+            return connection
+    except Error as e:
+        print(f"   ✗ Error connecting to {target}: {e}")
+        return None
+
+def get_column_info(connection, table):
+    """Writable columns with their MySQL types, in table order (shared catalog)"""
+    return [
+        {
+            'name': c['name'],
+            'data_type': c['data_type'],
+            'column_type': c['column_type'],
+            'nullable': c['nullable'],
+        }
+        for c in get_catalog(connection).column_info(table)
+        if not c['generated']
+    ]
+
+def arrow_type(column):
+    """Arrow type for a MySQL column"""
+    data_type = column['data_type']
+    if data_type in ('tinyint', 'smallint', 'mediumint', 'int', 'integer', 'bigint', 'year', 'bit'):
+        if 'unsigned' in column['column_type'] and data_type == 'bigint':
+            return pa.uint64()
+        return pa.int64()
+    if data_type in ('float', 'double', 'real'):
+        return pa.float64()
+    if data_type == 'decimal':
+        match = re.search(r'\((\d+)(?:,\s*(\d+))?\)', column['column_type'] or '')
+        precision, scale = (int(match.group(1)), int(match.group(2) or 0)) if match else (38, 0)
+        return pa.decimal128(precision, scale)
+    if data_type == 'date':
+        return pa.date32()
+    if data_type in ('datetime', 'timestamp'):
+        return pa.timestamp('us')
+    if data_type == 'time':
+        return pa.duration('us')
+    if data_type in ('blob', 'tinyblob', 'mediumblob', 'longblob', 'binary', 'varbinary'):
+        return pa.binary()
+    return pa.string()
+
+def export_table(connection, table, path):
+    """Stream one table into an Arrow IPC file (zstd); returns (columns, row count)"""
+    columns = get_column_info(connection, table)
+    schema = pa.schema([
+        pa.field(c['name'], arrow_type(c)) for c in columns
+    ])
+    col_str = ', '.join(f"`{c['name']}`" for c in columns)
+
+    cursor = connection.cursor()
+    cursor.execute(f"SELECT {col_str} FROM `{table}`")
+    rows_written = 0
+
+    options = pa.ipc.IpcWriteOptions(compression=COMPRESSION)
+    with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, schema, options=options) as writer:
+        while True:
+            rows = cursor.fetchmany(BATCH_ROWS)
+            if not rows:
+                break
+            arrays = [
+                pa.array([row[i] for row in rows], type=field.type)
+                for i, field in enumerate(schema)
+            ]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            rows_written += len(rows)
+
+    cursor.close()
+    return columns, rows_written
+
+def show_create_table(connection, table):
+    """DDL used to create the table on a fresh target"""
+    cursor = connection.cursor()
+    cursor.execute(f"SHOW CREATE TABLE `{table}`")
+    ddl = cursor.fetchone()[1]
+    cursor.close()
+    return ddl
+
+def export_snapshot(source, output_dir=None):
+    """Export all snapshot tables from `source` into a new snapshot directory"""
+    require_pyarrow()
+
+    connection = connect_to_db(source)
+    if not connection:
+        return None
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_dir = output_dir or os.path.join(SNAPSHOT_DIR, f"snapshot_{source}_{timestamp}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    manifest = {
+        'format': 'arrow-ipc',
+        'compression': COMPRESSION,
+        'source': source,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'tables': [],
+    }
+
+    try:
+        catalog = get_catalog(connection)
+
+        for table in SNAPSHOT_TABLES:
+            actual = catalog.resolve(table)
+            if not actual:
+                print(f"   ⚠️  {table}: not found on {source}, skipped")
+                continue
+
+            started = time.perf_counter()
+            file_name = f"{table}.arrow"
+            path = os.path.join(output_dir, file_name)
+            columns, rows = export_table(connection, actual, path)
+            elapsed = time.perf_counter() - started
+            size_kb = os.path.getsize(path) / 1024
+
+            manifest['tables'].append({
+                'name': table,
+                'file': file_name,
+                'rows': rows,
+                'columns': columns,
+                'create_table': show_create_table(connection, actual),
+            })
+            print(f"   ✓ {table:28} {rows:>7} rows  {size_kb:>9.1f} KB  {elapsed:.2f}s")
+
+        with open(os.path.join(output_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+        return output_dir
+
+    finally:
+        if connection.is_connected():
+            connection.close()
+
+def load_value(value):
+    """One field of a LOAD DATA file: \\N for NULL, backslash-escaped bytes otherwise"""
+    if value is None:
+        return b'\\N'
+    if isinstance(value, bytes):
+        raw = value
+    elif isinstance(value, datetime):
+        raw = value.isoformat(sep=' ').encode()
+    elif isinstance(value, timedelta):
+        micros = (value.days * 86400 + value.seconds) * 1_000_000 + value.microseconds
+        sign = '-' if micros < 0 else ''
+        seconds, micros = divmod(abs(micros), 1_000_000)
+        hours, rest = divmod(seconds, 3600)
+        raw = f"{sign}{hours:02d}:{rest // 60:02d}:{rest % 60:02d}.{micros:06d}".encode()
+    elif isinstance(value, bool):
+        raw = b'1' if value else b'0'
+    else:
+        raw = str(value).encode('utf-8')
+    return (raw.replace(b'\\', b'\\\\').replace(b'\t', b'\\t').replace(b'\n', b'\\n')
+               .replace(b'\r', b'\\r').replace(b'\0', b'\\0'))
+
+def write_load_file(reader, columns, out):
+    """Write every record batch as MySQL's default LOAD DATA format; returns rows"""
+    rows_written = 0
+    for i in range(reader.num_record_batches):
+        batch = reader.get_batch(i).select(columns)
+        data = [batch.column(j).to_pylist() for j in range(batch.num_columns)]
+        out.writelines(
+            b'\t'.join(load_value(v) for v in row) + b'\n'
+            for row in zip(*data)
+        )
+        rows_written += batch.num_rows
+    return rows_written
+
+def insert_batches(cursor, reader, columns, target_table):
+    """Fallback when LOAD DATA LOCAL is disabled: batched multi-row INSERTs"""
+    col_str = ', '.join(f"`{c}`" for c in columns)
+    placeholders = ', '.join(['%s'] * len(columns))
+    insert_query = f"INSERT INTO `{target_table}` ({col_str}) VALUES ({placeholders})"
+    loaded = 0
+    for i in range(reader.num_record_batches):
+        batch = reader.get_batch(i).select(columns)
+        data = [batch.column(j).to_pylist() for j in range(batch.num_columns)]
+        rows = list(zip(*data))
+        # executemany rewrites simple INSERTs into one multi-row statement
+        cursor.executemany(insert_query, rows)
+        loaded += len(rows)
+    return loaded
+
+def import_table(connection, table_entry, snapshot_dir, target_table):
+    """
+    Replace `target_table` contents with the snapshot file; returns rows loaded.
+
+    The Arrow batches are decoded into a temporary tab-separated file and
+    loaded with one LOAD DATA LOCAL INFILE. Servers with local_infile=OFF
+    get batched INSERTs instead.
+    """
+    path = os.path.join(snapshot_dir, table_entry['file'])
+    target_cols = {c['name'] for c in get_column_info(connection, target_table)}
+    columns = [c['name'] for c in table_entry['columns'] if c['name'] in target_cols]
+    skipped = [c['name'] for c in table_entry['columns'] if c['name'] not in target_cols]
+    if skipped:
+        print(f"      ℹ️  Not on target, skipped: {', '.join(skipped)}")
+
+    col_str = ', '.join(f"`{c}`" for c in columns)
+    cursor = connection.cursor()
+    load_path = None
+    try:
+        cursor.execute(f"DELETE FROM `{target_table}`")
+
+        with pa.memory_map(path, 'r') as source:
+            reader = pa.ipc.open_file(source)
+
+            with tempfile.NamedTemporaryFile('wb', suffix='.tsv', delete=False) as out:
+                load_path = out.name
+                write_load_file(reader, columns, out)
+
+            try:
+                cursor.execute(f"""
+                    LOAD DATA LOCAL INFILE %s INTO TABLE `{target_table}`
+                    CHARACTER SET utf8mb4
+                    FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+                    LINES TERMINATED BY '\\n'
+                    ({col_str})
+                """, (load_path,))
+                loaded = cursor.rowcount
+            except Error as e:
+                if e.errno not in LOCAL_INFILE_ERRORS:
+                    raise
+                print(f"      ℹ️  LOAD DATA LOCAL not allowed ({e.msg}), using batched INSERTs")
+                loaded = insert_batches(cursor, reader, columns, target_table)
+
+        connection.commit()
+        return loaded
+    except Error:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+        if load_path and os.path.exists(load_path):
+            os.remove(load_path)
+
+def import_snapshot(snapshot_dir, target, create_missing=False):
+    """Load every table of a snapshot into `target` (bulk, FK checks off)"""
+    require_pyarrow()
+
+    with open(os.path.join(snapshot_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    connection = connect_to_db(target, local_infile=True)
+    if not connection:
+        return False
+
+    cursor = connection.cursor()
+    ok = True
+    try:
+        cursor.execute("SET SESSION FOREIGN_KEY_CHECKS = 0")
+        cursor.execute("SET SESSION UNIQUE_CHECKS = 0")
+        catalog = get_catalog(connection)
+
+        for entry in manifest['tables']:
+            target_table = catalog.resolve(entry['name'])
+
+            if not target_table:
+                if not create_missing:
+                    print(f"   ⚠️  {entry['name']}: missing on {target} (use --create), skipped")
+                    ok = False
+                    continue
+                cursor.execute(entry['create_table'])
+                invalidate_catalog(connection)
+                target_table = entry['name']
+                print(f"   ✓ Created {target_table}")
+
+            started = time.perf_counter()
+            try:
+                loaded = import_table(connection, entry, snapshot_dir, target_table)
+            except Error as e:
+                print(f"   ✗ {entry['name']}: {e}")
+                ok = False
+                continue
+
+            elapsed = time.perf_counter() - started
+            rate = loaded / elapsed if elapsed else 0
+            status = "✓" if loaded == entry['rows'] else "⚠️ "
+            print(f"   {status} {target_table:28} {loaded:>7}/{entry['rows']} rows  "
+                  f"{elapsed:.2f}s  ({rate:.0f} rows/sec)")
+            if loaded != entry['rows']:
+                ok = False
+
+        return ok
+
+    finally:
+        try:
+            cursor.execute("SET SESSION FOREIGN_KEY_CHECKS = 1")
+            cursor.execute("SET SESSION UNIQUE_CHECKS = 1")
+        except Error:
+            pass
+        cursor.close()
+        if connection.is_connected():
+            connection.close()
+
+def show_info(snapshot_dir):
+    """Print the manifest of a snapshot"""
+    with open(os.path.join(snapshot_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    print(f"  Source:      {manifest['source']}")
+    print(f"  Created:     {manifest['created_at']}")
+    print(f"  Format:      {manifest['format']} ({manifest['compression']})\n")
+    for entry in manifest['tables']:
+        size_kb = os.path.getsize(os.path.join(snapshot_dir, entry['file'])) / 1024
+        print(f"  {entry['name']:28} {entry['rows']:>7} rows  {len(entry['columns']):>3} cols  {size_kb:>9.1f} KB")
+
+def main():
+    print("\n" + "="*70)
+    print("  📦 DATABASE SNAPSHOT (ARROW IPC + ZSTD)")
+    print("="*70)
+    print("\n  Usage:")
+    print("    python snapshot.py export <source> [output_dir]")
+    print("    python snapshot.py import <snapshot_dir> <target> [--create] [--yes]")
+    print("    python snapshot.py info <snapshot_dir>")
+    print("\n  <source>/<target>: local, railway, or NAME (reads NAME_DB_* variables)")
+    print("="*70 + "\n")
+
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    if not args:
+        return
+
+    command = args[0]
+
+    if command == 'export' and len(args) >= 2:
+        output_dir = export_snapshot(args[1], args[2] if len(args) > 2 else None)
+        if output_dir:
+            print(f"\n✅ Snapshot written to {output_dir}\n")
+
+    elif command == 'import' and len(args) >= 3:
+        snapshot_dir, target = args[1], args[2]
+        if '--yes' not in sys.argv:
+            print(f"⚠️  This REPLACES all snapshot tables on '{target}'. Continue? (yes/no): ", end='')
+            if input().strip().lower() not in ['yes', 'y']:
+                print("\n❌ Cancelled. No changes made.")
+                return
+        if import_snapshot(snapshot_dir, target, create_missing='--create' in sys.argv):
+            print(f"\n✅ Snapshot restored to {target}\n")
+        else:
+            print(f"\n⚠️  Snapshot restored to {target} with problems (see above)\n")
+
+    elif command == 'info' and len(args) >= 2:
+        show_info(args[1])
+
+    else:
+        print(f"✗ Unknown or incomplete command: {' '.join(args)}")
+
+if __name__ == "__main__":
+    main()
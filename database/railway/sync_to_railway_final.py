@@ -1,11 +1,65 @@
 import mysql.connector
 from mysql.connector import Error
 import os
+import sys
+import json
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from datetime import datetime
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from database.schema_catalog import get_catalog, invalidate_catalog
+from database.summary_tables import SUMMARY_TABLE, create_summary_table_sql
 
 load_dotenv()
 
+# Natural key per local table - Railway uses its own auto-increment `id`,
+# so rows are matched on these columns in incremental mode
+SYNC_KEYS = {
+    'tax_summit_master_data': ['Client_Name'],
+    'Tax_Persons_details': ['Client_Name', 'Phone_Number'],
+    'CFO_Persons_details': ['Company_Name', 'Phone_Number_4'],
+    'Other_Persons_Details': ['Company_Name', 'Phone_Number_10'],
+    'Tax_Persons_Analysis': ['Client_Name', 'Phone_Number'],
+    'CFO_Persons_Analysis': ['Company_Name', 'Phone_Number_4'],
+    'Other_Persons_Analysis': ['Company_Name', 'Phone_Number_10'],
+    SUMMARY_TABLE: ['Group_Key'],
+}
+
+# Tables with Last_Updated (set on every trigger UPDATE) use a timestamp
+# watermark; everything else is compared by row hash
+WATERMARK_COLUMNS = ['Last_Updated', 'Data_Insert_Time']
+
+# Re-read rows stamped slightly before the stored watermark in case a
+# transaction committed late
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+# Keys per DELETE/SELECT ... WHERE (key) IN (...) statement
+KEY_CHUNK = 500
+
+# Streaming reads: rows per fetchmany() and how many fetched batches may
+# wait in memory for the Railway writer
+FETCH_SIZE = 1000
+QUEUE_DEPTH = 4
+
+# Multi-row INSERT sizing: start at 64 KB per statement and grow/shrink
+# so each round trip to Railway takes about TARGET_BATCH_SECONDS, never
+# exceeding half of the server's max_allowed_packet
+INITIAL_BATCH_BYTES = 64 * 1024
+MIN_BATCH_BYTES = 8 * 1024
+TARGET_BATCH_SECONDS = 0.5
+
+# Railway connections used concurrently by the table scheduler
+SYNC_WORKERS = int(os.getenv("SYNC_WORKERS", 4))
+
+SYNC_STATE_FILE = os.getenv(
+    "SYNC_STATE_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sync_state.json')
+)
+
 def connect_to_db(db_type):
     """Connect to local or railway database"""
     try:
@@ -23,7 +77,9 @@ def connect_to_db(db_type):
                 'user': os.getenv("RAILWAY_DB_USER"),
                 'password': os.getenv("RAILWAY_DB_PASS"),
                 'database': os.getenv("RAILWAY_DB_NAME"),
-                'port': int(os.getenv("RAILWAY_DB_PORT", 3306))
+                'port': int(os.getenv("RAILWAY_DB_PORT", 3306)),
+                # zlib protocol compression - the WAN link is the bottleneck
+                'compress': True
             }
         
         connection = mysql.connector.connect(**config)
@@ -34,104 +90,560 @@ def connect_to_db(db_type):
         print(f"   ✗ Error connecting to {db_type}: {e}")
         return None
 
+_log_context = threading.local()
+
+def log(message):
+    """print() that tags lines with the table being synced when running in parallel"""
+    tag = getattr(_log_context, 'tag', None)
+    if tag:
+        body = message.lstrip('\n')
+        message = message[:len(message) - len(body)] + f"[{tag}] " + body
+    print(message, flush=True)
+
 def get_columns(connection, table_name):
-    """Get list of columns in a table"""
-    cursor = connection.cursor()
+    """Get set of writable columns in a table (generated columns are skipped)"""
     try:
-        cursor.execute(f"SHOW COLUMNS FROM `{table_name}`")
-        columns = [row[0] for row in cursor.fetchall()]
-        return set(columns)
+        return get_catalog(connection).column_set(table_name, writable_only=True)
     except Error:
         return set()
+
+def stream_rows(connection, queries):
+    """
+    Yield rows (tuples) for each (sql, params) in `queries`.
+
+    A background thread reads them with an unbuffered cursor in batches
+    of FETCH_SIZE and hands them over through a queue of QUEUE_DEPTH
+    batches. Local reads therefore overlap with Railway writes, and
+    memory stays flat whatever the table size. `connection` must not be
+    used by anyone else until the generator is exhausted or closed.
+    """
+    batches = queue.Queue(maxsize=QUEUE_DEPTH)
+    stop = threading.Event()
+    done = object()
+    
+    def put(item):
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        cursor = connection.cursor()
+        try:
+            for sql, params in queries:
+                cursor.execute(sql, params)
+                while True:
+                    rows = cursor.fetchmany(FETCH_SIZE)
+                    if not rows:
+                        break
+                    if not put(rows):
+                        return
+            put(done)
+        except Exception as e:
+            put(e)
+        finally:
+            try:
+                cursor.close()
+            except Error:
+                pass  # unread rows left behind when the consumer stopped early
+    
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    
+    try:
+        while True:
+            item = batches.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield from item
     finally:
-        cursor.close()
+        stop.set()
+        producer.join()
+
+def estimate_row_bytes(row):
+    """Approximate size of a row's VALUES tuple in the SQL statement"""
+    size = 2
+    for value in row:
+        if value is None:
+            size += 5
+        elif isinstance(value, str):
+            size += len(value.encode('utf-8')) + 3
+        else:
+            size += len(str(value)) + 3
+    return size
+
+def next_batch_budget(budget, elapsed, packet_limit):
+    """Grow the byte budget on fast round trips, shrink it on slow ones"""
+    if elapsed < TARGET_BATCH_SECONDS / 2:
+        budget *= 2
+    elif elapsed > TARGET_BATCH_SECONDS * 2:
+        budget //= 2
+    return max(MIN_BATCH_BYTES, min(budget, packet_limit))
+
+def insert_rows(railway_cursor, railway_table, cols_list, rows, stats=None, expected=None,
+                upsert_keys=None):
+    """
+    Send rows as multi-row INSERT ... VALUES (...), (...) statements.
+
+    Statement size is budgeted in bytes, capped by the server's
+    max_allowed_packet, and adapted to the measured round-trip time.
+    With upsert_keys, rows whose unique key already exists are updated
+    in place (ON DUPLICATE KEY UPDATE) instead of failing.
+
+    Returns:
+        int: rows inserted
+    """
+    railway_cursor.execute("SELECT @@max_allowed_packet")
+    packet_limit = int(railway_cursor.fetchone()[0]) // 2
+    
+    insert_cols = ', '.join([f"`{col}`" for col in cols_list])
+    prefix = f"INSERT INTO `{railway_table}` ({insert_cols}) VALUES "
+    row_sql = '(' + ', '.join(['%s'] * len(cols_list)) + ')'
+    suffix = ''
+    if upsert_keys:
+        update_cols = [c for c in cols_list if c not in upsert_keys] or list(upsert_keys)
+        suffix = " ON DUPLICATE KEY UPDATE " + ', '.join(
+            f"`{c}` = VALUES(`{c}`)" for c in update_cols
+        )
+    
+    budget = min(INITIAL_BATCH_BYTES, packet_limit)
+    batch, batch_bytes = [], 0
+    sent = 0
+    next_report = 500
+    started = time.perf_counter()
+    
+    def flush():
+        nonlocal budget, batch, batch_bytes, sent, next_report
+        query = prefix + ', '.join([row_sql] * len(batch)) + suffix
+        params = tuple(value for row in batch for value in row)
+        
+        t0 = time.perf_counter()
+        railway_cursor.execute(query, params)
+        budget = next_batch_budget(budget, time.perf_counter() - t0, packet_limit)
+        
+        sent += len(batch)
+        batch, batch_bytes = [], 0
+        if stats is not None:
+            stats['rows'] = sent
+        if sent >= next_report:
+            log(f"   📝 Inserted {sent}{f'/{expected}' if expected else ''} rows "
+                f"(batch budget {budget // 1024} KB)...")
+            next_report = sent + 500
+    
+    for row in rows:
+        size = estimate_row_bytes(row)
+        if batch and batch_bytes + size > budget:
+            flush()
+        batch.append(row)
+        batch_bytes += size
+    
+    if batch:
+        flush()
+    
+    elapsed = time.perf_counter() - started
+    if sent:
+        log(f"   🚀 {sent} rows in {elapsed:.2f}s ({sent / elapsed if elapsed else 0:.0f} rows/sec)")
+    return sent
 
-def sync_table(local_conn, railway_conn, local_table, railway_table):
-    """Sync a single table from local to railway"""
-    print(f"\n▶ Syncing: {local_table} → {railway_table}")
+def sync_table(local_conn, railway_conn, local_table, railway_table, stats=None):
+    """Sync a single table from local to railway (rows sent go to stats['rows'])"""
+    log(f"\n▶ Syncing: {local_table} → {railway_table}")
     
     # Get columns from both
     local_cols = get_columns(local_conn, local_table)
     railway_cols = get_columns(railway_conn, railway_table)
     
     if not railway_cols:
-        print(f"   ✗ Railway table '{railway_table}' doesn't exist!")
+        log(f"   ✗ Railway table '{railway_table}' doesn't exist!")
         return False
     
     if not local_cols:
-        print(f"   ✗ Local table '{local_table}' doesn't exist!")
+        log(f"   ✗ Local table '{local_table}' doesn't exist!")
         return False
     
     # Find common columns (exclude id)
     common_cols = (local_cols & railway_cols) - {'id'}
     
     if not common_cols:
-        print(f"   ⚠️  No common columns!")
-        print(f"      Local has: {sorted(list(local_cols)[:5])}...")
-        print(f"      Railway has: {sorted(list(railway_cols)[:5])}...")
+        log(f"   ⚠️  No common columns!")
+        log(f"      Local has: {sorted(list(local_cols)[:5])}...")
+        log(f"      Railway has: {sorted(list(railway_cols)[:5])}...")
         return False
     
-    print(f"   📊 Syncing {len(common_cols)} common columns")
+    log(f"   📊 Syncing {len(common_cols)} common columns")
     
-    local_cursor = local_conn.cursor(dictionary=True)
+    local_cursor = local_conn.cursor(buffered=True)
     railway_cursor = railway_conn.cursor()
     
     try:
         # Get data from local
-        cols_list = list(common_cols)
+        cols_list = sorted(common_cols)
         cols_str = ', '.join([f"`{col}`" for col in cols_list])
         
-        local_cursor.execute(f"SELECT {cols_str} FROM `{local_table}`")
-        rows = local_cursor.fetchall()
+        local_cursor.execute(f"SELECT COUNT(*) FROM `{local_table}`")
+        row_count = local_cursor.fetchone()[0]
         
-        if not rows:
-            print(f"   ℹ No data in local table")
+        if not row_count:
+            log(f"   ℹ No data in local table")
             return True
         
-        print(f"   📊 Found {len(rows)} rows in local")
+        log(f"   📊 Found {row_count} rows in local")
         
         # Clear Railway table
-        print(f"   🗑️ Clearing Railway table...")
+        log(f"   🗑️ Clearing Railway table...")
         railway_cursor.execute(f"DELETE FROM `{railway_table}`")
-        print(f"   ✓ Deleted {railway_cursor.rowcount} rows")
-        
-        # Insert data
-        placeholders = ', '.join(['%s'] * len(cols_list))
-        insert_cols = ', '.join([f"`{col}`" for col in cols_list])
-        insert_query = f"INSERT INTO `{railway_table}` ({insert_cols}) VALUES ({placeholders})"
-        
-        batch_size = 100
-        total = 0
+        log(f"   ✓ Deleted {railway_cursor.rowcount} rows")
         
-        for i in range(0, len(rows), batch_size):
-            batch = rows[i:i + batch_size]
-            values = [tuple(row[col] for col in cols_list) for row in batch]
-            railway_cursor.executemany(insert_query, values)
-            total += len(values)
-            if total % 500 == 0 or i + batch_size >= len(rows):
-                print(f"   📝 Inserted {total}/{len(rows)} rows...")
+        # Stream rows straight from the local server into Railway
+        rows = stream_rows(local_conn, [(f"SELECT {cols_str} FROM `{local_table}`", ())])
+        insert_rows(railway_cursor, railway_table, cols_list, rows, stats, expected=row_count)
         
         railway_conn.commit()
         
         # Verify
         railway_cursor.execute(f"SELECT COUNT(*) FROM `{railway_table}`")
         count = railway_cursor.fetchone()[0]
-        print(f"   ✅ Success! Railway now has {count} rows")
+        log(f"   ✅ Success! Railway now has {count} rows")
+        
+        return True
+        
+    except Error as e:
+        log(f"   ✗ Error: {e}")
+        railway_conn.rollback()
+        return False
+    finally:
+        local_cursor.close()
+        railway_cursor.close()
+
+def load_sync_state():
+    """Load per-table watermarks from sync_state.json"""
+    try:
+        with open(SYNC_STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_sync_state(state):
+    """Write sync_state.json atomically"""
+    temp_file = SYNC_STATE_FILE + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, default=str)
+    os.replace(temp_file, SYNC_STATE_FILE)
+
+def railway_target():
+    """Identify the Railway database the watermarks belong to"""
+    return f"{os.getenv('RAILWAY_DB_HOST')}:{os.getenv('RAILWAY_DB_PORT', 3306)}/{os.getenv('RAILWAY_DB_NAME')}"
+
+def key_predicate(key_cols, count):
+    """WHERE fragment matching `count` key tuples"""
+    if len(key_cols) == 1:
+        return f"`{key_cols[0]}` IN ({', '.join(['%s'] * count)})"
+    cols = ', '.join(f"`{c}`" for c in key_cols)
+    row = '(' + ', '.join(['%s'] * len(key_cols)) + ')'
+    return f"({cols}) IN ({', '.join([row] * count)})"
+
+def flatten_keys(keys):
+    """[(a, b), (c, d)] → (a, b, c, d) for key_predicate() parameters"""
+    return tuple(value for key in keys for value in key)
+
+def row_hash_sql(cols):
+    """Per-row MD5 over the synced columns (NULL-safe, fixed column order)"""
+    parts = ', '.join(f"ISNULL(`{c}`), IFNULL(CAST(`{c}` AS CHAR), '')" for c in cols)
+    return f"MD5(CONCAT_WS('|', {parts}))"
+
+def fetch_row_hashes(connection, table, key_cols, cols):
+    """Return {key tuple: row hash}; rows with a NULL key part are skipped"""
+    cursor = connection.cursor()
+    key_str = ', '.join(f"`{c}`" for c in key_cols)
+    try:
+        cursor.execute(f"SELECT {key_str}, {row_hash_sql(cols)} FROM `{table}`")
+        hashes = {}
+        for row in cursor:
+            key = tuple(row[:-1])
+            if None not in key:
+                hashes[key] = row[-1]
+        return hashes
+    finally:
+        cursor.close()
+
+def fetch_keys(connection, table, key_cols, where='', params=()):
+    """Return the set of key tuples (optionally filtered)"""
+    cursor = connection.cursor()
+    key_str = ', '.join(f"`{c}`" for c in key_cols)
+    try:
+        cursor.execute(f"SELECT {key_str} FROM `{table}` {where}", params)
+        return {tuple(row) for row in cursor if None not in row}
+    finally:
+        cursor.close()
+
+def watermark_sql(ts_cols):
+    """Latest timestamp of a row across its timestamp columns"""
+    if len(ts_cols) == 1:
+        return f"`{ts_cols[0]}`"
+    return "GREATEST(" + ', '.join(f"COALESCE(`{c}`, '1970-01-01')" for c in ts_cols) + ")"
+
+def sync_table_incremental(local_conn, railway_conn, local_table, railway_table, state, stats=None):
+    """
+    Send only inserted, changed and deleted rows to Railway.
+
+    - Deletes: keys present on Railway but no longer local
+    - Inserts: keys present locally but missing on Railway
+    - Changes: rows stamped at/after the stored watermark (tables with
+      Last_Updated), otherwise rows whose hash differs on both sides
+
+    Changed rows are upserted (ON DUPLICATE KEY UPDATE on the Railway
+    unique keys) rather than deleted and re-inserted, so ON DELETE CASCADE
+    children of a changed master row are left alone. Only keys that are
+    gone locally are deleted.
+
+    Everything is applied in one Railway transaction, so the table is
+    never empty mid-sync. Returns True on success.
+    """
+    log(f"\n▶ Incremental: {local_table} → {railway_table}")
+    
+    key_cols = SYNC_KEYS.get(local_table)
+    if not key_cols:
+        log(f"   ℹ️  No natural key configured, falling back to full sync")
+        return sync_table(local_conn, railway_conn, local_table, railway_table, stats)
+    
+    local_cols = get_columns(local_conn, local_table)
+    railway_cols = get_columns(railway_conn, railway_table)
+    
+    if not railway_cols:
+        log(f"   ✗ Railway table '{railway_table}' doesn't exist!")
+        return False
+    if not local_cols:
+        log(f"   ✗ Local table '{local_table}' doesn't exist!")
+        return False
+    
+    cols_list = sorted((local_cols & railway_cols) - {'id'})
+    if not set(key_cols) <= set(cols_list):
+        log(f"   ⚠️  Key columns {key_cols} missing on one side, falling back to full sync")
+        return sync_table(local_conn, railway_conn, local_table, railway_table, stats)
+    
+    table_state = state.get(railway_table, {})
+    if table_state.get('target') != railway_target():
+        table_state = {}
+    
+    ts_cols = [c for c in WATERMARK_COLUMNS if c in local_cols]
+    use_watermark = 'Last_Updated' in ts_cols and table_state.get('watermark')
+    
+    local_cursor = local_conn.cursor(buffered=True)
+    railway_cursor = railway_conn.cursor()
+    
+    try:
+        # Capture the new watermark before reading so concurrent writes are
+        # picked up next run rather than lost
+        new_watermark = None
+        if ts_cols:
+            local_cursor.execute(f"SELECT MAX({watermark_sql(ts_cols)}) FROM `{local_table}`")
+            new_watermark = local_cursor.fetchone()[0]
+        
+        if use_watermark:
+            since = datetime.fromisoformat(table_state['watermark']) - WATERMARK_OVERLAP
+            local_keys = fetch_keys(local_conn, local_table, key_cols)
+            railway_keys = fetch_keys(railway_conn, railway_table, key_cols)
+            changed = fetch_keys(
+                local_conn, local_table, key_cols,
+                f"WHERE {watermark_sql(ts_cols)} >= %s", (since,)
+            ) & railway_keys
+            log(f"   🕒 Watermark mode (since {since})")
+        else:
+            local_hashes = fetch_row_hashes(local_conn, local_table, key_cols, cols_list)
+            railway_hashes = fetch_row_hashes(railway_conn, railway_table, key_cols, cols_list)
+            local_keys = set(local_hashes)
+            railway_keys = set(railway_hashes)
+            changed = {
+                key for key in local_keys & railway_keys
+                if local_hashes[key] != railway_hashes[key]
+            }
+            log(f"   #️⃣  Row-hash mode")
+        
+        deleted = railway_keys - local_keys
+        inserted = local_keys - railway_keys
+        
+        log(f"   📊 +{len(inserted)} new, ~{len(changed)} changed, -{len(deleted)} deleted "
+              f"(of {len(local_keys)} local rows)")
+        
+        # Remove only rows that are gone locally - deleting a changed master
+        # row would cascade to its child rows on Railway
+        to_remove = list(deleted)
+        for i in range(0, len(to_remove), KEY_CHUNK):
+            chunk = to_remove[i:i + KEY_CHUNK]
+            railway_cursor.execute(
+                f"DELETE FROM `{railway_table}` WHERE {key_predicate(key_cols, len(chunk))}",
+                flatten_keys(chunk)
+            )
+        
+        # Upsert new + changed rows
+        to_send = list(inserted | changed)
+        cols_str = ', '.join(f"`{c}`" for c in cols_list)
+        
+        queries = [
+            (f"SELECT {cols_str} FROM `{local_table}` WHERE {key_predicate(key_cols, len(chunk))}",
+             flatten_keys(chunk))
+            for chunk in (to_send[i:i + KEY_CHUNK] for i in range(0, len(to_send), KEY_CHUNK))
+        ]
+        rows = stream_rows(local_conn, queries)
+        sent = insert_rows(railway_cursor, railway_table, cols_list, rows, stats,
+                           expected=len(to_send), upsert_keys=key_cols)
+        
+        railway_conn.commit()
         
+        state[railway_table] = {
+            'target': railway_target(),
+            'watermark': new_watermark.isoformat() if new_watermark else None,
+            'synced_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        
+        log(f"   ✅ Sent {sent} rows, removed {len(to_remove)}")
         return True
         
     except Error as e:
-        print(f"   ✗ Error: {e}")
+        log(f"   ✗ Error: {e}")
         railway_conn.rollback()
         return False
     finally:
         local_cursor.close()
         railway_cursor.close()
 
+def ensure_railway_summary_table(railway_conn):
+    """Create the summary table on a Railway database set up before it existed"""
+    if get_catalog(railway_conn).has_table(SUMMARY_TABLE):
+        return True
+    cursor = railway_conn.cursor()
+    try:
+        cursor.execute(create_summary_table_sql())
+        railway_conn.commit()
+        invalidate_catalog(railway_conn)
+        print(f"✓ Created {SUMMARY_TABLE} on Railway")
+        return True
+    except Error as e:
+        print(f"⚠️  Couldn't create {SUMMARY_TABLE} on Railway, skipping it: {e}")
+        return False
+    finally:
+        cursor.close()
+
+def get_fk_dependencies(connection, tables):
+    """
+    Build {railway_table: {parent railway tables}} from the Railway FKs
+    (information_schema.KEY_COLUMN_USAGE), matched case-insensitively.
+    """
+    names = {railway_table.lower(): railway_table for _, railway_table in tables}
+    deps = {railway_table: set() for _, railway_table in tables}
+    
+    cursor = connection.cursor()
+    try:
+        cursor.execute("""
+            SELECT DISTINCT TABLE_NAME, REFERENCED_TABLE_NAME
+            FROM information_schema.KEY_COLUMN_USAGE
+            WHERE TABLE_SCHEMA = DATABASE()
+              AND REFERENCED_TABLE_NAME IS NOT NULL
+        """)
+        for child, parent in cursor.fetchall():
+            child, parent = names.get(child.lower()), names.get(parent.lower())
+            if child and parent and child != parent:
+                deps[child].add(parent)
+    except Error as e:
+        print(f"   ⚠️  Could not read foreign keys ({e}), syncing master first")
+        master = names.get('tax_summit_master_data')
+        for table in deps:
+            if master and table != master:
+                deps[table].add(master)
+    finally:
+        cursor.close()
+    
+    return deps
+
+def dependency_levels(tables, deps):
+    """Group tables into levels; every table comes after all of its FK parents"""
+    remaining = [t for t in tables]
+    done = set()
+    levels = []
+    
+    while remaining:
+        level = [t for t in remaining if deps[t[1]] <= done]
+        if not level:
+            print(f"   ⚠️  FK cycle between {[t[1] for t in remaining]}, syncing them together")
+            level = remaining
+        levels.append(level)
+        done |= {railway_table for _, railway_table in level}
+        remaining = [t for t in remaining if t not in level]
+    
+    return levels
+
+def sync_worker(local_table, railway_table, incremental, state):
+    """Sync one table over its own pair of connections and time it"""
+    _log_context.tag = railway_table
+    stats = {'rows': 0}
+    started = time.perf_counter()
+    ok = False
+    
+    local_conn = connect_to_db('local')
+    railway_conn = connect_to_db('railway')
+    
+    try:
+        if local_conn and railway_conn:
+            if incremental:
+                ok = sync_table_incremental(local_conn, railway_conn, local_table, railway_table, state, stats)
+            else:
+                ok = sync_table(local_conn, railway_conn, local_table, railway_table, stats)
+    finally:
+        for conn in (local_conn, railway_conn):
+            if conn and conn.is_connected():
+                conn.close()
+        _log_context.tag = None
+    
+    return {
+        'table': local_table,
+        'ok': ok,
+        'rows': stats['rows'],
+        'seconds': time.perf_counter() - started,
+    }
+
+def run_sync_schedule(levels, deps, incremental, state, workers):
+    """Run each dependency level concurrently; skip children of failed parents"""
+    results = []
+    failed_railway = set()
+    
+    for number, level in enumerate(levels, 1):
+        runnable = [t for t in level if not (deps[t[1]] & failed_railway)]
+        for local_table, railway_table in level:
+            if (local_table, railway_table) not in runnable:
+                print(f"\n⏭️  Skipping {local_table}: a parent table failed to sync")
+                results.append({'table': local_table, 'ok': False, 'rows': 0, 'seconds': 0.0})
+                failed_railway.add(railway_table)
+        
+        if not runnable:
+            continue
+        
+        print(f"\n📦 Level {number}: {', '.join(t[0] for t in runnable)}")
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(runnable)))) as executor:
+            futures = [
+                executor.submit(sync_worker, local_table, railway_table, incremental, state)
+                for local_table, railway_table in runnable
+            ]
+            for (local_table, railway_table), future in zip(runnable, futures):
+                result = future.result()
+                results.append(result)
+                if not result['ok']:
+                    failed_railway.add(railway_table)
+    
+    return results
+
 def main():
+    incremental = '--incremental' in sys.argv
+    
     print("\n" + "="*70)
     print("  🚂 SYNC LOCAL → RAILWAY (CASE-INSENSITIVE)")
     print("="*70)
+    print(f"  Mode: {'INCREMENTAL (changed rows only)' if incremental else 'FULL (clear + reload)'}")
     print(f"  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("="*70 + "\n")
     
@@ -146,7 +658,13 @@ def main():
         ('Other_Persons_Analysis', 'other_persons_analysis'),
     ]
     
-    # Connect
+    workers = SYNC_WORKERS
+    if '--workers' in sys.argv:
+        workers = int(sys.argv[sys.argv.index('--workers') + 1])
+    if '--sequential' in sys.argv:
+        workers = 1
+    
+    # Connect (connectivity check + FK graph)
     print("🔌 Connecting to databases...\n")
     local_conn = connect_to_db('local')
     railway_conn = connect_to_db('railway')
@@ -155,22 +673,39 @@ def main():
         print("\n❌ Connection failed!")
         return
     
-    print("\n📋 Starting sync...\n")
+    # The summary table is kept current by triggers on the local server;
+    # syncing it keeps Railway's copy in step without triggers there
+    if get_catalog(local_conn).has_table(SUMMARY_TABLE) and ensure_railway_summary_table(railway_conn):
+        tables.append((SUMMARY_TABLE, SUMMARY_TABLE))
     
-    success = 0
-    failed = []
+    deps = get_fk_dependencies(railway_conn, tables)
+    local_conn.close()
+    railway_conn.close()
     
-    for local_table, railway_table in tables:
-        if sync_table(local_conn, railway_conn, local_table, railway_table):
-            success += 1
-        else:
-            failed.append(local_table)
+    levels = dependency_levels(tables, deps)
+    print(f"\n📋 Starting sync ({len(levels)} dependency levels, up to {workers} tables at a time)...")
     
-    # Close connections
-    if local_conn.is_connected():
-        local_conn.close()
-    if railway_conn.is_connected():
-        railway_conn.close()
+    state = load_sync_state() if incremental else None
+    started = time.perf_counter()
+    results = run_sync_schedule(levels, deps, incremental, state, workers)
+    elapsed = time.perf_counter() - started
+    
+    if incremental:
+        save_sync_state(state)
+        print(f"\n💾 Watermarks saved to {SYNC_STATE_FILE}")
+    
+    success = sum(1 for r in results if r['ok'])
+    failed = [r['table'] for r in results if not r['ok']]
+    
+    # Per-table throughput
+    print("\n" + "="*70)
+    print(f"  {'Table':28} {'Rows':>8} {'Seconds':>9} {'Rows/sec':>10}")
+    print("  " + "-"*58)
+    for r in results:
+        rate = r['rows'] / r['seconds'] if r['seconds'] > 0 else 0
+        status = '' if r['ok'] else '  ✗'
+        print(f"  {r['table']:28} {r['rows']:>8} {r['seconds']:>9.2f} {rate:>10.0f}{status}")
+    print(f"\n  Wall clock: {elapsed:.2f}s (sum of tables: {sum(r['seconds'] for r in results):.2f}s)")
     
     # Summary
     print("\n" + "="*70)
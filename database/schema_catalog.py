@@ -0,0 +1,179 @@
+"""
+Cached schema catalog.
+
+Loads every table, column and index of the current database in ONE
+information_schema query and keeps it per server/database for the life
+of the process. Instead of reloading after CATALOG_MAX_AGE seconds, a
+cheap fingerprint query (CRC32 over column/index definitions) is run
+and the catalog is only rebuilt when the schema actually changed.
+
+Table names resolve case-insensitively, so local
+`Tax_Persons_Analysis` and Railway `tax_persons_analysis` are the same
+table to callers.
+
+    catalog = get_catalog(connection)
+    table = catalog.resolve('Tax_Persons_Analysis')      # actual name or None
+    cols = catalog.column_set(table, writable_only=True)
+"""
+import os
+import threading
+import time
+
+CATALOG_MAX_AGE = float(os.getenv("SCHEMA_CATALOG_MAX_AGE", 300))
+
+CATALOG_QUERY = """
+    SELECT 'column' AS kind, TABLE_NAME, COLUMN_NAME, ORDINAL_POSITION AS position,
+           DATA_TYPE, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY, EXTRA,
+           NULL AS INDEX_NAME, NULL AS NON_UNIQUE
+    FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE()
+    UNION ALL
+    SELECT 'index', TABLE_NAME, COLUMN_NAME, SEQ_IN_INDEX,
+           NULL, NULL, NULL, NULL, NULL,
+           INDEX_NAME, NON_UNIQUE
+    FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE()
+    ORDER BY kind, TABLE_NAME, INDEX_NAME, position
+"""
+
+FINGERPRINT_QUERY = """
+    SELECT
+        (SELECT CONCAT(COUNT(*), ':', COALESCE(SUM(CRC32(CONCAT_WS('|',
+                TABLE_NAME, COLUMN_NAME, ORDINAL_POSITION, COLUMN_TYPE, IS_NULLABLE, EXTRA))), 0))
+         FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE()),
+        (SELECT CONCAT(COUNT(*), ':', COALESCE(SUM(CRC32(CONCAT_WS('|',
+                TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX, COLUMN_NAME, NON_UNIQUE))), 0))
+         FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE())
+"""
+
+# EXTRA of generated columns. MySQL 8.0.13+ also reports DEFAULT_GENERATED
+# for `DEFAULT CURRENT_TIMESTAMP` columns, which are ordinary writable columns
+GENERATED_EXTRA = ('VIRTUAL GENERATED', 'STORED GENERATED', 'PERSISTENT GENERATED')
+
+_cache = {}
+_lock = threading.Lock()
+
+def is_generated(extra):
+    """True for a generated column's information_schema EXTRA value"""
+    extra = (extra or '').upper()
+    return any(kind in extra for kind in GENERATED_EXTRA)
+
+class SchemaCatalog:
+    """Snapshot of one database's tables, columns and indexes"""
+
+    def __init__(self, tables, fingerprint):
+        self.tables = tables
+        self.fingerprint = fingerprint
+        self.loaded_at = time.monotonic()
+        self._by_lower = {name.lower(): name for name in tables}
+
+    def resolve(self, name):
+        """Actual table name for `name` (case-insensitive), or None"""
+        if name in self.tables:
+            return name
+        return self._by_lower.get(name.lower())
+
+    def has_table(self, name):
+        return self.resolve(name) is not None
+
+    def column_info(self, table):
+        """List of column dicts (name, data_type, column_type, nullable, key, extra, generated)"""
+        actual = self.resolve(table)
+        return list(self.tables[actual]['columns']) if actual else []
+
+    def columns(self, table, writable_only=False):
+        """Column names in table order (writable_only skips generated columns)"""
+        return [
+            c['name'] for c in self.column_info(table)
+            if not (writable_only and c['generated'])
+        ]
+
+    def column_set(self, table, writable_only=False):
+        return set(self.columns(table, writable_only))
+
+    def has_column(self, table, column):
+        return column.lower() in {c.lower() for c in self.columns(table)}
+
+    def indexes(self, table):
+        """{index name: {'unique': bool, 'columns': [...]}}"""
+        actual = self.resolve(table)
+        return dict(self.tables[actual]['indexes']) if actual else {}
+
+def _cache_key(connection):
+    # `connection.database` costs a round trip; the name given at connect
+    # time is enough to tell databases apart
+    database = getattr(connection, '_database', None) or connection.database
+    return (
+        getattr(connection, 'server_host', None),
+        getattr(connection, 'server_port', None),
+        database,
+    )
+
+def _fingerprint(connection):
+    cursor = connection.cursor()
+    try:
+        cursor.execute(FINGERPRINT_QUERY)
+        return '/'.join(str(v) for v in cursor.fetchone())
+    finally:
+        cursor.close()
+
+def load_catalog(connection):
+    """Build a SchemaCatalog with one information_schema round trip (uncached)"""
+    fingerprint = _fingerprint(connection)
+    cursor = connection.cursor(dictionary=True)
+    try:
+        cursor.execute(CATALOG_QUERY)
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+
+    tables = {}
+    for row in rows:
+        table = tables.setdefault(row['TABLE_NAME'], {'columns': [], 'indexes': {}})
+        if row['kind'] == 'column':
+            table['columns'].append({
+                'name': row['COLUMN_NAME'],
+                'data_type': (row['DATA_TYPE'] or '').lower(),
+                'column_type': row['COLUMN_TYPE'],
+                'nullable': row['IS_NULLABLE'] == 'YES',
+                'key': row['COLUMN_KEY'],
+                'extra': row['EXTRA'],
+                'generated': is_generated(row['EXTRA']),
+            })
+        else:
+            index = table['indexes'].setdefault(
+                row['INDEX_NAME'], {'unique': not int(row['NON_UNIQUE']), 'columns': []}
+            )
+            index['columns'].append(row['COLUMN_NAME'])
+
+    return SchemaCatalog(tables, fingerprint)
+
+def get_catalog(connection, max_age=CATALOG_MAX_AGE):
+    """
+    Shared, cached catalog for the connection's server + database.
+
+    Within `max_age` seconds the cached catalog is returned as is; after
+    that the fingerprint is checked and the catalog only reloaded if the
+    schema changed.
+    """
+    key = _cache_key(connection)
+    with _lock:
+        catalog = _cache.get(key)
+        if catalog and time.monotonic() - catalog.loaded_at < max_age:
+            return catalog
+
+        if catalog and _fingerprint(connection) == catalog.fingerprint:
+            catalog.loaded_at = time.monotonic()
+            return catalog
+
+        catalog = load_catalog(connection)
+        _cache[key] = catalog
+        return catalog
+
+def invalidate_catalog(connection=None):
+    """Drop the cached catalog (after DDL); all of them when connection is None"""
+    with _lock:
+        if connection is None:
+            _cache.clear()
+        else:
+            _cache.pop(_cache_key(connection), None)
@@ -1,8 +1,12 @@
 import mysql.connector
 from mysql.connector import Error
 import os
+import sys
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from database.phone_utils import has_phone_sql, phone_key_column
+
 load_dotenv()
 
 def connect_to_mysql(host, user, password, database):
@@ -130,6 +134,11 @@ def create_analysis_tables(connection):
 def create_analysis_triggers(connection):
     """Create triggers to auto-populate analysis tables from master table"""
     cursor = connection.cursor()
+    # Match analysis rows on the normalized phone (idx_phone_client) when
+    # add_phone_norm_index.py has added it, else on the raw column
+    tax_phone = phone_key_column(connection, 'Phone_Number', 'tax_summit_master_data', 'Tax_Persons_Analysis')
+    cfo_phone = phone_key_column(connection, 'Phone_Number_4', 'tax_summit_master_data', 'CFO_Persons_Analysis')
+    other_phone = phone_key_column(connection, 'Phone_Number_10', 'tax_summit_master_data', 'Other_Persons_Analysis')
     
     # Drop existing triggers first
     drop_triggers = [
@@ -144,13 +153,13 @@ def create_analysis_triggers(connection):
             pass
     
     # Trigger for INSERT - populates analysis tables when new row added to master
-    insert_trigger = """
+    insert_trigger = f"""
     CREATE TRIGGER after_master_insert_analysis
     AFTER INSERT ON tax_summit_master_data
     FOR EACH ROW
     BEGIN
         -- Insert into Tax_Persons_Analysis (only if Phone_Number is not null and doesn't exist)
-        IF NEW.Phone_Number IS NOT NULL AND NEW.Phone_Number != '' THEN
+        IF {has_phone_sql(tax_phone, 'NEW.')} THEN
             INSERT IGNORE INTO Tax_Persons_Analysis 
                 (Client_Name, Practice_Head, Partner, Invite_Status, numInvitees, Response, 
                  Sector, numRegistrations, Tax_Contact, Designation, Email_ID, Phone_Number, 
@@ -163,7 +172,7 @@ def create_analysis_triggers(connection):
         END IF;
         
         -- Insert into CFO_Persons_Analysis (only if Phone_Number_4 is not null and doesn't exist)
-        IF NEW.Phone_Number_4 IS NOT NULL AND NEW.Phone_Number_4 != '' THEN
+        IF {has_phone_sql(cfo_phone, 'NEW.')} THEN
             INSERT IGNORE INTO CFO_Persons_Analysis 
                 (Company_Name, Practice_Head, Partner, Invite_Status, numInvitees, Response, 
                  Sector, numRegistrations, CFO_Name, Designation_2, Email_ID_3, Phone_Number_4, 
@@ -176,7 +185,7 @@ def create_analysis_triggers(connection):
         END IF;
         
         -- Insert into Other_Persons_Analysis (only if Phone_Number_10 is not null and doesn't exist)
-        IF NEW.Phone_Number_10 IS NOT NULL AND NEW.Phone_Number_10 != '' THEN
+        IF {has_phone_sql(other_phone, 'NEW.')} THEN
             INSERT IGNORE INTO Other_Persons_Analysis 
                 (Company_Name, Practice_Head, Partner, Invite_Status, numInvitees, Response, 
                  Sector, numRegistrations, Others, Designation_8, Email_ID_9, Phone_Number_10, 
@@ -191,7 +200,7 @@ def create_analysis_triggers(connection):
     """
     
     # Trigger for UPDATE - updates analysis tables when master table is updated
-    update_trigger = """
+    update_trigger = f"""
     CREATE TRIGGER after_master_update_analysis
     AFTER UPDATE ON tax_summit_master_data
     FOR EACH ROW
@@ -210,8 +219,9 @@ def create_analysis_triggers(connection):
             Designation = NEW.Designation,
             Email_ID = NEW.Email_ID,
             Location = NEW.Location,
-            Response_1 = NEW.Response_1
-        WHERE Phone_Number = NEW.Phone_Number;
+            Response_1 = NEW.Response_1,
+            Phone_Number = NEW.Phone_Number
+        WHERE {tax_phone} = NEW.{tax_phone};
         
         -- Update CFO_Persons_Analysis
         UPDATE CFO_Persons_Analysis 
@@ -227,8 +237,9 @@ def create_analysis_triggers(connection):
             Designation_2 = NEW.Designation_2,
             Email_ID_3 = NEW.Email_ID_3,
             Location_6 = NEW.Location_6,
-            Response_7 = NEW.Response_7
-        WHERE Phone_Number_4 = NEW.Phone_Number_4;
+            Response_7 = NEW.Response_7,
+            Phone_Number_4 = NEW.Phone_Number_4
+        WHERE {cfo_phone} = NEW.{cfo_phone};
         
         -- Update Other_Persons_Analysis
         UPDATE Other_Persons_Analysis 
@@ -244,8 +255,9 @@ def create_analysis_triggers(connection):
             Designation_8 = NEW.Designation_8,
             Email_ID_9 = NEW.Email_ID_9,
             Location_12 = NEW.Location_12,
-            Response_13 = NEW.Response_13
-        WHERE Phone_Number_10 = NEW.Phone_Number_10;
+            Response_13 = NEW.Response_13,
+            Phone_Number_10 = NEW.Phone_Number_10
+        WHERE {other_phone} = NEW.{other_phone};
     END
     """
     
@@ -0,0 +1,154 @@
+import mysql.connector
+from mysql.connector import Error
+import os
+import sys
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from database.schema_catalog import get_catalog, invalidate_catalog
+from database.summary_tables import (
+    SUMMARY_SOURCES, SUMMARY_TABLE, create_summary_table_sql, rebuild_summary,
+    summary_drift, trigger_names, trigger_sql
+)
+
+load_dotenv()
+
+# Triggers from when the analysis tables were summarized too - nothing
+# reads those groups, so they are dropped on every run
+RETIRED_TRIGGERS = ['before_master_delete_summary'] + [
+    f"after_{tag}_analysis_{event}_summary"
+    for tag in ('tax', 'cfo', 'other')
+    for event in ('insert', 'update', 'delete')
+]
+
+def connect_to_mysql():
+    """Establish connection to MySQL database"""
+    try:
+        connection = mysql.connector.connect(
+            host=os.getenv("DB_HOST"),
+            user=os.getenv("DB_USER"),
+            password=os.getenv("DB_PASS"),
+            database=os.getenv("DB_NAME"),
+            port=int(os.getenv("DB_PORT", 3306))
+        )
+        if connection.is_connected():
+            print(f"✓ Connected to MySQL database")
+            return connection
+    except Error as e:
+        print(f"✗ Error connecting to MySQL: {e}")
+        return None
+
+def create_summary_table(connection):
+    cursor = connection.cursor()
+    try:
+        cursor.execute(create_summary_table_sql())
+        connection.commit()
+        print(f"  ✓ {SUMMARY_TABLE} ready")
+        return True
+    except Error as e:
+        print(f"  ✗ Error creating {SUMMARY_TABLE}: {e}")
+        return False
+    finally:
+        cursor.close()
+        invalidate_catalog(connection)
+
+def create_summary_triggers(connection):
+    """(Re)create the summary triggers on master"""
+    catalog = get_catalog(connection)
+    cursor = connection.cursor()
+    ok = True
+
+    try:
+        for name in RETIRED_TRIGGERS:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        for source, spec in SUMMARY_SOURCES.items():
+            for name in trigger_names(source):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+            table = catalog.resolve(spec['table'])
+            if not table:
+                print(f"  ⚠️  {spec['table']} not found, skipping")
+                continue
+
+            for name, sql in trigger_sql(source, catalog.column_set(table), table):
+                cursor.execute(sql)
+                print(f"  ✓ Created: {name}")
+
+        connection.commit()
+    except Error as e:
+        print(f"\n  ❌ Error creating triggers: {e}")
+        connection.rollback()
+        ok = False
+    finally:
+        cursor.close()
+    return ok
+
+def report_drift(connection):
+    """Summary totals vs. the source tables, per source"""
+    drift = summary_drift(connection)
+    in_sync = True
+    print(f"\n  {'Source':8} {'Rows':>10} {'Invitees':>10} {'Registrations':>14}")
+    print("  " + "-"*46)
+    for source, totals in drift.items():
+        rows, invitees, registrations = totals['summary']
+        status = '✓' if totals['summary'] == totals['actual'] else '✗'
+        in_sync &= status == '✓'
+        print(f"  {source:8} {rows:>10} {invitees:>10} {registrations:>14}  {status}")
+        if status == '✗':
+            print(f"  {'actual':8} {totals['actual'][0]:>10} {totals['actual'][1]:>10} {totals['actual'][2]:>14}")
+    return in_sync
+
+def main():
+    print("\n" + "="*70)
+    print("  📊 MATERIALIZED SUMMARY TABLE")
+    print("="*70)
+    print("\n  Usage: python create_summary_tables.py [--check | --rebuild]")
+    print("    (default)  create the table + triggers, then rebuild it")
+    print("    --check    compare the summary totals with the source tables")
+    print("    --rebuild  recompute the summary from the source tables")
+    print("="*70 + "\n")
+
+    connection = connect_to_mysql()
+    if not connection:
+        return
+
+    try:
+        if '--check' in sys.argv:
+            in_sync = report_drift(connection)
+            print(f"\n{'✅ Summary is in sync' if in_sync else '⚠️  Summary drifted - run with --rebuild'}\n")
+            return
+
+        if '--rebuild' not in sys.argv:
+            print("[Step 1] Creating summary table...")
+            if not create_summary_table(connection):
+                return
+
+            # Triggers first, so rows written during the rebuild are counted
+            print("\n[Step 2] Creating summary triggers...")
+            if not create_summary_triggers(connection):
+                return
+
+        print("\nRebuilding summary from the source tables...")
+        groups = rebuild_summary(connection)
+        for source, count in groups.items():
+            print(f"  → {source}: {count} groups")
+
+        report_drift(connection)
+
+        print("\n" + "="*70)
+        print("  ✅ SUMMARY TABLE READY")
+        print("="*70)
+        print(f"\n  {SUMMARY_TABLE} is now maintained by triggers on every")
+        print("  insert/update/delete of master.")
+        print("\n💡 Railway gets it through sync_to_railway_final.py; the dashboard")
+        print("   and /health read it instead of scanning master.")
+        print("   Re-run this script after adding columns to the source tables.")
+        print("="*70 + "\n")
+
+    finally:
+        if connection.is_connected():
+            connection.close()
+            print("✓ Connection closed\n")
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,12 @@ import pandas as pd
 import mysql.connector
 from mysql.connector import Error
 import os
+import sys
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from database.phone_utils import NORMALIZED_PHONE_COLUMNS, normalize_phone_numbers
+
 load_dotenv()  # Load environment variables from .env file
 
 def connect_to_mysql(host, user, password, database):
@@ -225,6 +229,25 @@ def smart_sync_with_deletions(connection, table_name, df, unique_column):
     finally:
         cursor.close()
 
+def report_duplicate_phones(df, unique_column):
+    """Print phone numbers that repeat within the sheet once normalized (E.164)"""
+    for phone_col in NORMALIZED_PHONE_COLUMNS:
+        if phone_col not in df.columns:
+            continue
+        
+        normalized = normalize_phone_numbers(df[phone_col])
+        dupes = normalized[normalized.notna() & normalized.duplicated(keep=False)]
+        if dupes.empty:
+            continue
+        
+        print(f"⚠️  {phone_col}: {dupes.nunique()} numbers repeat across {len(dupes)} rows")
+        groups = df.loc[dupes.index, unique_column].astype(str).groupby(dupes, sort=False)
+        for i, (phone, names) in enumerate(groups):
+            if i == 5:
+                print(f"    ... and {dupes.nunique() - 5} more")
+                break
+            print(f"    {phone}: {', '.join(names)}")
+
 def excel_to_mysql(excel_file, sheet_name, host, user, password, database, table_name, unique_column='company_name', sync_mode='upsert'):
     """
     Main function to transfer data from Excel to MySQL
@@ -265,6 +288,9 @@ def excel_to_mysql(excel_file, sheet_name, host, user, password, database, table
                 print(f"Warning: Column '{unique_column_clean}' not found in Excel. Available columns: {list(df.columns)}")
                 return
             
+            # Flag numbers shared across clients (format-insensitive)
+            report_duplicate_phones(df, unique_column_clean)
+            
             # Replace NaN values with None for proper NULL handling in MySQL
             df = df.where(pd.notnull(df), None)
             
@@ -2,10 +2,32 @@ import pandas as pd
 import mysql.connector
 from mysql.connector import Error
 import os
+import sys
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from database.phone_utils import has_phone_sql, phone_key_column
+
 load_dotenv()
 
+# Detail table → raw master phone column it is fed from
+DETAIL_PHONES = {
+    'Tax_Persons_details': 'Phone_Number',
+    'CFO_Persons_details': 'Phone_Number_4',
+    'Other_Persons_Details': 'Phone_Number_10',
+}
+
+def detail_phone_keys(connection):
+    """
+    Phone column each detail table is tested / matched on: the normalized
+    column once add_phone_norm_index.py has added it to master and the
+    detail table, so junk like 'N/A' isn't copied and lookups use the index
+    """
+    return {
+        table: phone_key_column(connection, phone, 'tax_summit_master_data', table)
+        for table, phone in DETAIL_PHONES.items()
+    }
+
 def connect_to_mysql(host, user, password, database):
     """Establish connection to MySQL database"""
     try:
@@ -104,6 +126,10 @@ def create_child_tables(connection):
 def create_triggers(connection):
     """Create triggers to auto-populate child tables from master table"""
     cursor = connection.cursor()
+    keys = detail_phone_keys(connection)
+    tax_phone = keys['Tax_Persons_details']
+    cfo_phone = keys['CFO_Persons_details']
+    other_phone = keys['Other_Persons_Details']
     
     # Drop existing triggers first
     drop_triggers = [
@@ -118,13 +144,13 @@ def create_triggers(connection):
             pass
     
     # Trigger for INSERT - populates child tables when new row added to master
-    insert_trigger = """
+    insert_trigger = f"""
     CREATE TRIGGER after_master_insert
     AFTER INSERT ON tax_summit_master_data
     FOR EACH ROW
     BEGIN
         -- Insert into Tax_Persons_details (only if Phone_Number is not null and doesn't exist)
-        IF NEW.Phone_Number IS NOT NULL AND NEW.Phone_Number != '' THEN
+        IF {has_phone_sql(tax_phone, 'NEW.')} THEN
             INSERT IGNORE INTO Tax_Persons_details 
                 (Client_Name, numRegistrations, Tax_Contact, Designation, Email_ID, Phone_Number, Response_1)
             VALUES 
@@ -133,7 +159,7 @@ def create_triggers(connection):
         END IF;
         
         -- Insert into CFO_Persons_details (only if Phone_Number_4 is not null and doesn't exist)
-        IF NEW.Phone_Number_4 IS NOT NULL AND NEW.Phone_Number_4 != '' THEN
+        IF {has_phone_sql(cfo_phone, 'NEW.')} THEN
             INSERT IGNORE INTO CFO_Persons_details 
                 (Company_Name, numRegistrations, CFO_Name, Designation_2, Email_ID_3, Phone_Number_4, Response_7)
             VALUES 
@@ -142,7 +168,7 @@ def create_triggers(connection):
         END IF;
         
         -- Insert into Other_Persons_Details (only if Phone_Number_10 is not null and doesn't exist)
-        IF NEW.Phone_Number_10 IS NOT NULL AND NEW.Phone_Number_10 != '' THEN
+        IF {has_phone_sql(other_phone, 'NEW.')} THEN
             INSERT IGNORE INTO Other_Persons_Details 
                 (Company_Name, numRegistrations, Others, Designation_8, Email_ID_9, Phone_Number_10, Response_13)
             VALUES 
@@ -153,7 +179,7 @@ def create_triggers(connection):
     """
     
     # Trigger for UPDATE - updates child tables when master table is updated
-    update_trigger = """
+    update_trigger = f"""
     CREATE TRIGGER after_master_update
     AFTER UPDATE ON tax_summit_master_data
     FOR EACH ROW
@@ -165,8 +191,9 @@ def create_triggers(connection):
             Tax_Contact = NEW.Tax_Contact,
             Designation = NEW.Designation,
             Email_ID = NEW.Email_ID,
-            Response_1 = NEW.Response_1
-        WHERE Phone_Number = NEW.Phone_Number;
+            Response_1 = NEW.Response_1,
+            Phone_Number = NEW.Phone_Number
+        WHERE {tax_phone} = NEW.{tax_phone};
         
         -- Update CFO_Persons_details
         UPDATE CFO_Persons_details 
@@ -175,8 +202,9 @@ def create_triggers(connection):
             CFO_Name = NEW.CFO_Name,
             Designation_2 = NEW.Designation_2,
             Email_ID_3 = NEW.Email_ID_3,
-            Response_7 = NEW.Response_7
-        WHERE Phone_Number_4 = NEW.Phone_Number_4;
+            Response_7 = NEW.Response_7,
+            Phone_Number_4 = NEW.Phone_Number_4
+        WHERE {cfo_phone} = NEW.{cfo_phone};
         
         -- Update Other_Persons_Details
         UPDATE Other_Persons_Details 
@@ -185,8 +213,9 @@ def create_triggers(connection):
             Others = NEW.Others,
             Designation_8 = NEW.Designation_8,
             Email_ID_9 = NEW.Email_ID_9,
-            Response_13 = NEW.Response_13
-        WHERE Phone_Number_10 = NEW.Phone_Number_10;
+            Response_13 = NEW.Response_13,
+            Phone_Number_10 = NEW.Phone_Number_10
+        WHERE {other_phone} = NEW.{other_phone};
     END
     """
     
@@ -203,34 +232,35 @@ def create_triggers(connection):
 def populate_child_tables_from_existing(connection):
     """Populate child tables from existing master table data"""
     cursor = connection.cursor()
+    keys = detail_phone_keys(connection)
     
     queries = [
         # Populate Tax_Persons_details
-        """
+        f"""
         INSERT IGNORE INTO Tax_Persons_details 
             (Client_Name, numRegistrations, Tax_Contact, Designation, Email_ID, Phone_Number, Response_1)
         SELECT 
             Client_Name, numRegistrations, Tax_Contact, Designation, Email_ID, Phone_Number, Response_1
         FROM tax_summit_master_data
-        WHERE Phone_Number IS NOT NULL AND Phone_Number != ''
+        WHERE {has_phone_sql(keys['Tax_Persons_details'])}
         """,
         # Populate CFO_Persons_details
-        """
+        f"""
         INSERT IGNORE INTO CFO_Persons_details 
             (Company_Name, numRegistrations, CFO_Name, Designation_2, Email_ID_3, Phone_Number_4, Response_7)
         SELECT 
             Client_Name, numRegistrations, CFO_Name, Designation_2, Email_ID_3, Phone_Number_4, Response_7
         FROM tax_summit_master_data
-        WHERE Phone_Number_4 IS NOT NULL AND Phone_Number_4 != ''
+        WHERE {has_phone_sql(keys['CFO_Persons_details'])}
         """,
         # Populate Other_Persons_Details
-        """
+        f"""
         INSERT IGNORE INTO Other_Persons_Details 
             (Company_Name, numRegistrations, Others, Designation_8, Email_ID_9, Phone_Number_10, Response_13)
         SELECT 
             Client_Name, numRegistrations, Others, Designation_8, Email_ID_9, Phone_Number_10, Response_13
         FROM tax_summit_master_data
-        WHERE Phone_Number_10 IS NOT NULL AND Phone_Number_10 != ''
+        WHERE {has_phone_sql(keys['Other_Persons_Details'])}
         """
     ]
     
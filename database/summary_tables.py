@@ -0,0 +1,263 @@
+"""
+Materialized summary of the dashboard tables.
+
+`summary_dimension_counts` holds one row per (source table, Practice_Head,
+Partner, Sector, Location, Response) with the group's row, client,
+invitee, registration and circle-back totals. Response counts per
+(Practice_Head, Partner, Sector, Response) and registration totals per
+region are roll-ups of it, so readers scan O(groups) instead of O(rows).
+
+Only master is summarized - it is the only source the dashboard reads
+from here, so the analysis tables carry no trigger cost.
+
+It is kept current incrementally:
+- locally, by AFTER INSERT/UPDATE/DELETE triggers on master
+  (database/setup/create_summary_tables.py)
+- on Railway, by sync_to_railway_final.py, which syncs it like the other
+  tables (incrementally, keyed on Group_Key)
+
+Dimension values are stored raw; readers apply the dashboard's
+title-casing, response normalization and Location → Region mapping.
+
+    connection.cursor().execute(create_summary_table_sql())
+    for name, sql in trigger_sql('master', catalog.column_set(table)): ...
+    rebuild_summary(connection)
+"""
+from database.schema_catalog import get_catalog
+
+SUMMARY_TABLE = 'summary_dimension_counts'
+
+SUMMARY_DIMENSIONS = ['Practice_Head', 'Partner', 'Sector', 'Location', 'Response']
+SUMMARY_MEASURES = ['Row_Count', 'Client_Count', 'Invitees', 'Registrations', 'Circle_Backs']
+
+# Source -> table and the columns that differ from the summary names
+SUMMARY_SOURCES = {
+    'master': {
+        'table': 'tax_summit_master_data',
+        'trigger': 'master',
+        'columns': {},
+        'client': 'Client_Name',
+        'circle_back': 'Circle_Back_Dt',
+    },
+}
+
+def create_summary_table_sql():
+    """CREATE TABLE for the summary (dimensions are TEXT, like Response on Railway)"""
+    dims = ',\n            '.join(f"{dim} TEXT" for dim in SUMMARY_DIMENSIONS)
+    return f"""
+        CREATE TABLE IF NOT EXISTS {SUMMARY_TABLE} (
+            Group_Key CHAR(32) PRIMARY KEY,
+            Source VARCHAR(16) NOT NULL,
+            {dims},
+            Row_Count INT NOT NULL DEFAULT 0,
+            Client_Count INT NOT NULL DEFAULT 0,
+            Invitees BIGINT NOT NULL DEFAULT 0,
+            Registrations BIGINT NOT NULL DEFAULT 0,
+            Circle_Backs INT NOT NULL DEFAULT 0,
+            Last_Updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            INDEX idx_source (Source)
+        )
+    """
+
+def count_sql(expr):
+    """
+    numInvitees / numRegistrations are text: numbers ('3', '3.0') count,
+    blanks and junk count as 0 - the dashboard's safe_int() in SQL
+    """
+    return f"IF({expr} REGEXP '^ *[-+]?[0-9]+([.][0-9]*)? *$', TRUNCATE(TRIM({expr}), 0), 0)"
+
+def group_key_sql(source, dims):
+    """
+    MD5 over the source and the exact dimension values. NULL and '' hash
+    differently (ISNULL flag per column), as in drift_repair.row_hash_sql.
+    """
+    parts = ', '.join(f"ISNULL({expr}), IFNULL({expr}, '')" for expr in dims.values())
+    return f"MD5(CONCAT_WS('|', '{source}', {parts}))"
+
+def row_expressions(source, available, row=None):
+    """
+    ({dimension: SQL}, {measure: SQL}) for one row of a source table.
+    `row` is 'NEW' / 'OLD' inside a trigger, None in a plain SELECT.
+    Columns missing from the table contribute NULL / 0.
+    """
+    spec = SUMMARY_SOURCES[source]
+    prefix = f"{row}." if row else ''
+
+    def column(name):
+        return f"{prefix}`{name}`" if name and name in available else None
+
+    dims = {
+        dim: column(spec['columns'].get(dim, dim)) or 'NULL'
+        for dim in SUMMARY_DIMENSIONS
+    }
+    client = column(spec['client'])
+    circle_back = column(spec['circle_back'])
+    invitees = column('numInvitees')
+    registrations = column('numRegistrations')
+    measures = {
+        'Row_Count': '1',
+        'Client_Count': f"({client} IS NOT NULL)" if client else '0',
+        'Invitees': count_sql(invitees) if invitees else '0',
+        'Registrations': count_sql(registrations) if registrations else '0',
+        'Circle_Backs': f"({circle_back} IS NOT NULL)" if circle_back else '0',
+    }
+    return dims, measures
+
+def aggregate_select(source, available, table, where=''):
+    """SELECT of summary rows for `table`, grouped on the exact dimension values"""
+    dims, measures = row_expressions(source, available)
+    inner = ', '.join(
+        [f"{group_key_sql(source, dims)} AS Group_Key"]
+        + [f"{expr} AS {dim}" for dim, expr in dims.items()]
+        + [f"{expr} AS {measure}" for measure, expr in measures.items()]
+    )
+    outer = ', '.join(
+        ["Group_Key", f"'{source}' AS Source"]
+        + [f"ANY_VALUE({dim}) AS {dim}" for dim in SUMMARY_DIMENSIONS]
+        + [f"SUM({measure}) AS {measure}" for measure in SUMMARY_MEASURES]
+    )
+    return f"""
+        SELECT {outer}
+        FROM (SELECT {inner} FROM `{table}` {where}) r
+        GROUP BY Group_Key
+    """
+
+def summary_columns():
+    return ['Group_Key', 'Source'] + SUMMARY_DIMENSIONS + SUMMARY_MEASURES
+
+def add_row_sql(source, available, row):
+    """Trigger statement counting NEW/OLD into its group"""
+    dims, measures = row_expressions(source, available, row)
+    values = [group_key_sql(source, dims), f"'{source}'"] + list(dims.values()) + list(measures.values())
+    updates = ',\n                '.join(f"{m} = {m} + {expr}" for m, expr in measures.items())
+    return f"""
+            INSERT INTO {SUMMARY_TABLE} ({', '.join(summary_columns())})
+            VALUES ({', '.join(values)})
+            ON DUPLICATE KEY UPDATE
+                {updates};"""
+
+def remove_row_sql(source, available, row):
+    """Trigger statements taking NEW/OLD out of its group (empty groups are deleted)"""
+    dims, measures = row_expressions(source, available, row)
+    key = group_key_sql(source, dims)
+    updates = ', '.join(f"{m} = {m} - {expr}" for m, expr in measures.items())
+    return f"""
+            UPDATE {SUMMARY_TABLE} SET {updates}
+            WHERE Group_Key = {key};
+            DELETE FROM {SUMMARY_TABLE} WHERE Group_Key = {key} AND Row_Count <= 0;"""
+
+def watched_columns(source, available):
+    """Source columns whose change moves a row between groups or changes a measure"""
+    spec = SUMMARY_SOURCES[source]
+    names = [spec['columns'].get(dim, dim) for dim in SUMMARY_DIMENSIONS]
+    names += [spec['client'], spec['circle_back'], 'numInvitees', 'numRegistrations']
+    return [name for name in names if name and name in available]
+
+def trigger_names(source):
+    tag = SUMMARY_SOURCES[source]['trigger']
+    return [f"after_{tag}_{event}_summary" for event in ('insert', 'update', 'delete')]
+
+def trigger_sql(source, available, table=None):
+    """[(name, CREATE TRIGGER)] keeping the summary current for one source table"""
+    table = table or SUMMARY_SOURCES[source]['table']
+    insert_name, update_name, delete_name = trigger_names(source)
+
+    # BINARY: 'abc' -> 'ABC' is a change of group even under a _ci collation
+    unchanged = ' AND '.join(
+        f"BINARY OLD.`{col}` <=> BINARY NEW.`{col}`" for col in watched_columns(source, available)
+    ) or 'TRUE'
+
+    return [
+        (insert_name, f"""
+        CREATE TRIGGER {insert_name}
+        AFTER INSERT ON `{table}`
+        FOR EACH ROW
+        BEGIN{add_row_sql(source, available, 'NEW')}
+        END
+        """),
+        (update_name, f"""
+        CREATE TRIGGER {update_name}
+        AFTER UPDATE ON `{table}`
+        FOR EACH ROW
+        BEGIN
+            IF NOT ({unchanged}) THEN{remove_row_sql(source, available, 'OLD')}{add_row_sql(source, available, 'NEW')}
+            END IF;
+        END
+        """),
+        (delete_name, f"""
+        CREATE TRIGGER {delete_name}
+        AFTER DELETE ON `{table}`
+        FOR EACH ROW
+        BEGIN{remove_row_sql(source, available, 'OLD')}
+        END
+        """),
+    ]
+
+def rebuild_summary(connection, sources=None):
+    """
+    Recompute the summary rows of `sources` (default: all) from the source
+    tables in one transaction. With the default, rows of sources that are
+    no longer summarized are dropped too.
+
+    Returns:
+        dict: {source: groups written} (sources whose table is missing are skipped)
+    """
+    catalog = get_catalog(connection)
+    cursor = connection.cursor()
+    groups = {}
+    try:
+        if not sources:
+            cursor.execute(
+                f"DELETE FROM {SUMMARY_TABLE} WHERE Source NOT IN ({', '.join(['%s'] * len(SUMMARY_SOURCES))})",
+                tuple(SUMMARY_SOURCES)
+            )
+        for source in sources or SUMMARY_SOURCES:
+            cursor.execute(f"DELETE FROM {SUMMARY_TABLE} WHERE Source = %s", (source,))
+            table = catalog.resolve(SUMMARY_SOURCES[source]['table'])
+            if not table:
+                continue
+            cursor.execute(f"""
+                INSERT INTO {SUMMARY_TABLE} ({', '.join(summary_columns())})
+                {aggregate_select(source, catalog.column_set(table), table)}
+            """)
+            groups[source] = cursor.rowcount
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+    return groups
+
+def summary_drift(connection, sources=None):
+    """
+    Compare the summary totals with the source tables.
+
+    Returns:
+        dict: {source: {'summary': (rows, invitees, registrations),
+                        'actual': (rows, invitees, registrations)}}
+    """
+    catalog = get_catalog(connection)
+    cursor = connection.cursor()
+    result = {}
+    try:
+        for source in sources or SUMMARY_SOURCES:
+            table = catalog.resolve(SUMMARY_SOURCES[source]['table'])
+            if not table:
+                continue
+            _, measures = row_expressions(source, catalog.column_set(table))
+            cursor.execute(f"""
+                SELECT COUNT(*), COALESCE(SUM({measures['Invitees']}), 0),
+                       COALESCE(SUM({measures['Registrations']}), 0)
+                FROM `{table}`
+            """)
+            actual = tuple(int(v) for v in cursor.fetchone())
+            cursor.execute(f"""
+                SELECT COALESCE(SUM(Row_Count), 0), COALESCE(SUM(Invitees), 0),
+                       COALESCE(SUM(Registrations), 0)
+                FROM {SUMMARY_TABLE} WHERE Source = %s
+            """, (source,))
+            result[source] = {'summary': tuple(int(v) for v in cursor.fetchone()), 'actual': actual}
+    finally:
+        cursor.close()
+    return result
@@ -3,6 +3,8 @@ from mysql.connector import Error
 import os
 from dotenv import load_dotenv
 
+from database.phone_utils import has_phone_sql, phone_key_column
+
 load_dotenv()
 
 def connect_to_mysql():
@@ -192,6 +194,11 @@ def drop_existing_triggers(connection):
 def create_enhanced_triggers(connection):
     """Create enhanced triggers with proper update logic"""
     cursor = connection.cursor()
+    # Match analysis rows on the normalized phone (idx_phone_client) when
+    # add_phone_norm_index.py has added it, else on the raw column
+    tax_phone = phone_key_column(connection, 'Phone_Number', 'tax_summit_master_data', 'Tax_Persons_Analysis')
+    cfo_phone = phone_key_column(connection, 'Phone_Number_4', 'tax_summit_master_data', 'CFO_Persons_Analysis')
+    other_phone = phone_key_column(connection, 'Phone_Number_10', 'tax_summit_master_data', 'Other_Persons_Analysis')
     
     print("\n[Creating Enhanced Triggers]")
     print("-" * 70)
@@ -199,13 +206,13 @@ def create_enhanced_triggers(connection):
     # =====================================================================
     # TRIGGER 1: INSERT - Populate analysis tables on new master record
     # =====================================================================
-    insert_trigger = """
+    insert_trigger = f"""
     CREATE TRIGGER after_master_insert_analysis
     AFTER INSERT ON tax_summit_master_data
     FOR EACH ROW
     BEGIN
         -- Tax_Persons_Analysis
-        IF NEW.Phone_Number IS NOT NULL AND NEW.Phone_Number != '' THEN
+        IF {has_phone_sql(tax_phone, 'NEW.')} THEN
             INSERT INTO Tax_Persons_Analysis 
                 (Client_Name, Practice_Head, Partner, Invite_Status, numInvitees, 
                  Response, Sector, numRegistrations, Tax_Contact, Designation, 
@@ -233,7 +240,7 @@ def create_enhanced_triggers(connection):
         END IF;
         
         -- CFO_Persons_Analysis
-        IF NEW.Phone_Number_4 IS NOT NULL AND NEW.Phone_Number_4 != '' THEN
+        IF {has_phone_sql(cfo_phone, 'NEW.')} THEN
             INSERT INTO CFO_Persons_Analysis 
                 (Company_Name, Practice_Head, Partner, Invite_Status, numInvitees, 
                  Response, Sector, numRegistrations, CFO_Name, Designation_2, 
@@ -261,7 +268,7 @@ def create_enhanced_triggers(connection):
         END IF;
         
         -- Other_Persons_Analysis
-        IF NEW.Phone_Number_10 IS NOT NULL AND NEW.Phone_Number_10 != '' THEN
+        IF {has_phone_sql(other_phone, 'NEW.')} THEN
             INSERT INTO Other_Persons_Analysis 
                 (Company_Name, Practice_Head, Partner, Invite_Status, numInvitees, 
                  Response, Sector, numRegistrations, Others, Designation_8, 
@@ -293,16 +300,16 @@ def create_enhanced_triggers(connection):
     # =====================================================================
     # TRIGGER 2: UPDATE - Comprehensive update for ALL columns
     # =====================================================================
-    update_trigger = """
+    update_trigger = f"""
     CREATE TRIGGER after_master_update_analysis
     AFTER UPDATE ON tax_summit_master_data
     FOR EACH ROW
     BEGIN
         -- Update Tax_Persons_Analysis
-        IF NEW.Phone_Number IS NOT NULL AND NEW.Phone_Number != '' THEN
-            IF OLD.Phone_Number != NEW.Phone_Number THEN
+        IF {has_phone_sql(tax_phone, 'NEW.')} THEN
+            IF NOT (OLD.{tax_phone} <=> NEW.{tax_phone}) THEN
                 DELETE FROM Tax_Persons_Analysis 
-                WHERE Phone_Number = OLD.Phone_Number 
+                WHERE {tax_phone} = OLD.{tax_phone} 
                   AND Client_Name = OLD.Client_Name;
                 
                 INSERT INTO Tax_Persons_Analysis 
@@ -345,22 +352,23 @@ def create_enhanced_triggers(connection):
                     Email_ID = NEW.Email_ID,
                     Location = NEW.Location,
                     Response_1 = NEW.Response_1,
+                    Phone_Number = NEW.Phone_Number,
                     Last_Updated = CURRENT_TIMESTAMP
-                WHERE Phone_Number = NEW.Phone_Number;
+                WHERE {tax_phone} = NEW.{tax_phone};
             END IF;
         ELSE
-            IF OLD.Phone_Number IS NOT NULL AND OLD.Phone_Number != '' THEN
+            IF {has_phone_sql(tax_phone, 'OLD.')} THEN
                 DELETE FROM Tax_Persons_Analysis 
-                WHERE Phone_Number = OLD.Phone_Number 
+                WHERE {tax_phone} = OLD.{tax_phone} 
                   AND Client_Name = OLD.Client_Name;
             END IF;
         END IF;
         
         -- Update CFO_Persons_Analysis
-        IF NEW.Phone_Number_4 IS NOT NULL AND NEW.Phone_Number_4 != '' THEN
-            IF OLD.Phone_Number_4 != NEW.Phone_Number_4 THEN
+        IF {has_phone_sql(cfo_phone, 'NEW.')} THEN
+            IF NOT (OLD.{cfo_phone} <=> NEW.{cfo_phone}) THEN
                 DELETE FROM CFO_Persons_Analysis 
-                WHERE Phone_Number_4 = OLD.Phone_Number_4 
+                WHERE {cfo_phone} = OLD.{cfo_phone} 
                   AND Company_Name = OLD.Client_Name;
                 
                 INSERT INTO CFO_Persons_Analysis 
@@ -403,22 +411,23 @@ def create_enhanced_triggers(connection):
                     Email_ID_3 = NEW.Email_ID_3,
                     Location_6 = NEW.Location_6,
                     Response_7 = NEW.Response_7,
+                    Phone_Number_4 = NEW.Phone_Number_4,
                     Last_Updated = CURRENT_TIMESTAMP
-                WHERE Phone_Number_4 = NEW.Phone_Number_4;
+                WHERE {cfo_phone} = NEW.{cfo_phone};
             END IF;
         ELSE
-            IF OLD.Phone_Number_4 IS NOT NULL AND OLD.Phone_Number_4 != '' THEN
+            IF {has_phone_sql(cfo_phone, 'OLD.')} THEN
                 DELETE FROM CFO_Persons_Analysis 
-                WHERE Phone_Number_4 = OLD.Phone_Number_4 
+                WHERE {cfo_phone} = OLD.{cfo_phone} 
                   AND Company_Name = OLD.Client_Name;
             END IF;
         END IF;
         
         -- Update Other_Persons_Analysis
-        IF NEW.Phone_Number_10 IS NOT NULL AND NEW.Phone_Number_10 != '' THEN
-            IF OLD.Phone_Number_10 != NEW.Phone_Number_10 THEN
+        IF {has_phone_sql(other_phone, 'NEW.')} THEN
+            IF NOT (OLD.{other_phone} <=> NEW.{other_phone}) THEN
                 DELETE FROM Other_Persons_Analysis 
-                WHERE Phone_Number_10 = OLD.Phone_Number_10 
+                WHERE {other_phone} = OLD.{other_phone} 
                   AND Company_Name = OLD.Client_Name;
                 
                 INSERT INTO Other_Persons_Analysis 
@@ -461,13 +470,14 @@ def create_enhanced_triggers(connection):
                     Email_ID_9 = NEW.Email_ID_9,
                     Location_12 = NEW.Location_12,
                     Response_13 = NEW.Response_13,
+                    Phone_Number_10 = NEW.Phone_Number_10,
                     Last_Updated = CURRENT_TIMESTAMP
-                WHERE Phone_Number_10 = NEW.Phone_Number_10;
+                WHERE {other_phone} = NEW.{other_phone};
             END IF;
         ELSE
-            IF OLD.Phone_Number_10 IS NOT NULL AND OLD.Phone_Number_10 != '' THEN
+            IF {has_phone_sql(other_phone, 'OLD.')} THEN
                 DELETE FROM Other_Persons_Analysis 
-                WHERE Phone_Number_10 = OLD.Phone_Number_10 
+                WHERE {other_phone} = OLD.{other_phone} 
                   AND Company_Name = OLD.Client_Name;
             END IF;
         END IF;
@@ -477,26 +487,26 @@ def create_enhanced_triggers(connection):
     # =====================================================================
     # TRIGGER 3: DELETE - Remove from analysis tables when deleted from master
     # =====================================================================
-    delete_trigger = """
+    delete_trigger = f"""
     CREATE TRIGGER after_master_delete_analysis
     AFTER DELETE ON tax_summit_master_data
     FOR EACH ROW
     BEGIN
-        IF OLD.Phone_Number IS NOT NULL AND OLD.Phone_Number != '' THEN
+        IF {has_phone_sql(tax_phone, 'OLD.')} THEN
             DELETE FROM Tax_Persons_Analysis 
-            WHERE Phone_Number = OLD.Phone_Number 
+            WHERE {tax_phone} = OLD.{tax_phone} 
               AND Client_Name = OLD.Client_Name;
         END IF;
         
-        IF OLD.Phone_Number_4 IS NOT NULL AND OLD.Phone_Number_4 != '' THEN
+        IF {has_phone_sql(cfo_phone, 'OLD.')} THEN
             DELETE FROM CFO_Persons_Analysis 
-            WHERE Phone_Number_4 = OLD.Phone_Number_4 
+            WHERE {cfo_phone} = OLD.{cfo_phone} 
               AND Company_Name = OLD.Client_Name;
         END IF;
         
-        IF OLD.Phone_Number_10 IS NOT NULL AND OLD.Phone_Number_10 != '' THEN
+        IF {has_phone_sql(other_phone, 'OLD.')} THEN
             DELETE FROM Other_Persons_Analysis 
-            WHERE Phone_Number_10 = OLD.Phone_Number_10 
+            WHERE {other_phone} = OLD.{other_phone} 
               AND Company_Name = OLD.Client_Name;
         END IF;
     END
@@ -0,0 +1,75 @@
+import pandas as pd
+import pytest
+
+import analysis_dashboard as dashboard
+
+
+def master_store():
+    df = pd.DataFrame({
+        'Practice_Head': ['Head A', 'Head B', 'Head A'],
+        'Partner': ['P1', 'P2', 'P2'],
+        'Sector': ['Tech', 'Pharma', 'Tech'],
+        'Location': ['Mumbai', 'Delhi', None],
+        'Response': ['Positive', 'Awaited', None],
+        'numInvitees': ['1', '2', 'x'],
+    })
+    dashboard.add_region_column(df, 'Location')
+    dictionaries = dashboard.build_dictionaries([df])
+    dashboard.compact_frame(df, dictionaries)
+    return dashboard.to_store(df), dictionaries
+
+
+def test_filter_data_before_filters_are_applied():
+    # current-filters is still None on the first page load
+    data, dictionaries = master_store()
+    assert dashboard.filter_data(data, None, dictionaries, None) == data
+    assert dashboard.filter_data(data, {}, dictionaries, None) == data
+    assert dashboard.filter_data(None, None, dictionaries, None) == {}
+
+
+def test_filter_data_selects_rows():
+    data, dictionaries = master_store()
+    filtered = dashboard.filter_data(data, {'ph': ['Head A']}, dictionaries, None)
+    assert filtered['rows'] == 2
+
+
+def test_build_cube_rejects_summary_with_stale_measures(monkeypatch, capsys):
+    data, dictionaries = master_store()
+    master_df = dashboard.from_store(data, dictionaries)
+    summary = pd.DataFrame({
+        'Practice_Head': ['Head A', 'Head B', 'Head A'],
+        'Partner': ['P1', 'P2', 'P2'],
+        'Sector': ['Tech', 'Pharma', 'Tech'],
+        'Location': ['Mumbai', 'Delhi', None],
+        'Response': ['Positive', 'Awaited', None],
+        'Row_Count': [1, 1, 1],
+        'Client_Count': [1, 1, 1],
+        'Invitees': [1, 2, 0],
+        'Registrations': [0, 0, 0],
+        'Circle_Backs': [0, 0, 0],
+    })
+    monkeypatch.setattr(dashboard, 'fetch_summary', lambda source: summary)
+    assert dashboard.build_cube(master_df, dictionaries).total('invitees') == 3
+    assert "doesn't match master" not in capsys.readouterr().out
+
+    # Same row count, but a master edit the summary hasn't caught up with yet
+    summary.loc[0, 'Invitees'] = 5
+    cube = dashboard.build_cube(master_df, dictionaries)
+    assert "doesn't match master" in capsys.readouterr().out
+    assert cube.total('invitees') == 3
+    assert cube.total('rows') == 3
+
+
+def test_cache_miss_uses_client_store(monkeypatch):
+    # A worker that never served load_data must not reload the database
+    monkeypatch.setattr(dashboard, 'prepare_datasets', lambda: pytest.fail("reloaded the database"))
+    data, dictionaries = master_store()
+    version = 'not-cached-here'
+
+    options = dashboard.update_filter_options(dictionaries, ['Head A'], None, None, None, None, version, data)
+    assert {'label': 'P2 (1)', 'value': 'P2'} in options[1]
+    assert dashboard.get_cube(version) is None
+
+    filtered = dashboard.filter_data(data, {'ph': ['Head A']}, dictionaries, version)
+    content = dashboard.render_content('overview', filtered, {}, {}, {}, dictionaries, {'ph': ['Head A']}, version)
+    assert content is not None
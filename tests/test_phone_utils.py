@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+from database import phone_utils
+from database.phone_utils import has_phone_sql, normalize_phone_numbers, phone_key_column
+from database.schema_catalog import SchemaCatalog
+
+
+def test_normalizes_formats():
+    result = normalize_phone_numbers(['+91 98765 43210', '09876543210', '9876543210',
+                                      '0044 20 7946 0000', '', None])
+    assert result.tolist()[:4] == ['+919876543210'] * 3 + ['+442079460000']
+    assert result.isna().tolist()[4:] == [True, True]
+
+
+def test_float_phone_column():
+    # read_excel turns a phone column with a blank cell into float64
+    result = normalize_phone_numbers(pd.Series([9876543210.0, np.nan, 919876543210.0]))
+    assert result[0] == '+919876543210'
+    assert pd.isna(result[1])
+    assert result[2] == '+919876543210'
+
+
+def test_mixed_object_column():
+    result = normalize_phone_numbers(pd.Series(['98765 43210', 9876543210.0, 9876543210], dtype=object))
+    assert result.tolist() == ['+919876543210'] * 3
+
+
+def table(*columns):
+    return {'columns': [{'name': c, 'generated': c.startswith('Phone_Norm')} for c in columns], 'indexes': {}}
+
+
+def test_phone_key_uses_normalized_column_only_when_every_table_has_it(monkeypatch):
+    catalog = SchemaCatalog({
+        'tax_summit_master_data': table('Client_Name', 'Phone_Number', 'Phone_Norm'),
+        'Tax_Persons_Analysis': table('Client_Name', 'Phone_Number', 'Phone_Norm'),
+        'Tax_Persons_Details': table('Client_Name', 'Phone_Number'),
+    }, fingerprint=None)
+    monkeypatch.setattr(phone_utils, 'get_catalog', lambda connection: catalog)
+
+    assert phone_key_column(None, 'Phone_Number', 'tax_summit_master_data', 'Tax_Persons_Analysis') == 'Phone_Norm'
+    assert phone_key_column(None, 'Phone_Number', 'tax_summit_master_data', 'Tax_Persons_Details') == 'Phone_Number'
+    # Junk like 'N/A' normalizes to NULL, so only the raw column needs the '' test
+    assert has_phone_sql('Phone_Norm', 'NEW.') == 'NEW.Phone_Norm IS NOT NULL'
+    assert has_phone_sql('Phone_Number', 'm.') == "m.Phone_Number IS NOT NULL AND m.Phone_Number != ''"
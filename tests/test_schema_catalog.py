@@ -0,0 +1,55 @@
+from database.schema_catalog import is_generated, load_catalog
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, query, params=()):
+        pass
+
+    def fetchone(self):
+        return ('1:1', '0:0')
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def cursor(self, dictionary=False):
+        return FakeCursor(self.rows)
+
+
+def column_row(name, extra, position):
+    return {
+        'kind': 'column', 'TABLE_NAME': 'tax_summit_master_data', 'COLUMN_NAME': name,
+        'position': position, 'DATA_TYPE': 'varchar', 'COLUMN_TYPE': 'varchar(255)',
+        'IS_NULLABLE': 'YES', 'COLUMN_KEY': '', 'EXTRA': extra,
+        'INDEX_NAME': None, 'NON_UNIQUE': None,
+    }
+
+
+def test_default_generated_timestamps_are_writable():
+    catalog = load_catalog(FakeConnection([
+        column_row('id', 'auto_increment', 1),
+        column_row('Phone_Number', '', 2),
+        column_row('Phone_Norm', 'STORED GENERATED', 3),
+        column_row('Data_Insert_Time', 'DEFAULT_GENERATED', 4),
+        column_row('Last_Updated', 'DEFAULT_GENERATED on update CURRENT_TIMESTAMP', 5),
+    ]))
+    assert catalog.columns('tax_summit_master_data', writable_only=True) == [
+        'id', 'Phone_Number', 'Data_Insert_Time', 'Last_Updated'
+    ]
+
+
+def test_is_generated():
+    assert is_generated('VIRTUAL GENERATED')
+    assert is_generated('STORED GENERATED')
+    assert not is_generated('DEFAULT_GENERATED on update CURRENT_TIMESTAMP')
+    assert not is_generated(None)
@@ -0,0 +1,133 @@
+import io
+import os
+import re
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from database.railway import snapshot
+from database.schema_catalog import SchemaCatalog
+
+
+def test_load_value_escapes_mysql_load_data_format():
+    assert snapshot.load_value(None) == b'\\N'
+    assert snapshot.load_value('a\tb\nc\\d') == b'a\\tb\\nc\\\\d'
+    assert snapshot.load_value('\\N') == b'\\\\N'
+    assert snapshot.load_value(datetime(2024, 1, 5, 10, 30)) == b'2024-01-05 10:30:00'
+    assert snapshot.load_value(date(2024, 1, 5)) == b'2024-01-05'
+    assert snapshot.load_value(timedelta(hours=26, seconds=5)) == b'26:00:05.000000'
+    assert snapshot.load_value(-timedelta(minutes=1)) == b'-00:01:00.000000'
+    assert snapshot.load_value(Decimal('12.50')) == b'12.50'
+    assert snapshot.load_value('Mumbaī') == 'Mumbaī'.encode('utf-8')
+
+
+def test_write_load_file_from_arrow_batches():
+    pytest.importorskip('pyarrow')
+    snapshot.require_pyarrow()
+    pa = snapshot.pa
+
+    table = pa.table({
+        'Client_Name': ['Acme', None, 'Beta'],
+        'numInvitees': [2, 3, None],
+        'Notes': ['x', 'y', 'z'],
+    })
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=2):
+            writer.write_batch(batch)
+    reader = pa.ipc.open_file(sink.getvalue())
+
+    out = io.BytesIO()
+    rows = snapshot.write_load_file(reader, ['Client_Name', 'numInvitees'], out)
+    assert rows == 3
+    assert out.getvalue() == b'Acme\t2\n\\N\t3\nBeta\t\\N\n'
+
+
+def column(name, data_type, column_type, extra=''):
+    return {'name': name, 'data_type': data_type, 'column_type': column_type, 'nullable': True,
+            'key': '', 'extra': extra, 'generated': 'STORED GENERATED' in extra}
+
+
+SNAPSHOT_COLUMNS = [
+    column('Client_Name', 'varchar', 'varchar(255)'),
+    column('numInvitees', 'int', 'int'),
+    column('Fee', 'decimal', 'decimal(10,2)'),
+    column('Invite_Dt', 'date', 'date'),
+    column('Phone_Norm', 'varchar', 'varchar(16)', 'STORED GENERATED'),
+    column('Last_Updated', 'timestamp', 'timestamp', 'DEFAULT_GENERATED on update CURRENT_TIMESTAMP'),
+]
+
+
+def parse_load_file(data):
+    """What LOAD DATA reads back with the default FIELDS/LINES options"""
+    escapes = {b'0': b'\0', b't': b'\t', b'n': b'\n', b'r': b'\r'}
+
+    def field(raw):
+        if raw == b'\\N':
+            return None
+        return re.sub(rb'\\(.)', lambda m: escapes.get(m.group(1), m.group(1)), raw).decode('utf-8')
+
+    return [tuple(field(f) for f in line.split(b'\t')) for line in data.split(b'\n') if line]
+
+
+class FakeServer:
+    """Answers export_table()'s SELECT and import_table()'s DELETE / LOAD DATA"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.loaded = None
+
+    def cursor(self):
+        return self
+
+    def execute(self, query, params=()):
+        if query.startswith('SELECT'):
+            self.pending = list(self.rows)
+        elif 'LOAD DATA LOCAL INFILE' in query:
+            self.load_path = params[0]
+            with open(params[0], 'rb') as f:
+                self.loaded = parse_load_file(f.read())
+            self.rowcount = len(self.loaded)
+
+    def fetchmany(self, size):
+        batch, self.pending = self.pending[:size], self.pending[size:]
+        return batch
+
+    def close(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def test_export_restore_round_trip(tmp_path, monkeypatch):
+    pytest.importorskip('pyarrow')
+    snapshot.require_pyarrow()
+    catalog = SchemaCatalog({'tax_summit_master_data': {'columns': SNAPSHOT_COLUMNS, 'indexes': {}}}, 'x')
+    monkeypatch.setattr(snapshot, 'get_catalog', lambda connection: catalog)
+
+    rows = [
+        ('Acme\tLtd', 3, Decimal('12.50'), date(2024, 1, 5), datetime(2024, 1, 5, 10, 30, 0, 250)),
+        ('Back\\slash\nline', None, None, None, datetime(2023, 12, 31, 23, 59, 59)),
+        ('\\N', 0, Decimal('0.00'), date(2024, 2, 29), None),
+    ]
+    server = FakeServer(rows)
+    columns, exported = snapshot.export_table(server, 'tax_summit_master_data', str(tmp_path / 'master.arrow'))
+
+    # Generated columns stay out; DEFAULT_GENERATED timestamps are kept
+    assert [c['name'] for c in columns] == ['Client_Name', 'numInvitees', 'Fee', 'Invite_Dt', 'Last_Updated']
+    assert exported == 3
+
+    entry = {'file': 'master.arrow', 'columns': columns}
+    loaded = snapshot.import_table(server, entry, str(tmp_path), 'tax_summit_master_data')
+    assert loaded == 3
+    assert server.loaded == [
+        ('Acme\tLtd', '3', '12.50', '2024-01-05', '2024-01-05 10:30:00.000250'),
+        ('Back\\slash\nline', None, None, None, '2023-12-31 23:59:59'),
+        ('\\N', '0', '0.00', '2024-02-29', None),
+    ]
+    assert not os.path.exists(server.load_path)
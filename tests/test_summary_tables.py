@@ -0,0 +1,108 @@
+"""
+Summary table triggers. The smoke test needs a scratch MySQL database
+(it creates tax_summit_master_data, the summary table and its triggers):
+set DB_TEST_HOST, DB_TEST_USER, DB_TEST_PASS, DB_TEST_NAME (and DB_TEST_PORT).
+"""
+import os
+
+import pytest
+
+from database.schema_catalog import invalidate_catalog
+from database.summary_tables import (
+    SUMMARY_MEASURES, SUMMARY_SOURCES, SUMMARY_TABLE, create_summary_table_sql,
+    rebuild_summary, summary_drift, trigger_sql
+)
+
+
+def test_triggers_cover_master_only():
+    assert list(SUMMARY_SOURCES) == ['master']
+    available = {'Practice_Head', 'Partner', 'Response', 'Client_Name', 'numInvitees', 'Email'}
+    names = [name for name, _ in trigger_sql('master', available)]
+    assert names == ['after_master_insert_summary', 'after_master_update_summary',
+                     'after_master_delete_summary']
+    update_sql = dict(trigger_sql('master', available))['after_master_update_summary']
+    # Columns outside the summary don't make an update recount the row
+    assert 'BINARY OLD.`Practice_Head` <=> BINARY NEW.`Practice_Head`' in update_sql
+    assert '`Email`' not in update_sql
+
+
+@pytest.fixture
+def mysql_conn():
+    if not os.getenv('DB_TEST_HOST'):
+        pytest.skip("DB_TEST_HOST not set")
+    mysql = pytest.importorskip('mysql.connector')
+    conn = mysql.connect(
+        host=os.getenv('DB_TEST_HOST'),
+        user=os.getenv('DB_TEST_USER'),
+        password=os.getenv('DB_TEST_PASS'),
+        database=os.getenv('DB_TEST_NAME'),
+        port=int(os.getenv('DB_TEST_PORT', 3306)),
+    )
+    cursor = conn.cursor()
+    cursor.execute(f"DROP TABLE IF EXISTS {SUMMARY_TABLE}")
+    cursor.execute("DROP TABLE IF EXISTS tax_summit_master_data")
+    cursor.execute("""
+        CREATE TABLE tax_summit_master_data (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            Client_Name VARCHAR(255),
+            Practice_Head VARCHAR(255),
+            Partner VARCHAR(255),
+            Sector VARCHAR(255),
+            Location VARCHAR(255),
+            Response TEXT,
+            numInvitees VARCHAR(20),
+            numRegistrations VARCHAR(20),
+            Circle_Back_Dt DATE,
+            Email VARCHAR(255)
+        ) COLLATE utf8mb4_general_ci
+    """)
+    cursor.execute(create_summary_table_sql())
+    conn.commit()
+    cursor.close()
+    invalidate_catalog(conn)
+    yield conn
+    cursor = conn.cursor()
+    cursor.execute("DROP TABLE IF EXISTS tax_summit_master_data")
+    cursor.execute(f"DROP TABLE IF EXISTS {SUMMARY_TABLE}")
+    conn.commit()
+    cursor.close()
+    conn.close()
+
+
+def summary_rows(conn):
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT Group_Key, {', '.join(SUMMARY_MEASURES)} FROM {SUMMARY_TABLE} ORDER BY Group_Key")
+    rows = [tuple(int(v) if i else v for i, v in enumerate(row)) for row in cursor.fetchall()]
+    cursor.close()
+    return rows
+
+
+def test_triggers_match_rebuild_on_mysql(mysql_conn):
+    from database.setup.create_summary_tables import create_summary_triggers
+
+    assert create_summary_triggers(mysql_conn)
+    cursor = mysql_conn.cursor()
+    cursor.executemany("""
+        INSERT INTO tax_summit_master_data
+            (Client_Name, Practice_Head, Partner, Sector, Location, Response,
+             numInvitees, numRegistrations, Circle_Back_Dt)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, [
+        ('Acme', 'head a', 'P1', 'IT', 'Mumbai', 'Yes', '2', '1', '2024-01-05'),
+        ('Beta', 'head a', 'P1', 'IT', 'Mumbai', 'Yes', ' 2.7', 'x', None),
+        (None, 'Head B', 'P2', None, None, None, None, '', None),
+        ('Delta', 'Head B', 'P2', 'Pharma', 'Delhi', 'No', '-1', '3.0', None),
+    ])
+    # Case-only change moves the row to another group; Email isn't summarized
+    cursor.execute("UPDATE tax_summit_master_data SET Practice_Head = 'Head A' WHERE Client_Name = 'Beta'")
+    cursor.execute("UPDATE tax_summit_master_data SET Email = 'x@y.z' WHERE Client_Name = 'Acme'")
+    cursor.execute("UPDATE tax_summit_master_data SET numInvitees = '5', Response = NULL WHERE Client_Name = 'Delta'")
+    cursor.execute("DELETE FROM tax_summit_master_data WHERE Client_Name IS NULL")
+    mysql_conn.commit()
+    cursor.close()
+
+    from_triggers = summary_rows(mysql_conn)
+    rebuild_summary(mysql_conn)
+    assert from_triggers == summary_rows(mysql_conn)
+    drift = summary_drift(mysql_conn)['master']
+    assert drift['summary'] == drift['actual'] == (3, 9, 4)
@@ -0,0 +1,30 @@
+from database.railway.sync_to_railway_final import insert_rows
+
+
+class RecordingCursor:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, query, params=()):
+        self.statements.append((query, params))
+
+    def fetchone(self):
+        return (64 * 1024 * 1024,)
+
+
+def test_insert_rows_upserts_on_sync_keys():
+    cursor = RecordingCursor()
+    rows = [('Acme', 'A'), ('Beta', 'B')]
+    sent = insert_rows(cursor, 'tax_summit_master_data', ['Client_Name', 'Region'], rows,
+                       upsert_keys=['Client_Name'])
+
+    query, params = cursor.statements[-1]
+    assert sent == 2
+    assert query.endswith("ON DUPLICATE KEY UPDATE `Region` = VALUES(`Region`)")
+    assert params == ('Acme', 'A', 'Beta', 'B')
+
+
+def test_insert_rows_plain_insert_by_default():
+    cursor = RecordingCursor()
+    insert_rows(cursor, 'tax_summit_master_data', ['Client_Name'], [('Acme',)])
+    assert 'ON DUPLICATE KEY' not in cursor.statements[-1][0]
@@ -0,0 +1,65 @@
+import os
+import sys
+
+import pytest
+from mysql.connector import Error
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'vcard_generators'))
+import vcard_exporter
+
+
+class FakeUpdateConnection:
+    def __init__(self, fail_commit=False):
+        self.fail_commit = fail_commit
+        self.committed = self.rolled_back = False
+
+    def commit(self):
+        if self.fail_commit:
+            raise Error(msg="lost connection")
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+    def is_connected(self):
+        return True
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_tables(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    connections = {'tax': FakeUpdateConnection(), 'cfo': FakeUpdateConnection(fail_commit=True)}
+
+    def export_table(key, writer):
+        writer.write([f"BEGIN:VCARD\nFN:{key}\nEND:VCARD"])
+        return connections[key], 1
+
+    monkeypatch.setattr(vcard_exporter, 'export_table', export_table)
+    return tmp_path, connections
+
+
+def test_failed_commit_keeps_files_of_committed_tables(fake_tables):
+    tmp_path, connections = fake_tables
+    assert vcard_exporter.export_contacts(['tax', 'cfo'], concurrent=False) is None
+
+    files = sorted(os.listdir(tmp_path))
+    # Tax contacts are marked 'Created', so their vCard must survive
+    assert connections['tax'].committed
+    assert len(files) == 1 and files[0].startswith('Tax_Contacts_')
+    assert connections['cfo'].rolled_back
+
+
+def test_failed_commit_keeps_combined_file(fake_tables):
+    tmp_path, _ = fake_tables
+    assert vcard_exporter.export_contacts(['tax', 'cfo'], combined=True, concurrent=False) is None
+    assert [f for f in os.listdir(tmp_path) if f.startswith('All_Contacts_')]
+
+
+def test_failed_first_commit_discards_everything(fake_tables):
+    tmp_path, connections = fake_tables
+    connections['tax'].fail_commit = True
+    assert vcard_exporter.export_contacts(['tax', 'cfo'], concurrent=False) is None
+    assert os.listdir(tmp_path) == []
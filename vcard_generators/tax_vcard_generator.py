@@ -6,6 +6,9 @@ from datetime import datetime
 
 load_dotenv()
 
+# S_No values per UPDATE ... WHERE S_No IN (...) statement
+STATUS_UPDATE_CHUNK = 500
+
 def connect_to_mysql(host, user, password, database):
     """Establish connection to MySQL database"""
     try:
@@ -118,22 +121,24 @@ def get_pending_contacts(connection):
     finally:
         cursor.close()
 
-def update_contact_status(connection, s_no):
-    """Update contact status to 1 and set creation timestamp"""
-    cursor = connection.cursor()
-    
-    update_query = """
-    UPDATE Tax_Persons_details
-    SET Contact_Created_Status = 1,
-        Contact_File_Created_Time_Stamp = CURRENT_TIMESTAMP
-    WHERE S_No = %s
+def update_contact_status(connection, s_nos):
     """
+    Mark contacts as created (status 1 + timestamp) in chunks of
+    STATUS_UPDATE_CHUNK. Does NOT commit - the caller commits once the
+    vCard file is safely in place, or rolls back.
+    """
+    cursor = connection.cursor()
     
     try:
-        cursor.execute(update_query, (s_no,))
-        connection.commit()
-    except Error as e:
-        print(f"✗ Error updating status for S_No {s_no}: {e}")
+        for start in range(0, len(s_nos), STATUS_UPDATE_CHUNK):
+            chunk = s_nos[start:start + STATUS_UPDATE_CHUNK]
+            placeholders = ', '.join(['%s'] * len(chunk))
+            cursor.execute(f"""
+            UPDATE Tax_Persons_details
+            SET Contact_Created_Status = 1,
+                Contact_File_Created_Time_Stamp = CURRENT_TIMESTAMP
+            WHERE S_No IN ({placeholders})
+            """, tuple(chunk))
     finally:
         cursor.close()
 
@@ -186,18 +191,32 @@ def generate_vcards_from_tax_persons():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = f"Tax_Contacts_{timestamp}.vcf"
         
-        # Write all vCards to single file
-        print(f"\n[Step 3] Writing vCards to file: {output_file}")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n\n'.join(all_vcards))
-        
-        print(f"✓ Successfully created {output_file}")
+        # File and status change are committed together: the vCards go to a
+        # temp file, the status UPDATEs run in one transaction, and only after
+        # the file is renamed into place is the transaction committed.
+        temp_file = output_file + '.tmp'
         
-        # Update database status
-        print(f"\n[Step 4] Updating contact status in database...")
-        for s_no in processed_contacts:
-            update_contact_status(connection, s_no)
+        try:
+            print(f"\n[Step 3] Writing vCards to file: {output_file}")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write('\n\n'.join(all_vcards))
+                f.flush()
+                os.fsync(f.fileno())
+            
+            print(f"\n[Step 4] Updating contact status in database...")
+            update_contact_status(connection, processed_contacts)
+            
+            os.replace(temp_file, output_file)
+            connection.commit()
+        except (Error, OSError) as e:
+            connection.rollback()
+            for path in (temp_file, output_file):
+                if os.path.exists(path):
+                    os.remove(path)
+            print(f"✗ Export failed, no contacts were marked as 'Created': {e}")
+            return
         
+        print(f"✓ Successfully created {output_file}")
         print(f"✓ Updated {len(processed_contacts)} contacts as 'Created'")
         
         # Summary
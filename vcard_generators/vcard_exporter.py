@@ -0,0 +1,353 @@
+import mysql.connector
+from mysql.connector import Error
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+from datetime import datetime
+
+from tax_vcard_generator import create_vcard
+
+load_dotenv()
+
+# Rows pulled from the server per fetchmany() on the streaming cursor
+FETCH_SIZE = 500
+
+# S_No values per UPDATE ... WHERE S_No IN (...) statement
+STATUS_UPDATE_CHUNK = 500
+
+# One entry per contact table - everything else is shared
+CONTACT_TABLES = {
+    'tax': {
+        'label': 'Tax',
+        'table': 'Tax_Persons_details',
+        'company': 'Client_Name',
+        'name': 'Tax_Contact',
+        'designation': 'Designation',
+        'email': 'Email_ID',
+        'phone': 'Phone_Number',
+        'response': 'Response_1',
+    },
+    'cfo': {
+        'label': 'CFO',
+        'table': 'CFO_Persons_details',
+        'company': 'Company_Name',
+        'name': 'CFO_Name',
+        'designation': 'Designation_2',
+        'email': 'Email_ID_3',
+        'phone': 'Phone_Number_4',
+        'response': 'Response_7',
+    },
+    'other': {
+        'label': 'Other',
+        'table': 'Other_Persons_Details',
+        'company': 'Company_Name',
+        'name': 'Others',
+        'designation': 'Designation_8',
+        'email': 'Email_ID_9',
+        'phone': 'Phone_Number_10',
+        'response': 'Response_13',
+    },
+}
+
+def connect_to_mysql():
+    """Establish connection to MySQL database"""
+    try:
+        connection = mysql.connector.connect(
+            host=os.getenv("DB_HOST"),
+            user=os.getenv("DB_USER"),
+            password=os.getenv("DB_PASS"),
+            database=os.getenv("DB_NAME"),
+            port=int(os.getenv("DB_PORT", 3306))
+        )
+        if connection.is_connected():
+            return connection
+    except Error as e:
+        print(f"✗ Error connecting to MySQL: {e}")
+        return None
+
+class VcfWriter:
+    """
+    Thread-safe incremental .vcf writer.
+
+    Writes to '<name>.tmp' files and rotates to a new part every
+    `split_size` contacts (None = single file). finalize() renames the
+    temp files into place; discard() removes them.
+    """
+
+    def __init__(self, base_name, split_size=None):
+        self.base_name = base_name
+        self.split_size = split_size
+        self.lock = threading.Lock()
+        self.files = []
+        self.handle = None
+        self.in_part = 0
+        self.total = 0
+
+    def _part_path(self):
+        if self.split_size:
+            return f"{self.base_name}_part{len(self.files) + 1:03d}.vcf"
+        return f"{self.base_name}.vcf"
+
+    def _rotate(self):
+        self._close_handle()
+        path = self._part_path()
+        self.files.append(path)
+        self.handle = open(path + '.tmp', 'w', encoding='utf-8')
+        self.in_part = 0
+
+    def _close_handle(self):
+        if self.handle:
+            self.handle.flush()
+            os.fsync(self.handle.fileno())
+            self.handle.close()
+            self.handle = None
+
+    def write(self, vcards):
+        """Append a batch of vCard strings, starting a new part when full"""
+        with self.lock:
+            for vcard in vcards:
+                if self.handle is None or (self.split_size and self.in_part >= self.split_size):
+                    self._rotate()
+                if self.in_part:
+                    self.handle.write('\n\n')
+                self.handle.write(vcard)
+                self.in_part += 1
+                self.total += 1
+
+    def finalize(self):
+        """Close and move every temp file to its final name"""
+        with self.lock:
+            self._close_handle()
+            for path in self.files:
+                os.replace(path + '.tmp', path)
+            return list(self.files)
+
+    def discard(self):
+        """Close and delete everything written so far"""
+        with self.lock:
+            if self.handle:
+                self.handle.close()
+                self.handle = None
+            for path in self.files:
+                for candidate in (path + '.tmp', path):
+                    if os.path.exists(candidate):
+                        os.remove(candidate)
+
+def pending_contacts_query(config):
+    """SELECT for contacts not yet exported (numRegistrations = 1, response >= 0)"""
+    c = config
+    return f"""
+    SELECT S_No, {c['company']}, {c['name']}, {c['designation']}, {c['email']}, {c['phone']}
+    FROM {c['table']}
+    WHERE Contact_Created_Status = 0
+    AND {c['phone']} IS NOT NULL
+    AND {c['phone']} != ''
+    AND numRegistrations = 1
+    AND {c['response']} IS NOT NULL
+    AND {c['response']} >= 0
+    ORDER BY {c['company']}, {c['name']}
+    """
+
+def mark_created(cursor, table, s_nos):
+    """Chunked status update - committed by the caller"""
+    for start in range(0, len(s_nos), STATUS_UPDATE_CHUNK):
+        chunk = s_nos[start:start + STATUS_UPDATE_CHUNK]
+        placeholders = ', '.join(['%s'] * len(chunk))
+        cursor.execute(f"""
+            UPDATE {table}
+            SET Contact_Created_Status = 1,
+                Contact_File_Created_Time_Stamp = CURRENT_TIMESTAMP
+            WHERE S_No IN ({placeholders})
+        """, tuple(chunk))
+
+def export_table(key, writer):
+    """
+    Stream one contact table into `writer`.
+
+    Rows are read with an unbuffered cursor on one connection while the
+    status UPDATEs run on a second one, so only FETCH_SIZE rows are ever
+    held in memory. The update transaction is returned uncommitted.
+
+    Returns:
+        tuple: (update_connection, contacts_exported)
+    """
+    config = CONTACT_TABLES[key]
+    label = config['label']
+
+    read_conn = connect_to_mysql()
+    update_conn = connect_to_mysql()
+    if not read_conn or not update_conn:
+        for conn in (read_conn, update_conn):
+            if conn:
+                conn.close()
+        raise Error(msg=f"[{label}] could not connect to MySQL")
+
+    # Default mysql-connector cursors are unbuffered: rows stay on the
+    # server until fetchmany() pulls them
+    read_cursor = read_conn.cursor()
+    update_cursor = update_conn.cursor()
+    exported = 0
+    failed = False
+
+    try:
+        read_cursor.execute(pending_contacts_query(config))
+
+        while True:
+            rows = read_cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+
+            writer.write([
+                create_vcard(name, designation, company, phone, email)
+                for _, company, name, designation, email, phone in rows
+            ])
+            mark_created(update_cursor, config['table'], [row[0] for row in rows])
+            exported += len(rows)
+
+        print(f"  ✓ [{label}] streamed {exported} contacts")
+        return update_conn, exported
+
+    except Exception:
+        failed = True
+        raise
+
+    finally:
+        for cursor in (read_cursor, update_cursor):
+            try:
+                cursor.close()
+            except Error:
+                pass  # unread rows on the streaming cursor after a failure
+        read_conn.close()
+        if failed:
+            update_conn.rollback()
+            update_conn.close()
+
+def export_contacts(keys, combined=False, split_size=None, concurrent=True):
+    """
+    Export the requested tables. Status updates commit only after every
+    file is in place, and a file is only deleted on failure when none of
+    the contacts in it were marked 'Created'.
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    if combined:
+        shared = VcfWriter(f"All_Contacts_{timestamp}", split_size)
+        writers = {key: shared for key in keys}
+    else:
+        writers = {
+            key: VcfWriter(f"{CONTACT_TABLES[key]['label']}_Contacts_{timestamp}", split_size)
+            for key in keys
+        }
+
+    results = {}
+    errors = []
+
+    if concurrent and len(keys) > 1:
+        with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+            futures = {key: executor.submit(export_table, key, writers[key]) for key in keys}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    errors.append((key, e))
+    else:
+        for key in keys:
+            try:
+                results[key] = export_table(key, writers[key])
+            except Exception as e:
+                errors.append((key, e))
+                break
+
+    unique_writers = list({id(w): w for w in writers.values()}.values())
+    files = []
+    committed = []
+
+    if not errors:
+        try:
+            for writer in unique_writers:
+                files.extend(writer.finalize())
+            # One transaction per table; `committed` records how far it got
+            for key, (update_conn, _) in results.items():
+                update_conn.commit()
+                committed.append(key)
+        except (Error, OSError) as e:
+            errors.append(('commit', e))
+
+    if errors:
+        for key, (update_conn, _) in results.items():
+            if key not in committed and update_conn.is_connected():
+                update_conn.rollback()
+        # Files holding contacts that are already marked 'Created' must stay
+        for writer in unique_writers:
+            if not any(writers[key] is writer for key in committed):
+                writer.discard()
+
+    for update_conn, _ in results.values():
+        if update_conn.is_connected():
+            update_conn.close()
+
+    if errors:
+        for key, e in errors:
+            print(f"✗ [{key}] {e}")
+        if not committed:
+            print("✗ Export failed, no contacts were marked as 'Created'")
+            return None
+        kept = [f for f in files if os.path.exists(f)]
+        labels = ', '.join(CONTACT_TABLES[key]['label'] for key in committed)
+        print(f"⚠️  Export partly failed: only {labels} contacts were marked as 'Created'")
+        print(f"   Their files were kept: {', '.join(kept)}")
+        return None
+
+    return {
+        'files': [f for f in files if os.path.exists(f)],
+        'counts': {key: count for key, (_, count) in results.items()},
+    }
+
+def parse_args(argv):
+    """[tax] [cfo] [other] [--combined] [--split N] [--sequential]"""
+    keys = [a for a in argv if a in CONTACT_TABLES] or list(CONTACT_TABLES)
+    split_size = None
+    if '--split' in argv:
+        split_size = int(argv[argv.index('--split') + 1])
+    return keys, '--combined' in argv, split_size, '--sequential' not in argv
+
+def main():
+    print("\n" + "="*70)
+    print("  📇 UNIFIED VCARD EXPORTER (STREAMING)")
+    print("="*70)
+    print("\n  Usage: python vcard_exporter.py [tax] [cfo] [other]")
+    print("                                  [--combined] [--split N] [--sequential]")
+    print("="*70 + "\n")
+
+    keys, combined, split_size, concurrent = parse_args(sys.argv[1:])
+
+    print(f"Tables:  {', '.join(CONTACT_TABLES[k]['label'] for k in keys)}")
+    print(f"Output:  {'one combined file' if combined else 'one file per table'}"
+          f"{f', split every {split_size} contacts' if split_size else ''}")
+    print(f"Mode:    {'concurrent' if concurrent else 'sequential'}\n")
+
+    result = export_contacts(keys, combined=combined, split_size=split_size, concurrent=concurrent)
+    if result is None:
+        return
+
+    total = sum(result['counts'].values())
+
+    print("\n" + "="*70)
+    if total == 0:
+        print("  ✓ No pending contacts matching criteria to export!")
+        print("="*70 + "\n")
+        return
+
+    print("  ✓ VCARD EXPORT COMPLETE!")
+    print("="*70)
+    for key, count in result['counts'].items():
+        print(f"  {CONTACT_TABLES[key]['label']:6} {count} contacts")
+    print(f"\nFiles created ({len(result['files'])}):")
+    for path in result['files']:
+        print(f"  • {path}")
+    print(f"\nAll {total} contacts are now marked as 'Created' in database\n")
+
+if __name__ == "__main__":
+    main()